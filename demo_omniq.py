@@ -3,11 +3,12 @@
 OmniQ Demo - Showcasing all implemented features
 """
 
-import sys
-sys.path.insert(0, '/Users/gouthamarcot/Documents/Quantum/codebases/OmniQ/libomniq-core/build/lib')
+import numpy as np
 
 import _omniq_core as omniq
 
+rng = np.random.default_rng()
+
 print("=" * 60)
 print("OmniQ Feature Demonstration")
 print("=" * 60)
@@ -17,120 +18,75 @@ print("\n1. Creating a Bell State (|00⟩ + |11⟩)/√2")
 print("-" * 60)
 
 circuit = omniq.Circuit(2)
-circuit.addGate(omniq.GateType.H, [], [0], [])  # Hadamard on qubit 0
-circuit.addGate(omniq.GateType.CNOT, [0], [1], [])  # CNOT(0, 1)
-
-state = circuit.execute()
-print(f"State vector amplitudes:")
-sv = state.getStateVector()
-for i in range(4):
-    amp = sv[i]
-    print(f"  |{i:02b}⟩: {amp.real:.4f} + {amp.imag:.4f}i")
+circuit.add_gate(omniq.GateType.H, 0)  # Hadamard on qubit 0
+circuit.add_gate(omniq.GateType.CNOT, 0, 1)  # CNOT(0, 1)
+circuit.execute_all()
+
+print("State vector amplitudes:")
+# Zero-copy view over the C++ buffer; one vectorized pass instead of
+# one binding call per amplitude
+sv = np.asarray(circuit.get_state_vector())
+width = int(np.log2(sv.size))
+for i, (re, im) in enumerate(np.column_stack([sv.real, sv.imag])):
+    print(f"  |{i:0{width}b}⟩: {re:.4f} + {im:.4f}i")
+
+# Born-rule sampling: one inverse-CDF lookup for all shots
+n_shots = 1000
+cum = np.cumsum(np.abs(sv) ** 2)
+shots = np.searchsorted(cum, rng.random(n_shots) * cum[-1], side="right")
+counts = np.bincount(shots, minlength=sv.size)
+print(f"Measurement counts ({n_shots} shots):")
+for i in np.flatnonzero(counts):
+    print(f"  |{i:0{width}b}⟩: {counts[i]}")
 
 # 2. Clifford Simulator (1000+ qubits capable!)
 print("\n\n2. Clifford Simulator - GHZ State with 10 qubits")
 print("-" * 60)
 
-from _omniq_core import CliffordSimulator
-
 clifford_sim = omniq.CliffordSimulator(10)
-print(f"Initialized {clifford_sim.getNumQubits()} qubit Clifford simulator")
+print(f"Initialized {clifford_sim.get_num_qubits()} qubit Clifford simulator")
 
 # Create GHZ state: H on qubit 0, then CNOT chain
-clifford_sim.applyH(0)
+clifford_sim.apply_h(0)
 for i in range(9):
-    clifford_sim.applyCNOT(i, i+1)
+    clifford_sim.apply_cnot(i, i + 1)
 
 print("Applied: H(0) + CNOT(0,1) + CNOT(1,2) + ... + CNOT(8,9)")
 print("Created 10-qubit GHZ state!")
 
-# Measure first qubit
-result = clifford_sim.measure(0)
-print(f"Measured qubit 0: {result}")
+# Measuring qubit 0 collapses the whole GHZ state
+outcomes = [clifford_sim.measure(q) for q in range(10)]
+print(f"Measured qubit 0: {outcomes[0]}, remaining qubits: {outcomes[1:]}")
 
 # 3. Quantum Entanglement Metrics
 print("\n\n3. Entanglement Analysis - Concurrence & Von Neumann Entropy")
 print("-" * 60)
 
-# Create maximally entangled state
-bell_circuit = omniq.Circuit(2)
-bell_circuit.addGate(omniq.GateType.H, [], [0], [])
-bell_circuit.addGate(omniq.GateType.CNOT, [0], [1], [])
-bell_state = bell_circuit.execute()
+# Density matrix of the Bell state prepared in section 1
+rho = omniq.DensityMatrix(omniq.Statevector(sv))
+dm = np.asarray(rho)
 
-concurrence = omniq.calculateConcurrence(bell_state)
+concurrence = omniq.calculate_concurrence(dm)
 print(f"Concurrence: {concurrence:.4f} (1.0 = maximally entangled)")
 
-# Density matrix for entropy
-rho = omniq.DensityMatrix(bell_state)
-entropy = omniq.calculateVonNeumannEntropy(rho)
-print(f"Von Neumann Entropy: {entropy:.4f}")
-
-# 4. Quantum Error Correction
-print("\n\n4. QEC - Surface Code & Decoders")
-print("-" * 60)
-
-from _omniq_core import SurfaceCode, Syndrome, MWPMDecoder, UnionFindDecoder
-
-# Create distance-3 surface code
-surface_code = omniq.SurfaceCode(3)
-print(f"Surface Code:")
-print(f"  Distance: {surface_code.getDistance()}")
-print(f"  Data qubits: {surface_code.getNumDataQubits()}")
-print(f"  Ancilla qubits: {surface_code.getNumAncillaQubits()}")
-print(f"  Total: {surface_code.getTotalQubits()}")
-
-# Prepare logical zero state
-logical_zero = surface_code.prepareLogicalZero()
-print(f"Prepared logical |0⟩ state with {logical_zero.getNumQubits()} qubits")
-
-# Create decoders
-mwpm_decoder = omniq.MWPMDecoder()
-uf_decoder = omniq.UnionFindDecoder()
-print(f"Decoders available: {mwpm_decoder.getName()}, {uf_decoder.getName()}")
+# The global state is pure; the entanglement shows up in the reduced state
+entropy = omniq.calculate_von_neumann_entropy(dm)
+reduced_entropy = omniq.calculate_von_neumann_entropy(rho.partial_trace([1]))
+print(f"Von Neumann Entropy: {entropy:.4f} (global), {reduced_entropy:.4f} (qubit 0)")
 
-# 5. Noise Simulation
-print("\n\n5. Noise Models - Realistic Decoherence")
+# 4. Spectral Analysis
+print("\n\n4. Spectral Analysis - Eigenvalues & Purity")
 print("-" * 60)
 
-from _omniq_core import DepolarizingChannel, AmplitudeDampingChannel, PhaseDampingChannel
-
-# Depolarizing channel
-depol = omniq.DepolarizingChannel(0.01)  # 1% error probability
-print(f"Depolarizing: {depol.getDescription()}")
-
-# T1 relaxation (amplitude damping)
-T1_channel = omniq.AmplitudeDampingChannel.fromT1(50e-6, 50e-9)  # T1=50μs, gate=50ns
-print(f"Amplitude Damping: γ={T1_channel.getGamma():.6f}")
-
-# T2 dephasing
-T2_channel = omniq.PhaseDampingChannel.fromT2(70e-6, 50e-9)  # T2=70μs, gate=50ns  
-print(f"Phase Damping: λ={T2_channel.getLambda():.6f}")
-
-# NoiseModel
-noise_model = omniq.NoiseModel.createTypicalModel()
-print(f"\n{noise_model.toString()}")
-
-# 6. Advanced Math - Spectral Analysis
-print("\n\n6. Spectral Analysis - Eigenvalues & Negativity")
-print("-" * 60)
-
-from _omniq_core import SpectralAnalysis
-
-# Create density matrix from Bell state
-bell_rho = omniq.DensityMatrix(bell_state)
-dm = bell_rho.getDensityMatrix()
-
-# Eigendecomposition
-eig_decomp = omniq.SpectralAnalysis.computeEigendecomposition(dm)
-print(f"Eigenvalues of Bell state density matrix:")
-for i in range(len(eig_decomp.eigenvalues)):
-    print(f"  λ_{i} = {eig_decomp.eigenvalues[i]:.4f}")
+print("Eigenvalues of Bell state density matrix:")
+for i, lam in enumerate(np.linalg.eigvalsh(dm)[::-1]):
+    print(f"  λ_{i} = {lam:.4f}")
+print(f"Purity: {rho.purity():.4f} (pure state: {rho.is_pure()})")
 
-# Negativity (entanglement measure)
-negativity = omniq.SpectralAnalysis.calculateNegativity(dm, 2, 2)
-print(f"Negativity: {negativity:.4f} (>0 indicates entanglement)")
+# The surface code, decoders and noise channels live in the C++ library but
+# are not bound into _omniq_core yet
+print("\n\nQEC decoders and noise models: C++ API only (see tests/test_core.cpp)")
 
 print("\n" + "=" * 60)
-print("Demo Complete! All features working ✅")
+print("Demo Complete!")
 print("=" * 60)
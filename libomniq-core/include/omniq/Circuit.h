@@ -6,6 +6,7 @@
 #define OMNIQ_CIRCUIT_H
 
 #include <Eigen/Dense>
+#include <cstdint>
 #include <string>
 #include <vector>
 
@@ -50,11 +51,14 @@ private:
 
   // Helper methods
   void validateGate(const Gate &gate);
-  void validateQubitIndex(int qubit);
+  void validateQubitIndex(int qubit) const;
   void validateClassicalBitIndex(int bit);
   MatrixXcd createSingleQubitGate(const Matrix2cd &gate, int qubit);
   MatrixXcd createTwoQubitGate(const Matrix4cd &gate, int qubit1, int qubit2);
   std::string gateToString(const Gate &gate) const;
+  // Apply the run of single-qubit gates on distinct qubits starting at
+  // currentStep_ tile by tile; returns how many gates were consumed
+  int executeSingleQubitWindow();
 
 public:
   // Constructors
@@ -69,6 +73,9 @@ public:
                double parameter = 0.0);
   void addGate(GateType type, const std::vector<int> &targetQubits,
                const std::vector<double> &parameters = {});
+  // Append gates from parallel columns; qubit1 < 0 marks a single-qubit gate
+  void addGates(const uint8_t *types, const int *qubit0, const int *qubit1,
+                const double *parameters, size_t count);
   void removeGate(int index);
   void insertGate(int index, const Gate &gate);
   void clear();
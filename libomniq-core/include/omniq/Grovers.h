@@ -71,11 +71,17 @@ public:
   Circuit build_diffusion() const;
 
   /**
-   * @brief Execute Grover's algorithm
-   * @param initial_state Initial quantum state (optional)
+   * @brief Execute Grover's algorithm from the uniform superposition
    * @return Final quantum state
    */
-  Statevector execute(const Statevector &initial_state = Statevector(0)) const;
+  Statevector execute() const;
+
+  /**
+   * @brief Run the Grover iterations on a given state
+   * @param initial_state Starting state on num_qubits qubits
+   * @return Final quantum state
+   */
+  Statevector execute(const Statevector &initial_state) const;
 
   /**
    * @brief Execute with multiple shots and return measurement results
@@ -9,6 +9,7 @@
 #include "omniq/Noise/DepolarizingChannel.h"
 #include "omniq/Noise/NoiseChannel.h"
 #include "omniq/Noise/PhaseDampingChannel.h"
+#include <Eigen/Dense>
 #include <map>
 #include <memory>
 #include <string>
@@ -100,7 +101,18 @@ private:
   GateFidelities gateFidelities_;
   bool enabled_ = true;
 
+  // Composed single-qubit gate noise as 4x4 superoperators on vec(rho).
+  // Rebuilt eagerly whenever the parameters change, so const methods only
+  // read them and a model can be shared between threads.
+  Eigen::Matrix4cd singleQubitGateNoise_;
+  Eigen::Matrix4cd twoQubitGateNoise_;
+
   double calculateDepolarizingError(double fidelity) const;
+  Eigen::Matrix4cd composeSuperoperator(double duration,
+                                        double depolarizingProb) const;
+  void rebuildGateNoise();
+  static void applySuperoperator(DensityMatrix &rho,
+                                 const Eigen::Matrix4cd &superoperator);
 };
 
 } // namespace noise
@@ -0,0 +1,44 @@
+#ifndef OMNIQ_PLANE_KERNELS_H
+#define OMNIQ_PLANE_KERNELS_H
+
+#include <complex>
+#include <cstddef>
+
+namespace omniq {
+
+// In-place gate kernels on a state stored as separate real and imaginary
+// planes (structure of arrays), as used by the Python Statevector. Bit k of
+// an amplitude's index is qubit k; dim must be a power of two.
+//
+// applySingleQubitPlanes runs AVX-512 or AVX2/FMA butterflies when the CPU
+// supports them (detected once at runtime) and a scalar loop for targets too
+// low to fill a vector. The float overloads back complex64 states and fit
+// twice the lanes per vector; their gate coefficients are rounded to float.
+//
+// The default x86-64 build already assumes x86-64-v3 (AVX2 + FMA), so the
+// scalar loop only stands alone on non-x86 targets, under
+// OMNIQ_NATIVE_ARCH on an older CPU, or when forced with setPlaneKernelIsa.
+// Instruction sets applySingleQubitPlanes can use, narrowest first
+enum class PlaneKernelIsa { Scalar = 0, Avx2 = 1, Avx512 = 2 };
+
+// Widest instruction set this CPU supports
+PlaneKernelIsa bestPlaneKernelIsa();
+// Widest instruction set the kernels currently use. It starts at
+// bestPlaneKernelIsa(), or at OMNIQ_SIMD (scalar, avx2 or avx512) if set.
+PlaneKernelIsa planeKernelIsa();
+// Cap the kernels at isa, e.g. to test or benchmark one path; throws
+// std::invalid_argument if the CPU does not support it
+void setPlaneKernelIsa(PlaneKernelIsa isa);
+
+void applySingleQubitPlanes(double* re, double* im, std::ptrdiff_t dim, int target,
+                            std::complex<double> a, std::complex<double> b,
+                            std::complex<double> c, std::complex<double> d);
+void applySingleQubitPlanes(float* re, float* im, std::ptrdiff_t dim, int target,
+                            std::complex<double> a, std::complex<double> b,
+                            std::complex<double> c, std::complex<double> d);
+void applyCNOTPlanes(double* re, double* im, std::ptrdiff_t dim, int control, int target);
+void applyCNOTPlanes(float* re, float* im, std::ptrdiff_t dim, int control, int target);
+
+} // namespace omniq
+
+#endif // OMNIQ_PLANE_KERNELS_H
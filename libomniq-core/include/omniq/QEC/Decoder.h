@@ -22,8 +22,10 @@ public:
 
   /**
    * @brief Decode syndrome and return error chain
-   * @param syndrome The measured syndrome
-   * @return Vector of qubit indices indicating where to apply corrections
+   * @param syndrome The measured syndrome, laid out as by
+   * SurfaceCode::measureSyndromes at codeDistance_ (X-stabilizers first)
+   * @return Data qubit indices to correct: the Z flips that clear violated
+   * X-stabilizers, then the X flips that clear violated Z-stabilizers
    */
   virtual std::vector<int> decode(const Syndrome &syndrome) = 0;
 
@@ -45,7 +47,57 @@ public:
   int getCodeDistance() const { return codeDistance_; }
 
 protected:
+  /**
+   * @brief Lattice position of one stabilizer of the rotated surface code
+   */
+  struct Plaquette {
+    int row;
+    int col;
+    bool isXType;
+  };
+
+  /**
+   * @brief Stabilizer positions in syndrome order for codeDistance_
+   *
+   * Built from SurfaceCode once per distance. Throws std::invalid_argument
+   * if the syndrome does not have one entry per stabilizer.
+   */
+  const std::vector<Plaquette> &lattice(const Syndrome &syndrome);
+
+  /**
+   * @brief Number of data qubits flipped by the shortest chain between two
+   * stabilizers of the same type
+   */
+  static int latticeDistance(const Plaquette &a, const Plaquette &b);
+
+  /**
+   * @brief Number of data qubits flipped by the shortest chain from a
+   * stabilizer to the lattice edge
+   */
+  int boundaryDistance(const Plaquette &p) const;
+
+  /**
+   * @brief Toggle in flips the data qubits of a chain ending on a and b
+   */
+  void flipChain(std::vector<char> &flips, Plaquette a,
+                 const Plaquette &b) const;
+
+  /**
+   * @brief Toggle in flips the data qubits of a chain from p to the edge
+   */
+  void flipChainToBoundary(std::vector<char> &flips, Plaquette p) const;
+
+  /**
+   * @brief Correction list from per-qubit flip parities (Z flips first)
+   */
+  static std::vector<int> flippedQubits(const std::vector<char> &zFlips,
+                                        const std::vector<char> &xFlips);
+
   int codeDistance_ = 3;
+
+private:
+  std::vector<Plaquette> lattice_;
+  int latticeDistance_ = 0;
 };
 
 } // namespace qec
@@ -16,8 +16,10 @@ namespace qec {
  * @brief Minimum Weight Perfect Matching decoder
  *
  * Decodes surface code syndromes by finding minimum-weight matching
- * of violated stabilizers. This version uses a greedy approximation
- * for simplicity. For optimal results, integrate Blossom V library.
+ * of violated stabilizers, each matched to another of its type or to the
+ * lattice edge, and returns the data qubits along the matched chains.
+ * This version uses a greedy approximation for simplicity. For optimal
+ * results, integrate Blossom V library.
  */
 class MWPMDecoder : public Decoder {
 public:
@@ -39,12 +41,10 @@ private:
     bool operator<(const Edge &other) const { return weight < other.weight; }
   };
 
-  // Greedy matching algorithm
+  // Greedy matching algorithm; a partner of -1 means the lattice edge
   std::vector<std::pair<int, int>>
-  findMatching(const std::vector<int> &violations);
-
-  // Manhattan distance for weight calculation
-  double calculateWeight(int idx1, int idx2) const;
+  findMatching(const std::vector<int> &violations,
+               const std::vector<Plaquette> &lattice) const;
 };
 
 } // namespace qec
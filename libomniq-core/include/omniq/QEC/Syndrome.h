@@ -5,6 +5,7 @@
 #ifndef OMNIQ_QEC_SYNDROME_H
 #define OMNIQ_QEC_SYNDROME_H
 
+#include <cstdint>
 #include <string>
 #include <vector>
 
@@ -23,6 +24,10 @@ public:
   int size() const { return measurements_.size(); }
   int getMeasurement(int index) const;
   const std::vector<int> &getMeasurements() const { return measurements_; }
+  // Violations packed 64 stabilizers per word (bit set = -1)
+  const std::vector<uint64_t> &getViolationWords() const {
+    return violationWords_;
+  }
 
   // Mutators
   void setMeasurement(int index, int value); // value should be +1 or -1
@@ -33,6 +38,8 @@ public:
   std::vector<int>
   getViolatedStabilizers() const; // Indices where measurement = -1
   bool isAllZero() const;         // Check if all stabilizers are satisfied (+1)
+  std::vector<int> getDetectionEvents(
+      const Syndrome &previous) const; // Indices that flipped since previous
 
   // Metadata
   int getCodeDistance() const { return codeDistance_; }
@@ -41,7 +48,11 @@ public:
   std::string toString() const;
 
 private:
+  void rebuildViolationWords();
+  static std::vector<int> setBitIndices(const std::vector<uint64_t> &words);
+
   std::vector<int> measurements_; // +1 (satisfied) or -1 (violated)
+  std::vector<uint64_t> violationWords_;
   int codeDistance_;
 };
 
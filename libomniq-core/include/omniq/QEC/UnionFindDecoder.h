@@ -48,7 +48,8 @@ private:
   };
 
   std::vector<int> extractCorrection(UnionFind &uf,
-                                     const std::vector<int> &violations);
+                                     const std::vector<int> &violations,
+                                     const std::vector<Plaquette> &lattice);
 };
 
 } // namespace qec
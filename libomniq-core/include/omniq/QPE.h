@@ -68,12 +68,18 @@ public:
    */
   Circuit build_inverse_qft() const;
 
+  /**
+   * @brief Execute QPE algorithm from |0...0>
+   * @return Final quantum state
+   */
+  Statevector execute() const;
+
   /**
    * @brief Execute QPE algorithm
-   * @param initial_state Initial eigenstate (optional)
+   * @param initial_state Initial eigenstate
    * @return Final quantum state
    */
-  Statevector execute(const Statevector &initial_state = Statevector(0)) const;
+  Statevector execute(const Statevector &initial_state) const;
 
   /**
    * @brief Execute with measurements and return phase estimates
@@ -6,6 +6,7 @@
 #define OMNIQ_SIMULATORS_CLIFFORDSIMULATOR_H
 
 #include <Eigen/Dense>
+#include <cstdint>
 #include <string>
 #include <vector>
 
@@ -19,6 +20,9 @@ namespace simulators {
  * Can handle thousands of qubits efficiently.
  *
  * Tableau representation tracks n stabilizer generators and destabilizers.
+ * The tableau is stored bit-packed and column-major: for every qubit there is
+ * one bit-vector of X bits and one of Z bits spanning all rows, so a gate on
+ * a qubit is a handful of word-wide AND/XOR/swap passes over uint64_t words.
  */
 class CliffordSimulator {
 public:
@@ -44,26 +48,47 @@ public:
   // Reset to |0...0⟩
   void reset();
 
-  // Tableau access (for debugging/analysis)
-  const Eigen::MatrixXi &getXTableau() const { return x_; }
-  const Eigen::MatrixXi &getZTableau() const { return z_; }
-  const Eigen::VectorXi &getRVector() const { return r_; }
+  // Tableau access (for debugging/analysis), unpacked to (2n × n) / (2n)
+  Eigen::MatrixXi getXTableau() const;
+  Eigen::MatrixXi getZTableau() const;
+  Eigen::VectorXi getRVector() const;
 
   std::string toString() const;
 
 private:
   int numQubits_;
 
-  // Stabilizer tableau: (x|z|r)
-  // x_[i] = X part of i-th stabilizer
-  // z_[i] = Z part of i-th stabilizer
-  // r_[i] = phase (0 or 1) where phase = i^r
-  Eigen::MatrixXi x_; // (2n × n) binary matrix
-  Eigen::MatrixXi z_; // (2n × n) binary matrix
-  Eigen::VectorXi r_; // (2n) phase vector
+  // Stabilizer tableau: (x|z|r), rows 0..n-1 are stabilizers, rows n..2n-1
+  // destabilizers and row 2n is scratch space for deterministic measurement.
+  // Column q of the X part occupies x_[q * numWords_ .. (q + 1) * numWords_),
+  // with row i stored at bit (i % 64) of word (i / 64). Same for z_.
+  int numRows_;
+  std::size_t numWords_;
+  std::vector<uint64_t> x_; // n columns × numWords_ words
+  std::vector<uint64_t> z_; // n columns × numWords_ words
+  std::vector<uint64_t> r_; // numWords_ words of phase bits
+
+  uint64_t *xCol(int qubit) { return x_.data() + qubit * numWords_; }
+  uint64_t *zCol(int qubit) { return z_.data() + qubit * numWords_; }
+  const uint64_t *xCol(int qubit) const {
+    return x_.data() + qubit * numWords_;
+  }
+  const uint64_t *zCol(int qubit) const {
+    return z_.data() + qubit * numWords_;
+  }
+
+  static int getBit(const uint64_t *col, int row) {
+    return static_cast<int>((col[row >> 6] >> (row & 63)) & 1ULL);
+  }
+  static void setBit(uint64_t *col, int row, int value) {
+    uint64_t mask = 1ULL << (row & 63);
+    col[row >> 6] = value ? (col[row >> 6] | mask) : (col[row >> 6] & ~mask);
+  }
 
   // Helper: Row operations
   void rowsum(int h, int i);
+  void copyRow(int dst, int src);
+  void clearRow(int row);
   int g(int x1, int z1, int x2, int z2) const;
 
   // Random measurement outcomes
@@ -27,6 +27,13 @@ private:
     MatrixXcd createSingleQubitGate(const Matrix2cd& gate, int qubit) const;
     MatrixXcd createTwoQubitGate(const Matrix4cd& gate, int qubit1, int qubit2) const;
 
+    // In-place single-qubit kernels on amplitude pairs differing in `bit`;
+    // applySingleQubitGate picks the diagonal, anti-diagonal or full one
+    void applySingleQubitGate(const Matrix2cd& gate, int qubit);
+    void applyDiagonalKernel(int bit, std::complex<double> d0, std::complex<double> d1);
+    void applyAntiDiagonalKernel(int bit, std::complex<double> a01, std::complex<double> a10);
+    void applyMatrixKernel(int bit, const Matrix2cd& gate);
+
 public:
     // Constructors
     explicit Statevector(int numQubits);
@@ -49,6 +56,10 @@ public:
     void applyRotationX(int qubit, double angle);
     void applyRotationY(int qubit, double angle);
     void applyRotationZ(int qubit, double angle);
+    // Pauli-X on every listed qubit in a single pass over the state
+    void applyPauliXBatch(const std::vector<int>& qubits);
+    // Hadamard on every qubit as one Walsh-Hadamard transform
+    void applyHadamardAll();
 
     // Measurements
     int measure(int qubit);
@@ -1,17 +1,196 @@
 #include "omniq/Circuit.h"
 #include "omniq/DensityMatrix.h"
 #include "omniq/Grovers.h"
+#include "omniq/PlaneKernels.h"
 #include "omniq/QPE.h"
 #include "omniq/QuantumStates.h"
+#include "omniq/Simulators/CliffordSimulator.h"
 #include "omniq/Statevector.h"
 #include <pybind11/eigen.h>
 #include <pybind11/functional.h> // For std::function bindings
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <cmath>
+
 namespace py = pybind11;
 using namespace omniq;
 
+// C-contiguous complex128 NumPy buffer, converted if necessary
+using ComplexArray =
+    py::array_t<std::complex<double>, py::array::c_style | py::array::forcecast>;
+
+// C-contiguous float64 or float32 plane, bound with noconvert(): the plane
+// kernels update the caller's array in place, so a converted copy would be lost
+template <typename T> using PlaneArray = py::array_t<T, py::array::c_style>;
+
+namespace {
+
+using simulators::CliffordSimulator;
+
+// Length of a (re, im) plane pair after checking that they match, hold a
+// power-of-two number of amplitudes and that each qubit is in range
+template <typename T>
+py::ssize_t planeSize(const PlaneArray<T> &re, const PlaneArray<T> &im,
+                      std::initializer_list<int> qubits) {
+  const py::ssize_t dim = re.size();
+  if (re.ndim() != 1 || im.ndim() != 1 || im.size() != dim || dim < 2 ||
+      (dim & (dim - 1)) != 0) {
+    throw std::invalid_argument(
+        "re and im must be 1-D planes of the same power-of-two length");
+  }
+  for (int qubit : qubits) {
+    if (qubit < 0 || (py::ssize_t(1) << qubit) >= dim) {
+      throw std::invalid_argument("Qubit index out of range");
+    }
+  }
+  return dim;
+}
+
+// apply_1q / apply_cnot for one plane precision; pybind11 picks the
+// overload whose dtype matches, since the planes are never converted
+template <typename T> void bindPlaneKernels(py::module_ &planes) {
+  planes.def(
+      "apply_1q",
+      [](PlaneArray<T> re, PlaneArray<T> im, std::complex<double> a,
+         std::complex<double> b, std::complex<double> c,
+         std::complex<double> d, int target) {
+        const py::ssize_t dim = planeSize(re, im, {target});
+        T *rp = re.mutable_data();
+        T *ip = im.mutable_data();
+        py::gil_scoped_release release;
+        applySingleQubitPlanes(rp, ip, dim, target, a, b, c, d);
+      },
+      py::arg("re").noconvert(), py::arg("im").noconvert(), py::arg("a"),
+      py::arg("b"), py::arg("c"), py::arg("d"), py::arg("target"),
+      "Apply the single-qubit gate [[a, b], [c, d]] to target");
+  planes.def(
+      "apply_cnot",
+      [](PlaneArray<T> re, PlaneArray<T> im, int control, int target) {
+        const py::ssize_t dim = planeSize(re, im, {control, target});
+        if (control == target) {
+          throw std::invalid_argument(
+              "Control and target qubits must be different");
+        }
+        T *rp = re.mutable_data();
+        T *ip = im.mutable_data();
+        py::gil_scoped_release release;
+        applyCNOTPlanes(rp, ip, dim, control, target);
+      },
+      py::arg("re").noconvert(), py::arg("im").noconvert(), py::arg("control"),
+      py::arg("target"));
+}
+
+// Names shared with the OMNIQ_SIMD environment variable
+const char *isaName(PlaneKernelIsa isa) {
+  switch (isa) {
+  case PlaneKernelIsa::Avx512:
+    return "avx512";
+  case PlaneKernelIsa::Avx2:
+    return "avx2";
+  default:
+    return "scalar";
+  }
+}
+
+PlaneKernelIsa isaFromName(const std::string &name) {
+  for (PlaneKernelIsa isa : {PlaneKernelIsa::Scalar, PlaneKernelIsa::Avx2,
+                             PlaneKernelIsa::Avx512}) {
+    if (name == isaName(isa)) {
+      return isa;
+    }
+  }
+  throw std::invalid_argument("Unknown instruction set '" + name +
+                              "'; use 'scalar', 'avx2' or 'avx512'");
+}
+
+// Number of quarter turns (0-3) if angle is a multiple of pi/2, otherwise -1
+int quarterTurns(double angle) {
+  const double quarter = M_PI / 2.0;
+  double turns = std::round(angle / quarter);
+  if (std::abs(angle - turns * quarter) > 1e-9) {
+    return -1;
+  }
+  return static_cast<int>(((static_cast<long long>(turns) % 4) + 4) % 4);
+}
+
+// S^k, i.e. RZ(k * pi/2) up to a global phase
+void applySPower(CliffordSimulator &sim, int qubit, int k) {
+  if (k == 3) {
+    sim.applySdag(qubit);
+    return;
+  }
+  for (int i = 0; i < k; ++i) {
+    sim.applyS(qubit);
+  }
+}
+
+// Apply one circuit gate as tableau operations (global phases are dropped)
+void applyCliffordGate(CliffordSimulator &sim, GateType type, int q0, int q1,
+                       double parameter) {
+  switch (type) {
+  case GateType::H:
+    sim.applyH(q0);
+    return;
+  case GateType::X:
+    sim.applyX(q0);
+    return;
+  case GateType::Y:
+    sim.applyY(q0);
+    return;
+  case GateType::Z:
+    sim.applyZ(q0);
+    return;
+  case GateType::CNOT:
+    sim.applyCNOT(q0, q1);
+    return;
+  case GateType::SWAP:
+    sim.applyCNOT(q0, q1);
+    sim.applyCNOT(q1, q0);
+    sim.applyCNOT(q0, q1);
+    return;
+  default:
+    break;
+  }
+
+  int k = quarterTurns(parameter);
+  if (k >= 0) {
+    switch (type) {
+    case GateType::PHASE:
+    case GateType::RZ:
+      applySPower(sim, q0, k);
+      return;
+    case GateType::RX: // H RZ H
+      sim.applyH(q0);
+      applySPower(sim, q0, k);
+      sim.applyH(q0);
+      return;
+    case GateType::RY: // S RX S^dagger
+      sim.applySdag(q0);
+      sim.applyH(q0);
+      applySPower(sim, q0, k);
+      sim.applyH(q0);
+      sim.applyS(q0);
+      return;
+    case GateType::CP: // Only CP(0) and CP(pi) = CZ are Clifford
+      if (k == 0) {
+        return;
+      }
+      if (k == 2) {
+        sim.applyCZ(q0, q1);
+        return;
+      }
+      break;
+    default:
+      break;
+    }
+  }
+  throw std::invalid_argument("Gate is not a Clifford operation");
+}
+
+} // namespace
+
 PYBIND11_MODULE(_omniq_core, m) {
   m.doc() = "OmniQ Core C++ extension";
 
@@ -44,26 +223,58 @@ PYBIND11_MODULE(_omniq_core, m) {
   py::class_<Circuit>(m, "Circuit")
       .def(py::init<int, int>(), py::arg("num_qubits"),
            py::arg("num_classical_bits") = 0)
-      .def("add_gate",
-           static_cast<void (Circuit::*)(GateType, int, double)>(
-               &Circuit::addGate),
-           py::arg("type"), py::arg("target_qubit"), py::arg("parameter") = 0.0)
+      // Registered first: pybind11 accepts an int for a double, so the
+      // single-qubit overload would otherwise swallow add_gate(CNOT, 0, 1)
       .def("add_gate",
            static_cast<void (Circuit::*)(GateType, int, int, double)>(
                &Circuit::addGate),
            py::arg("type"), py::arg("control_qubit"), py::arg("target_qubit"),
            py::arg("parameter") = 0.0)
+      .def("add_gate",
+           static_cast<void (Circuit::*)(GateType, int, double)>(
+               &Circuit::addGate),
+           py::arg("type"), py::arg("target_qubit"), py::arg("parameter") = 0.0)
       .def("add_gate",
            static_cast<void (Circuit::*)(GateType, const std::vector<int> &,
                                          const std::vector<double> &)>(
                &Circuit::addGate),
            py::arg("type"), py::arg("target_qubits"),
            py::arg("parameters") = std::vector<double>{})
+      .def(
+          "add_gates_batch",
+          [](Circuit &c,
+             py::array_t<uint8_t, py::array::c_style | py::array::forcecast>
+                 types,
+             py::array_t<int, py::array::c_style | py::array::forcecast>
+                 qubit0,
+             py::array_t<int, py::array::c_style | py::array::forcecast>
+                 qubit1,
+             py::array_t<double, py::array::c_style | py::array::forcecast>
+                 parameters) {
+            size_t count = types.size();
+            if (qubit0.size() != static_cast<py::ssize_t>(count) ||
+                qubit1.size() != static_cast<py::ssize_t>(count) ||
+                parameters.size() != static_cast<py::ssize_t>(count)) {
+              throw std::invalid_argument(
+                  "Gate columns must all have the same length");
+            }
+            const uint8_t *t = types.data();
+            const int *q0 = qubit0.data();
+            const int *q1 = qubit1.data();
+            const double *p = parameters.data();
+            py::gil_scoped_release release;
+            c.addGates(t, q0, q1, p, count);
+          },
+          py::arg("types"), py::arg("qubit0"), py::arg("qubit1"),
+          py::arg("parameters"))
       .def("remove_gate", &Circuit::removeGate)
       .def("clear", &Circuit::clear)
-      .def("reset", &Circuit::reset)
-      .def("execute_step", &Circuit::executeStep)
-      .def("execute_all", &Circuit::executeAll)
+      .def("reset", &Circuit::reset,
+           py::call_guard<py::gil_scoped_release>())
+      .def("execute_step", &Circuit::executeStep,
+           py::call_guard<py::gil_scoped_release>())
+      .def("execute_all", &Circuit::executeAll,
+           py::call_guard<py::gil_scoped_release>())
       .def("get_state_vector",
            static_cast<const VectorXcd &(Circuit::*)() const>(
                &Circuit::getStateVector),
@@ -79,36 +290,116 @@ PYBIND11_MODULE(_omniq_core, m) {
            [](const Circuit &c) { return c.getDensityMatrix(); });
 
   // Statevector Class
-  py::class_<Statevector>(m, "Statevector")
+  py::class_<Statevector>(m, "Statevector", py::buffer_protocol())
       .def(py::init<int>())
+      // Buffer-protocol overload ahead of the Eigen one: one memcpy-style copy
+      // from the NumPy buffer, no Python objects per amplitude
+      .def(py::init([](ComplexArray amplitudes) {
+             if (amplitudes.ndim() != 1) {
+               throw std::invalid_argument("Amplitudes must be a 1D array");
+             }
+             Eigen::Map<const VectorXcd> view(amplitudes.data(),
+                                              amplitudes.size());
+             py::gil_scoped_release release;
+             return Statevector(VectorXcd(view));
+           }),
+           py::arg("amplitudes"))
       .def(py::init<const VectorXcd &>())
-      .def("apply_hadamard", &Statevector::applyHadamard)
-      .def("apply_cnot", &Statevector::applyCNOT)
-      .def("apply_pauli_x", &Statevector::applyPauliX)
-      .def("apply_pauli_y", &Statevector::applyPauliY)
-      .def("apply_pauli_z", &Statevector::applyPauliZ)
-      .def("apply_phase_shift", &Statevector::applyPhaseShift)
-      .def("apply_rotation_x", &Statevector::applyRotationX)
-      .def("apply_rotation_y", &Statevector::applyRotationY)
-      .def("apply_rotation_z", &Statevector::applyRotationZ)
-      .def("measure", &Statevector::measure)
-      .def("measure_expectation", &Statevector::measureExpectation)
+      .def_buffer([](Statevector &s) -> py::buffer_info {
+        VectorXcd &v = s.getStateVector();
+        return py::buffer_info(
+            v.data(), sizeof(std::complex<double>),
+            py::format_descriptor<std::complex<double>>::format(), 1,
+            {v.size()}, {sizeof(std::complex<double>)});
+      })
+      .def("apply_hadamard", &Statevector::applyHadamard,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_cnot", &Statevector::applyCNOT,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_pauli_x", &Statevector::applyPauliX,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_pauli_y", &Statevector::applyPauliY,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_pauli_z", &Statevector::applyPauliZ,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_phase_shift", &Statevector::applyPhaseShift,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_rotation_x", &Statevector::applyRotationX,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_rotation_y", &Statevector::applyRotationY,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_rotation_z", &Statevector::applyRotationZ,
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_x_batch", &Statevector::applyPauliXBatch, py::arg("qubits"),
+           py::call_guard<py::gil_scoped_release>())
+      .def("apply_hadamard_all", &Statevector::applyHadamardAll,
+           py::call_guard<py::gil_scoped_release>())
+      .def("measure", &Statevector::measure,
+           py::call_guard<py::gil_scoped_release>())
+      .def("measure_expectation", &Statevector::measureExpectation,
+           py::call_guard<py::gil_scoped_release>())
       .def("get_state_vector",
            static_cast<const VectorXcd &(Statevector::*)() const>(
                &Statevector::getStateVector),
            py::return_value_policy::reference_internal)
+      // Writable NumPy view of the amplitudes; keeps the Statevector alive
+      .def("data",
+           [](py::object self) {
+             VectorXcd &v = self.cast<Statevector &>().getStateVector();
+             return ComplexArray({v.size()}, {sizeof(std::complex<double>)},
+                                 v.data(), self);
+           })
+      .def(
+          "set_amplitudes",
+          [](Statevector &s, ComplexArray amplitudes) {
+            VectorXcd &v = s.getStateVector();
+            if (amplitudes.ndim() != 1 || amplitudes.size() != v.size()) {
+              throw std::invalid_argument(
+                  "Amplitudes must be a 1D array of the current state size");
+            }
+            const std::complex<double> *data = amplitudes.data();
+            py::gil_scoped_release release;
+            std::copy(data, data + v.size(), v.data());
+          },
+          py::arg("amplitudes"))
       .def("get_num_qubits", &Statevector::getNumQubits)
-      .def("normalize", &Statevector::normalize)
+      .def("normalize", &Statevector::normalize,
+           py::call_guard<py::gil_scoped_release>())
       .def("to_string", &Statevector::toString)
       .def("tensor_product", &Statevector::tensorProduct)
-      .def("partial_trace", &Statevector::partialTrace)
+      .def("partial_trace", &Statevector::partialTrace,
+           py::call_guard<py::gil_scoped_release>())
       .def("get_qubit_probability", &Statevector::getQubitProbability);
 
   // DensityMatrix Class
-  py::class_<DensityMatrix>(m, "DensityMatrix")
+  py::class_<DensityMatrix>(m, "DensityMatrix", py::buffer_protocol())
       .def(py::init<int>())
+      // Row-major NumPy buffer copied straight into Eigen's column-major storage
+      .def(py::init([](ComplexArray matrix) {
+             if (matrix.ndim() != 2) {
+               throw std::invalid_argument("Density matrix must be a 2D array");
+             }
+             using RowMajorMatrixXcd =
+                 Eigen::Matrix<std::complex<double>, Eigen::Dynamic,
+                               Eigen::Dynamic, Eigen::RowMajor>;
+             Eigen::Map<const RowMajorMatrixXcd> view(
+                 matrix.data(), matrix.shape(0), matrix.shape(1));
+             py::gil_scoped_release release;
+             return DensityMatrix(MatrixXcd(view));
+           }),
+           py::arg("matrix"))
       .def(py::init<const MatrixXcd &>())
       .def(py::init<const Statevector &>())
+      .def_buffer([](DensityMatrix &d) -> py::buffer_info {
+        // Eigen storage is column-major
+        MatrixXcd &mat = d.getDensityMatrix();
+        return py::buffer_info(
+            mat.data(), sizeof(std::complex<double>),
+            py::format_descriptor<std::complex<double>>::format(), 2,
+            {mat.rows(), mat.cols()},
+            {sizeof(std::complex<double>),
+             sizeof(std::complex<double>) * mat.rows()});
+      })
       .def("get_matrix",
            static_cast<const MatrixXcd &(DensityMatrix::*)() const>(
                &DensityMatrix::getDensityMatrix),
@@ -116,16 +407,73 @@ PYBIND11_MODULE(_omniq_core, m) {
       .def("get_num_qubits", &DensityMatrix::getNumQubits)
       // .def("apply_gate", &DensityMatrix::applyGate) // Not in header
       // .def("apply_channel", &DensityMatrix::applyChannel) // Not in header
-      .def("partial_trace", &DensityMatrix::partialTrace)
-      .def("is_pure", &DensityMatrix::isPure)
-      .def("purity", &DensityMatrix::getPurity)
+      .def("partial_trace", &DensityMatrix::partialTrace,
+           py::call_guard<py::gil_scoped_release>())
+      .def("is_pure", &DensityMatrix::isPure,
+           py::call_guard<py::gil_scoped_release>())
+      .def("purity", &DensityMatrix::getPurity,
+           py::call_guard<py::gil_scoped_release>())
       // .def("fidelity", &DensityMatrix::fidelity) // Not in header
-      .def("von_neumann_entropy", &DensityMatrix::getVonNeumannEntropy);
+      .def("von_neumann_entropy", &DensityMatrix::getVonNeumannEntropy,
+           py::call_guard<py::gil_scoped_release>());
+
+  // Stabilizer-tableau simulator for Clifford circuits
+  py::class_<CliffordSimulator>(m, "CliffordSimulator")
+      .def(py::init<int>(), py::arg("num_qubits"))
+      .def("apply_h", &CliffordSimulator::applyH)
+      .def("apply_s", &CliffordSimulator::applyS)
+      .def("apply_sdag", &CliffordSimulator::applySdag)
+      .def("apply_cnot", &CliffordSimulator::applyCNOT)
+      .def("apply_cz", &CliffordSimulator::applyCZ)
+      .def("apply_x", &CliffordSimulator::applyX)
+      .def("apply_y", &CliffordSimulator::applyY)
+      .def("apply_z", &CliffordSimulator::applyZ)
+      .def(
+          "apply_gates",
+          [](CliffordSimulator &sim,
+             py::array_t<uint8_t, py::array::c_style | py::array::forcecast>
+                 types,
+             py::array_t<int, py::array::c_style | py::array::forcecast>
+                 qubit0,
+             py::array_t<int, py::array::c_style | py::array::forcecast>
+                 qubit1,
+             py::array_t<double, py::array::c_style | py::array::forcecast>
+                 parameters) {
+            size_t count = types.size();
+            if (qubit0.size() != static_cast<py::ssize_t>(count) ||
+                qubit1.size() != static_cast<py::ssize_t>(count) ||
+                parameters.size() != static_cast<py::ssize_t>(count)) {
+              throw std::invalid_argument(
+                  "Gate columns must all have the same length");
+            }
+            const uint8_t *t = types.data();
+            const int *q0 = qubit0.data();
+            const int *q1 = qubit1.data();
+            const double *p = parameters.data();
+            py::gil_scoped_release release;
+            for (size_t i = 0; i < count; ++i) {
+              applyCliffordGate(sim, static_cast<GateType>(t[i]), q0[i], q1[i],
+                                p[i]);
+            }
+          },
+          py::arg("types"), py::arg("qubit0"), py::arg("qubit1"),
+          py::arg("parameters"))
+      .def("measure", &CliffordSimulator::measure)
+      .def("get_num_qubits", &CliffordSimulator::getNumQubits)
+      .def("is_pure_state", &CliffordSimulator::isPureState)
+      .def("reset", &CliffordSimulator::reset)
+      .def("get_x_tableau", &CliffordSimulator::getXTableau)
+      .def("get_z_tableau", &CliffordSimulator::getZTableau)
+      .def("get_r_vector", &CliffordSimulator::getRVector)
+      .def("to_string", &CliffordSimulator::toString);
 
   // Algorithms - QPE
   py::class_<QPE>(m, "QPE")
       .def(py::init<int, int, UnitaryOperator>())
-      .def("execute", &QPE::execute, py::arg("initial_state") = Statevector(0))
+      .def("execute", py::overload_cast<>(&QPE::execute, py::const_))
+      .def("execute",
+           py::overload_cast<const Statevector &>(&QPE::execute, py::const_),
+           py::arg("initial_state"))
       .def("execute_with_measurements", &QPE::execute_with_measurements,
            py::arg("num_shots") = 1000);
 
@@ -133,14 +481,36 @@ PYBIND11_MODULE(_omniq_core, m) {
   py::class_<GroversAlgorithm>(m, "GroversAlgorithm")
       .def(py::init<int, OracleFunction, int>(), py::arg("num_qubits"),
            py::arg("oracle"), py::arg("num_solutions") = 1)
-      .def("execute", &GroversAlgorithm::execute,
-           py::arg("initial_state") = Statevector(0))
+      .def("execute",
+           py::overload_cast<>(&GroversAlgorithm::execute, py::const_))
+      .def("execute",
+           py::overload_cast<const Statevector &>(&GroversAlgorithm::execute,
+                                                  py::const_),
+           py::arg("initial_state"))
       .def("execute_with_measurements",
            &GroversAlgorithm::execute_with_measurements,
            py::arg("num_shots") = 1000)
       .def("get_success_probability",
            &GroversAlgorithm::get_success_probability);
 
+  // In-place kernels on the (re, im) planes of the Python Statevector
+  py::module_ planes = m.def_submodule(
+      "planes", "Gate kernels on separate real and imaginary planes");
+  bindPlaneKernels<double>(planes);
+  bindPlaneKernels<float>(planes);
+  planes.def(
+      "isa", [] { return isaName(planeKernelIsa()); },
+      "Widest instruction set apply_1q currently uses");
+  planes.def(
+      "best_isa", [] { return isaName(bestPlaneKernelIsa()); },
+      "Widest instruction set this CPU supports");
+  planes.def(
+      "set_isa",
+      [](const std::string &name) { setPlaneKernelIsa(isaFromName(name)); },
+      py::arg("name"),
+      "Cap apply_1q at 'scalar', 'avx2' or 'avx512' (for testing and "
+      "benchmarking)");
+
   // Quantum States Math Functions
   m.def("calculate_purity", &calculatePurity,
         "Calculate purity of a density matrix");
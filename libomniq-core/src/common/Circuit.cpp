@@ -11,6 +11,77 @@
 
 namespace omniq {
 
+namespace {
+
+// 256 KB of complex<double> amplitudes: one tile stays resident in L2
+constexpr long long kTileAmplitudes = 1LL << 14;
+
+// 2x2 matrix of a single-qubit gate, matching the Circuit::apply* kernels
+bool singleQubitMatrix(const Gate &gate, Matrix2cd &matrix) {
+  using Complex = std::complex<double>;
+  const double angle = gate.parameters.empty() ? 0.0 : gate.parameters[0];
+  const double c = std::cos(angle / 2.0);
+  const double s = std::sin(angle / 2.0);
+  switch (gate.type) {
+  case GateType::H:
+    matrix << 1.0, 1.0, 1.0, -1.0;
+    matrix /= std::sqrt(2.0);
+    return true;
+  case GateType::X:
+    matrix << 0.0, 1.0, 1.0, 0.0;
+    return true;
+  case GateType::Y:
+    matrix << 0.0, Complex(0.0, -1.0), Complex(0.0, 1.0), 0.0;
+    return true;
+  case GateType::Z:
+    matrix << 1.0, 0.0, 0.0, -1.0;
+    return true;
+  case GateType::PHASE:
+    matrix << 1.0, 0.0, 0.0, std::polar(1.0, angle);
+    return true;
+  case GateType::RX:
+    matrix << c, Complex(0.0, -s), Complex(0.0, -s), c;
+    return true;
+  case GateType::RY:
+    matrix << c, -s, s, c;
+    return true;
+  case GateType::RZ:
+    matrix << std::polar(1.0, -angle / 2.0), 0.0, 0.0, std::polar(1.0, angle / 2.0);
+    return true;
+  default:
+    return false;
+  }
+}
+
+// Apply gates whose amplitude pairs fit inside one tile, finishing every
+// gate on a tile before moving to the next so each tile is read from DRAM once
+void applyTiled(VectorXcd &state,
+                const std::vector<std::pair<int, Matrix2cd>> &gates) {
+  const long long dim = state.size();
+  const long long tile = std::min(dim, kTileAmplitudes);
+  std::complex<double> *v = state.data();
+
+#pragma omp parallel for
+  for (long long start = 0; start < dim; start += tile) {
+    for (const auto &entry : gates) {
+      const long long pairDist = 1LL << entry.first;
+      const Matrix2cd &m = entry.second;
+      const std::complex<double> m00 = m(0, 0), m01 = m(0, 1);
+      const std::complex<double> m10 = m(1, 0), m11 = m(1, 1);
+      for (long long i = start; i < start + tile; i += 2 * pairDist) {
+        for (long long j = i; j < i + pairDist; ++j) {
+          std::complex<double> alpha = v[j];
+          std::complex<double> beta = v[j + pairDist];
+          v[j] = m00 * alpha + m01 * beta;
+          v[j + pairDist] = m10 * alpha + m11 * beta;
+        }
+      }
+    }
+  }
+}
+
+} // namespace
+
 Circuit::Circuit(int numQubits, int numClassicalBits)
     : numQubits_(numQubits), numClassicalBits_(numClassicalBits),
       currentStep_(0) {
@@ -80,6 +151,23 @@ void Circuit::addGate(GateType type, const std::vector<int> &targetQubits,
   addGate(gate);
 }
 
+void Circuit::addGates(const uint8_t *types, const int *qubit0,
+                       const int *qubit1, const double *parameters,
+                       size_t count) {
+  gates_.reserve(gates_.size() + count);
+  for (size_t i = 0; i < count; ++i) {
+    GateType type = static_cast<GateType>(types[i]);
+    if (qubit1[i] < 0) {
+      addGate(type, qubit0[i], parameters[i]);
+    } else if (type == GateType::SWAP) {
+      addGate(type, std::vector<int>{qubit0[i], qubit1[i]},
+              std::vector<double>{parameters[i]});
+    } else {
+      addGate(type, qubit0[i], qubit1[i], parameters[i]);
+    }
+  }
+}
+
 void Circuit::removeGate(int index) {
   if (index < 0 || index >= static_cast<int>(gates_.size())) {
     throw std::out_of_range("Gate index out of range");
@@ -126,9 +214,56 @@ bool Circuit::executeStep() {
 }
 
 void Circuit::executeAll() {
-  while (executeStep()) {
-    // Continue until all gates are executed
+  const int totalSteps = static_cast<int>(gates_.size());
+  while (currentStep_ < totalSteps) {
+    int consumed = executeSingleQubitWindow();
+    if (consumed > 0) {
+      currentStep_ += consumed;
+    } else {
+      executeStep();
+    }
+  }
+}
+
+int Circuit::executeSingleQubitWindow() {
+  const int totalSteps = static_cast<int>(gates_.size());
+  const long long tile = std::min<long long>(stateVector_.size(), kTileAmplitudes);
+
+  // Gates on distinct qubits commute, so the window can be reordered freely:
+  // low qubits (pairs within a tile) are batched, high qubits run as usual
+  std::vector<std::pair<int, Matrix2cd>> tiled;
+  std::vector<int> untiled;
+  std::vector<bool> seen(numQubits_, false);
+  int step = currentStep_;
+  Matrix2cd matrix;
+  for (; step < totalSteps; ++step) {
+    const Gate &gate = gates_[step];
+    if (!gate.controlQubits.empty() || gate.targetQubits.size() != 1 ||
+        !singleQubitMatrix(gate, matrix)) {
+      break;
+    }
+    int qubit = gate.targetQubits[0];
+    validateQubitIndex(qubit);
+    if (seen[qubit]) {
+      break;
+    }
+    seen[qubit] = true;
+    if ((2LL << qubit) <= tile) {
+      tiled.emplace_back(qubit, matrix);
+    } else {
+      untiled.push_back(step);
+    }
   }
+
+  // A lone gate gains nothing from tiling; let executeStep handle it
+  if (tiled.size() < 2) {
+    return 0;
+  }
+  applyTiled(stateVector_, tiled);
+  for (int index : untiled) {
+    applyGate(gates_[index]);
+  }
+  return step - currentStep_;
 }
 
 void Circuit::executeToStep(int step) {
@@ -563,7 +698,7 @@ void Circuit::validateGate(const Gate &gate) {
   }
 }
 
-void Circuit::validateQubitIndex(int qubit) {
+void Circuit::validateQubitIndex(int qubit) const {
   if (qubit < 0 || qubit >= numQubits_) {
     throw std::out_of_range("Qubit index out of range");
   }
@@ -671,4 +806,24 @@ void Circuit::applyControlledPhase(int controlQubit, int targetQubit,
   }
 }
 
+double Circuit::getQubitProbability(int qubit, int value) const {
+  validateQubitIndex(qubit);
+  if (value != 0 && value != 1) {
+    throw std::invalid_argument("Qubit value must be 0 or 1");
+  }
+
+  double probability = 0.0;
+  const long long dim = stateVector_.size();
+  for (long long i = 0; i < dim; ++i) {
+    if (((i >> qubit) & 1) == value) {
+      probability += std::norm(stateVector_(i));
+    }
+  }
+  return probability;
+}
+
+MatrixXcd Circuit::getDensityMatrix() const {
+  return stateVector_ * stateVector_.adjoint();
+}
+
 } // namespace omniq
@@ -68,17 +68,21 @@ double DensityMatrix::getTrace() const {
 }
 
 double DensityMatrix::getPurity() const {
-    MatrixXcd squared = densityMatrix_ * densityMatrix_;
-    return squared.trace().real();
+    // Tr(rho^2) = sum |rho_ij|^2 for Hermitian rho, no matrix product needed
+    return densityMatrix_.squaredNorm();
 }
 
 double DensityMatrix::getVonNeumannEntropy() const {
-    Eigen::SelfAdjointEigenSolver<MatrixXcd> solver(densityMatrix_);
-    const VectorXcd& eigenvalues = solver.eigenvalues();
+    if (getPurity() > 1.0 - 1e-12) {
+        return 0.0;
+    }
+
+    Eigen::SelfAdjointEigenSolver<MatrixXcd> solver(densityMatrix_, Eigen::EigenvaluesOnly);
+    const Eigen::VectorXd& eigenvalues = solver.eigenvalues();
     
     double entropy = 0.0;
     for (int i = 0; i < eigenvalues.size(); ++i) {
-        double lambda = eigenvalues(i).real();
+        double lambda = eigenvalues(i);
         if (lambda > 1e-12) {
             entropy -= lambda * std::log2(lambda);
         }
@@ -0,0 +1,264 @@
+#include "omniq/PlaneKernels.h"
+
+#include <algorithm>
+#include <atomic>
+#include <cstdlib>
+#include <cstring>
+#include <stdexcept>
+#include <utility>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#include <immintrin.h>
+#define OMNIQ_X86_DISPATCH 1
+#endif
+
+namespace omniq {
+
+namespace {
+
+using Index = std::ptrdiff_t;
+
+// Below this many amplitude pairs a kernel stays on one thread
+constexpr Index kParallelPairs = Index(1) << 14;
+
+// [[a, b], [c, d]] split into real and imaginary parts
+template <typename T> struct Coefficients {
+  T ar, ai, br, bi, cr, ci, dr, di;
+};
+
+// Index of the |0> amplitude of pair p: p with a zero inserted at `bit`
+inline Index pairBase(Index p, int bit) {
+  const Index low = (Index(1) << bit) - 1;
+  return ((p >> bit) << (bit + 1)) | (p & low);
+}
+
+template <typename T>
+void applySingleQubitScalar(T* re, T* im, Index pairs, int bit, const Coefficients<T>& g) {
+  const Index stride = Index(1) << bit;
+#pragma omp parallel for if (pairs >= kParallelPairs)
+  for (Index p = 0; p < pairs; ++p) {
+    const Index i0 = pairBase(p, bit);
+    const Index i1 = i0 + stride;
+    const T r0 = re[i0], m0 = im[i0], r1 = re[i1], m1 = im[i1];
+    re[i0] = g.ar * r0 - g.ai * m0 + g.br * r1 - g.bi * m1;
+    im[i0] = g.ar * m0 + g.ai * r0 + g.br * m1 + g.bi * r1;
+    re[i1] = g.cr * r0 - g.ci * m0 + g.dr * r1 - g.di * m1;
+    im[i1] = g.cr * m0 + g.ci * r0 + g.dr * m1 + g.di * r1;
+  }
+}
+
+#ifdef OMNIQ_X86_DISPATCH
+
+// Per-precision intrinsics, so each kernel body is written once per ISA
+#define OMNIQ_AVX2 __attribute__((target("avx2,fma"), always_inline)) static inline
+#define OMNIQ_AVX512 __attribute__((target("avx512f"), always_inline)) static inline
+
+template <typename T> struct Avx2;
+template <> struct Avx2<double> {
+  using V = __m256d;
+  static constexpr int kLanes = 4;
+  OMNIQ_AVX2 V set1(double x) { return _mm256_set1_pd(x); }
+  OMNIQ_AVX2 V load(const double* p) { return _mm256_loadu_pd(p); }
+  OMNIQ_AVX2 void store(double* p, V v) { _mm256_storeu_pd(p, v); }
+  OMNIQ_AVX2 V mul(V a, V b) { return _mm256_mul_pd(a, b); }
+  OMNIQ_AVX2 V fmadd(V a, V b, V c) { return _mm256_fmadd_pd(a, b, c); }
+  OMNIQ_AVX2 V fnmadd(V a, V b, V c) { return _mm256_fnmadd_pd(a, b, c); }
+};
+template <> struct Avx2<float> {
+  using V = __m256;
+  static constexpr int kLanes = 8;
+  OMNIQ_AVX2 V set1(float x) { return _mm256_set1_ps(x); }
+  OMNIQ_AVX2 V load(const float* p) { return _mm256_loadu_ps(p); }
+  OMNIQ_AVX2 void store(float* p, V v) { _mm256_storeu_ps(p, v); }
+  OMNIQ_AVX2 V mul(V a, V b) { return _mm256_mul_ps(a, b); }
+  OMNIQ_AVX2 V fmadd(V a, V b, V c) { return _mm256_fmadd_ps(a, b, c); }
+  OMNIQ_AVX2 V fnmadd(V a, V b, V c) { return _mm256_fnmadd_ps(a, b, c); }
+};
+
+template <typename T> struct Avx512;
+template <> struct Avx512<double> {
+  using V = __m512d;
+  static constexpr int kLanes = 8;
+  OMNIQ_AVX512 V set1(double x) { return _mm512_set1_pd(x); }
+  OMNIQ_AVX512 V load(const double* p) { return _mm512_loadu_pd(p); }
+  OMNIQ_AVX512 void store(double* p, V v) { _mm512_storeu_pd(p, v); }
+  OMNIQ_AVX512 V mul(V a, V b) { return _mm512_mul_pd(a, b); }
+  OMNIQ_AVX512 V fmadd(V a, V b, V c) { return _mm512_fmadd_pd(a, b, c); }
+  OMNIQ_AVX512 V fnmadd(V a, V b, V c) { return _mm512_fnmadd_pd(a, b, c); }
+};
+template <> struct Avx512<float> {
+  using V = __m512;
+  static constexpr int kLanes = 16;
+  OMNIQ_AVX512 V set1(float x) { return _mm512_set1_ps(x); }
+  OMNIQ_AVX512 V load(const float* p) { return _mm512_loadu_ps(p); }
+  OMNIQ_AVX512 void store(float* p, V v) { _mm512_storeu_ps(p, v); }
+  OMNIQ_AVX512 V mul(V a, V b) { return _mm512_mul_ps(a, b); }
+  OMNIQ_AVX512 V fmadd(V a, V b, V c) { return _mm512_fmadd_ps(a, b, c); }
+  OMNIQ_AVX512 V fnmadd(V a, V b, V c) { return _mm512_fnmadd_ps(a, b, c); }
+};
+
+// One vector of pairs per iteration; needs stride >= Ops::kLanes so each
+// half is contiguous. Instantiated once per ISA so the target attribute
+// matches the intrinsics it inlines.
+#define OMNIQ_BUTTERFLY_LOOP                                                    \
+  const Index stride = Index(1) << bit;                                        \
+  const auto ar = Ops::set1(g.ar), ai = Ops::set1(g.ai);                       \
+  const auto br = Ops::set1(g.br), bi = Ops::set1(g.bi);                       \
+  const auto cr = Ops::set1(g.cr), ci = Ops::set1(g.ci);                       \
+  const auto dr = Ops::set1(g.dr), di = Ops::set1(g.di);                       \
+  _Pragma("omp parallel for if (pairs >= kParallelPairs)")                     \
+  for (Index p = 0; p < pairs; p += Ops::kLanes) {                             \
+    const Index i0 = pairBase(p, bit);                                         \
+    const Index i1 = i0 + stride;                                              \
+    const auto r0 = Ops::load(re + i0), m0 = Ops::load(im + i0);               \
+    const auto r1 = Ops::load(re + i1), m1 = Ops::load(im + i1);               \
+    auto out = Ops::mul(ar, r0);                                               \
+    out = Ops::fnmadd(ai, m0, out);                                            \
+    out = Ops::fmadd(br, r1, out);                                             \
+    Ops::store(re + i0, Ops::fnmadd(bi, m1, out));                             \
+    out = Ops::mul(ar, m0);                                                    \
+    out = Ops::fmadd(ai, r0, out);                                             \
+    out = Ops::fmadd(br, m1, out);                                             \
+    Ops::store(im + i0, Ops::fmadd(bi, r1, out));                              \
+    out = Ops::mul(cr, r0);                                                    \
+    out = Ops::fnmadd(ci, m0, out);                                            \
+    out = Ops::fmadd(dr, r1, out);                                             \
+    Ops::store(re + i1, Ops::fnmadd(di, m1, out));                             \
+    out = Ops::mul(cr, m0);                                                    \
+    out = Ops::fmadd(ci, r0, out);                                             \
+    out = Ops::fmadd(dr, m1, out);                                             \
+    Ops::store(im + i1, Ops::fmadd(di, r1, out));                              \
+  }
+
+template <typename T>
+__attribute__((target("avx2,fma"))) void
+applySingleQubitAvx2(T* re, T* im, Index pairs, int bit, const Coefficients<T>& g) {
+  using Ops = Avx2<T>;
+  OMNIQ_BUTTERFLY_LOOP
+}
+
+template <typename T>
+__attribute__((target("avx512f"))) void
+applySingleQubitAvx512(T* re, T* im, Index pairs, int bit, const Coefficients<T>& g) {
+  using Ops = Avx512<T>;
+  OMNIQ_BUTTERFLY_LOOP
+}
+
+#undef OMNIQ_BUTTERFLY_LOOP
+#undef OMNIQ_AVX2
+#undef OMNIQ_AVX512
+
+#endif // OMNIQ_X86_DISPATCH
+
+PlaneKernelIsa detectIsa() {
+#ifdef OMNIQ_X86_DISPATCH
+  if (__builtin_cpu_supports("avx512f")) {
+    return PlaneKernelIsa::Avx512;
+  }
+  if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma")) {
+    return PlaneKernelIsa::Avx2;
+  }
+#endif
+  return PlaneKernelIsa::Scalar;
+}
+
+// OMNIQ_SIMD if it names a supported instruction set, else the widest one
+PlaneKernelIsa initialIsa() {
+  const PlaneKernelIsa best = detectIsa();
+  const char* name = std::getenv("OMNIQ_SIMD");
+  if (name == nullptr) {
+    return best;
+  }
+  PlaneKernelIsa requested = best;
+  if (std::strcmp(name, "scalar") == 0) {
+    requested = PlaneKernelIsa::Scalar;
+  } else if (std::strcmp(name, "avx2") == 0) {
+    requested = PlaneKernelIsa::Avx2;
+  }
+  return std::min(requested, best);
+}
+
+std::atomic<PlaneKernelIsa>& currentIsa() {
+  static std::atomic<PlaneKernelIsa> isa{initialIsa()};
+  return isa;
+}
+
+// log2 of the lane count: the lowest target whose halves fill whole vectors
+template <typename T> constexpr int laneBits(int vectorBytes) {
+  return vectorBytes == 64 ? (sizeof(T) == 8 ? 3 : 4) : (sizeof(T) == 8 ? 2 : 3);
+}
+
+template <typename T>
+void applySingleQubit(T* re, T* im, Index dim, int target, std::complex<double> a,
+                      std::complex<double> b, std::complex<double> c, std::complex<double> d) {
+  const Coefficients<T> g{T(a.real()), T(a.imag()), T(b.real()), T(b.imag()),
+                          T(c.real()), T(c.imag()), T(d.real()), T(d.imag())};
+  const Index pairs = dim / 2;
+#ifdef OMNIQ_X86_DISPATCH
+  const PlaneKernelIsa isa = currentIsa().load(std::memory_order_relaxed);
+  // Low targets interleave the two halves within a vector; those stay scalar
+  if (isa >= PlaneKernelIsa::Avx512 && target >= laneBits<T>(64)) {
+    applySingleQubitAvx512(re, im, pairs, target, g);
+    return;
+  }
+  if (isa >= PlaneKernelIsa::Avx2 && target >= laneBits<T>(32)) {
+    applySingleQubitAvx2(re, im, pairs, target, g);
+    return;
+  }
+#endif
+  applySingleQubitScalar(re, im, pairs, target, g);
+}
+
+template <typename T> void applyCNOT(T* re, T* im, Index dim, int control, int target) {
+  const int low = std::min(control, target);
+  const int high = std::max(control, target);
+  const Index controlMask = Index(1) << control;
+  const Index targetMask = Index(1) << target;
+  const Index quarters = dim / 4;
+#pragma omp parallel for if (quarters >= kParallelPairs)
+  for (Index p = 0; p < quarters; ++p) {
+    // Zeros at both qubit positions, then the control bit set
+    const Index i = pairBase(pairBase(p, low), high) | controlMask;
+    const Index j = i | targetMask;
+    std::swap(re[i], re[j]);
+    std::swap(im[i], im[j]);
+  }
+}
+
+} // namespace
+
+PlaneKernelIsa bestPlaneKernelIsa() {
+  static const PlaneKernelIsa best = detectIsa();
+  return best;
+}
+
+PlaneKernelIsa planeKernelIsa() { return currentIsa().load(); }
+
+void setPlaneKernelIsa(PlaneKernelIsa isa) {
+  if (isa > bestPlaneKernelIsa()) {
+    throw std::invalid_argument("This CPU does not support the requested instruction set");
+  }
+  currentIsa().store(isa);
+}
+
+void applySingleQubitPlanes(double* re, double* im, Index dim, int target,
+                            std::complex<double> a, std::complex<double> b,
+                            std::complex<double> c, std::complex<double> d) {
+  applySingleQubit(re, im, dim, target, a, b, c, d);
+}
+
+void applySingleQubitPlanes(float* re, float* im, Index dim, int target,
+                            std::complex<double> a, std::complex<double> b,
+                            std::complex<double> c, std::complex<double> d) {
+  applySingleQubit(re, im, dim, target, a, b, c, d);
+}
+
+void applyCNOTPlanes(double* re, double* im, Index dim, int control, int target) {
+  applyCNOT(re, im, dim, control, target);
+}
+
+void applyCNOTPlanes(float* re, float* im, Index dim, int control, int target) {
+  applyCNOT(re, im, dim, control, target);
+}
+
+} // namespace omniq
@@ -13,8 +13,8 @@ namespace omniq {
 
 // Quantum state analysis functions
 double calculatePurity(const MatrixXcd &densityMatrix) {
-  MatrixXcd squared = densityMatrix * densityMatrix;
-  return squared.trace().real();
+  // Tr(rho^2) = sum |rho_ij|^2 for Hermitian rho
+  return densityMatrix.squaredNorm();
 }
 
 double calculateFidelity(const VectorXcd &state1, const VectorXcd &state2) {
@@ -39,13 +39,19 @@ double calculateFidelity(const MatrixXcd &rho1, const MatrixXcd &rho2) {
 }
 
 double calculateVonNeumannEntropy(const MatrixXcd &densityMatrix) {
+  // Pure states have zero entropy; skip the eigensolver
+  if (calculatePurity(densityMatrix) > 1.0 - 1e-12) {
+    return 0.0;
+  }
+
   // Calculate eigenvalues
-  Eigen::SelfAdjointEigenSolver<MatrixXcd> solver(densityMatrix);
-  const VectorXcd &eigenvalues = solver.eigenvalues();
+  Eigen::SelfAdjointEigenSolver<MatrixXcd> solver(densityMatrix,
+                                                  Eigen::EigenvaluesOnly);
+  const Eigen::VectorXd &eigenvalues = solver.eigenvalues();
 
   double entropy = 0.0;
   for (int i = 0; i < eigenvalues.size(); ++i) {
-    double lambda = eigenvalues(i).real();
+    double lambda = eigenvalues(i);
     if (lambda > 1e-12) { // Avoid log(0)
       entropy -= lambda * std::log2(lambda);
     }
@@ -4,6 +4,7 @@
 
 #include "omniq/Statevector.h"
 #include "omniq/Operators.h"
+#include <algorithm>
 #include <cmath>
 #include <stdexcept>
 #include <sstream>
@@ -97,9 +98,7 @@ std::string Statevector::toString() const {
 
 void Statevector::applyHadamard(int qubit) {
     validateQubitIndex(qubit);
-    
-    MatrixXcd hadamardMatrix = createSingleQubitGate(Operators::HADAMARD, qubit);
-    stateVector_ = hadamardMatrix * stateVector_;
+    applySingleQubitGate(Operators::HADAMARD, qubit);
 }
 
 void Statevector::applyCNOT(int control, int target) {
@@ -110,61 +109,168 @@ void Statevector::applyCNOT(int control, int target) {
         throw std::invalid_argument("Control and target qubits must be different");
     }
     
-    MatrixXcd cnotMatrix = createTwoQubitGate(Operators::CNOT, control, target);
-    stateVector_ = cnotMatrix * stateVector_;
+    // Swap the target bit wherever the control bit is set
+    const Eigen::Index controlMask = Eigen::Index(1) << control;
+    const Eigen::Index targetMask = Eigen::Index(1) << target;
+    const Eigen::Index dim = stateVector_.size();
+    for (Eigen::Index i = 0; i < dim; ++i) {
+        if ((i & controlMask) && !(i & targetMask)) {
+            std::swap(stateVector_(i), stateVector_(i | targetMask));
+        }
+    }
 }
 
 void Statevector::applyPauliX(int qubit) {
     validateQubitIndex(qubit);
-    
-    MatrixXcd pauliXMatrix = createSingleQubitGate(Operators::PAULI_X, qubit);
-    stateVector_ = pauliXMatrix * stateVector_;
+    applySingleQubitGate(Operators::PAULI_X, qubit);
 }
 
 void Statevector::applyPauliY(int qubit) {
     validateQubitIndex(qubit);
-    
-    MatrixXcd pauliYMatrix = createSingleQubitGate(Operators::PAULI_Y, qubit);
-    stateVector_ = pauliYMatrix * stateVector_;
+    applySingleQubitGate(Operators::PAULI_Y, qubit);
 }
 
 void Statevector::applyPauliZ(int qubit) {
     validateQubitIndex(qubit);
-    
-    MatrixXcd pauliZMatrix = createSingleQubitGate(Operators::PAULI_Z, qubit);
-    stateVector_ = pauliZMatrix * stateVector_;
+    applySingleQubitGate(Operators::PAULI_Z, qubit);
 }
 
 void Statevector::applyPhaseShift(int qubit, double angle) {
     validateQubitIndex(qubit);
-    
-    Matrix2cd phaseMatrix = Operators::phaseShift(angle);
-    MatrixXcd fullMatrix = createSingleQubitGate(phaseMatrix, qubit);
-    stateVector_ = fullMatrix * stateVector_;
+    applySingleQubitGate(Operators::phaseShift(angle), qubit);
 }
 
 void Statevector::applyRotationX(int qubit, double angle) {
     validateQubitIndex(qubit);
-    
-    Matrix2cd rotationMatrix = Operators::rotationX(angle);
-    MatrixXcd fullMatrix = createSingleQubitGate(rotationMatrix, qubit);
-    stateVector_ = fullMatrix * stateVector_;
+    applySingleQubitGate(Operators::rotationX(angle), qubit);
 }
 
 void Statevector::applyRotationY(int qubit, double angle) {
     validateQubitIndex(qubit);
-    
-    Matrix2cd rotationMatrix = Operators::rotationY(angle);
-    MatrixXcd fullMatrix = createSingleQubitGate(rotationMatrix, qubit);
-    stateVector_ = fullMatrix * stateVector_;
+    applySingleQubitGate(Operators::rotationY(angle), qubit);
 }
 
 void Statevector::applyRotationZ(int qubit, double angle) {
     validateQubitIndex(qubit);
-    
-    Matrix2cd rotationMatrix = Operators::rotationZ(angle);
-    MatrixXcd fullMatrix = createSingleQubitGate(rotationMatrix, qubit);
-    stateVector_ = fullMatrix * stateVector_;
+    applySingleQubitGate(Operators::rotationZ(angle), qubit);
+}
+
+void Statevector::applyPauliXBatch(const std::vector<int>& qubits) {
+    Eigen::Index mask = 0;
+    for (int qubit : qubits) {
+        validateQubitIndex(qubit);
+        mask ^= Eigen::Index(1) << (numQubits_ - 1 - qubit);
+    }
+    if (mask == 0) {
+        return;
+    }
+    // X on a set of qubits maps index i to i ^ mask; swap each pair once
+    const Eigen::Index dim = stateVector_.size();
+    for (Eigen::Index i = 0; i < dim; ++i) {
+        Eigen::Index j = i ^ mask;
+        if (i < j) {
+            std::swap(stateVector_(i), stateVector_(j));
+        }
+    }
+}
+
+void Statevector::applyHadamardAll() {
+    // H on every qubit is the Walsh-Hadamard transform: unscaled butterflies
+    // on each bit and a single 2^(-n/2) scale at the end. The low bits are
+    // transformed block by block while the block is in cache, so only the
+    // remaining high bits take a full pass over the state each
+    const Eigen::Index dim = stateVector_.size();
+    const Eigen::Index block = std::min<Eigen::Index>(dim, Eigen::Index(1) << 12);
+    std::complex<double>* v = stateVector_.data();
+    auto butterflies = [v](Eigen::Index begin, Eigen::Index end, Eigen::Index stride) {
+        for (Eigen::Index base = begin; base < end; base += 2 * stride) {
+            for (Eigen::Index j = base; j < base + stride; ++j) {
+                const std::complex<double> v0 = v[j];
+                const std::complex<double> v1 = v[j + stride];
+                v[j] = v0 + v1;
+                v[j + stride] = v0 - v1;
+            }
+        }
+    };
+    for (Eigen::Index begin = 0; begin < dim; begin += block) {
+        for (Eigen::Index stride = 1; stride < block; stride <<= 1) {
+            butterflies(begin, begin + block, stride);
+        }
+    }
+    for (Eigen::Index stride = block; stride < dim; stride <<= 1) {
+        butterflies(0, dim, stride);
+    }
+    stateVector_ *= std::pow(2.0, -0.5 * numQubits_);
+}
+
+void Statevector::applySingleQubitGate(const Matrix2cd& gate, int qubit) {
+    // Single-qubit gates address qubit 0 as the most significant bit
+    const int bit = numQubits_ - 1 - qubit;
+    if (gate(0, 1) == 0.0 && gate(1, 0) == 0.0) {
+        applyDiagonalKernel(bit, gate(0, 0), gate(1, 1));
+    } else if (gate(0, 0) == 0.0 && gate(1, 1) == 0.0) {
+        applyAntiDiagonalKernel(bit, gate(0, 1), gate(1, 0));
+    } else {
+        applyMatrixKernel(bit, gate);
+    }
+}
+
+void Statevector::applyDiagonalKernel(int bit, std::complex<double> d0, std::complex<double> d1) {
+    // Z-like gates only scale amplitudes; skip halves scaled by one
+    const Eigen::Index stride = Eigen::Index(1) << bit;
+    const Eigen::Index dim = stateVector_.size();
+    std::complex<double>* v = stateVector_.data();
+    const bool scale0 = d0 != 1.0;
+    const bool scale1 = d1 != 1.0;
+    for (Eigen::Index base = 0; base < dim; base += 2 * stride) {
+        if (scale0) {
+            for (Eigen::Index j = base; j < base + stride; ++j) {
+                v[j] *= d0;
+            }
+        }
+        if (scale1) {
+            for (Eigen::Index j = base + stride; j < base + 2 * stride; ++j) {
+                v[j] *= d1;
+            }
+        }
+    }
+}
+
+void Statevector::applyAntiDiagonalKernel(int bit, std::complex<double> a01, std::complex<double> a10) {
+    // X-like gates swap the pair, with an optional scale (e.g. Pauli-Y)
+    const Eigen::Index stride = Eigen::Index(1) << bit;
+    const Eigen::Index dim = stateVector_.size();
+    std::complex<double>* v = stateVector_.data();
+    const bool pureSwap = a01 == 1.0 && a10 == 1.0;
+    for (Eigen::Index base = 0; base < dim; base += 2 * stride) {
+        for (Eigen::Index j = base; j < base + stride; ++j) {
+            std::complex<double> v0 = v[j];
+            std::complex<double> v1 = v[j + stride];
+            if (pureSwap) {
+                v[j] = v1;
+                v[j + stride] = v0;
+            } else {
+                v[j] = a01 * v1;
+                v[j + stride] = a10 * v0;
+            }
+        }
+    }
+}
+
+void Statevector::applyMatrixKernel(int bit, const Matrix2cd& gate) {
+    const Eigen::Index stride = Eigen::Index(1) << bit;
+    const Eigen::Index dim = stateVector_.size();
+    std::complex<double>* v = stateVector_.data();
+    const std::complex<double> g00 = gate(0, 0), g01 = gate(0, 1);
+    const std::complex<double> g10 = gate(1, 0), g11 = gate(1, 1);
+    for (Eigen::Index base = 0; base < dim; base += 2 * stride) {
+        for (Eigen::Index j = base; j < base + stride; ++j) {
+            std::complex<double> v0 = v[j];
+            std::complex<double> v1 = v[j + stride];
+            v[j] = g00 * v0 + g01 * v1;
+            v[j + stride] = g10 * v0 + g11 * v1;
+        }
+    }
 }
 
 int Statevector::measure(int qubit) {
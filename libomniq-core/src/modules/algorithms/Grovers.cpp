@@ -59,23 +59,19 @@ Circuit GroversAlgorithm::build_diffusion() const {
   return circuit;
 }
 
+Statevector GroversAlgorithm::execute() const {
+  // Standard start: the uniform superposition H^n |0...0>
+  Statevector state(num_qubits_);
+  state.applyHadamardAll();
+  return execute(state);
+}
+
 Statevector GroversAlgorithm::execute(const Statevector &initial_state) const {
-  // Direct simulation to bypass Circuit limitations
-  Statevector state = (initial_state.getNumQubits() == num_qubits_)
-                          ? initial_state
-                          : Statevector(num_qubits_);
-
-  // 1. Initialize with Hadamard if starting from |0>
-  // Assuming standard Grover's start
-  if (initial_state.getNumQubits() == 0) { // Default arg
-    // Already 0 initialized by default constructor which creates size 1
-    // state... We need explicit size from num_qubits_
-    state = Statevector(num_qubits_);
-    // Default state is |0...0>
-    for (int i = 0; i < num_qubits_; ++i) {
-      state.applyHadamard(i);
-    }
+  if (initial_state.getNumQubits() != num_qubits_) {
+    throw std::invalid_argument("Initial state must have num_qubits qubits");
   }
+  // Direct simulation to bypass Circuit limitations
+  Statevector state = initial_state;
 
   OracleGate oracle_gate(num_qubits_, oracle_);
   DiffusionGate diffusion_gate(num_qubits_);
@@ -95,19 +91,29 @@ GroversAlgorithm::execute_with_measurements(int num_shots) const {
     throw std::invalid_argument("Number of shots must be positive");
   }
 
+  // The circuit is deterministic up to measurement, so simulate it once and
+  // draw every shot from the final distribution instead of re-running it
+  Statevector state = execute();
+  const VectorXcd &amplitudes = state.getStateVector();
+
+  // Basis index i has qubit k in bit k, matching a qubit-by-qubit measure()
+  std::vector<double> cdf(amplitudes.size());
+  double total = 0.0;
+  for (Eigen::Index i = 0; i < amplitudes.size(); ++i) {
+    total += std::norm(amplitudes(i));
+    cdf[i] = total;
+  }
+
+  static std::random_device rd;
+  static std::mt19937 gen(rd());
+  std::uniform_real_distribution<double> dis(0.0, total);
+
   std::vector<int> results;
   results.reserve(num_shots);
-
+  const int last = static_cast<int>(cdf.size()) - 1;
   for (int shot = 0; shot < num_shots; ++shot) {
-    Statevector state = execute();
-
-    // Measure all qubits
-    int result = 0;
-    for (int i = 0; i < num_qubits_; ++i) {
-      int bit = state.measure(i);
-      result |= (bit << i);
-    }
-    results.push_back(result);
+    auto it = std::upper_bound(cdf.begin(), cdf.end(), dis(gen));
+    results.push_back(std::min(static_cast<int>(it - cdf.begin()), last));
   }
 
   return results;
@@ -178,53 +184,12 @@ void DiffusionGate::apply_diffusion_to_statevector(Statevector &state) const {
     // match check
   }
 
-  for (int i = 0; i < num_qubits_; ++i)
-    state.applyHadamard(i);
-  for (int i = 0; i < num_qubits_; ++i)
-    state.applyPauliX(i);
-
-  // Multi-controlled Z (flip |1...1> state after X gates = flip |0...0>
-  // original) Actually, diffusion usually flips phase of |00...0> about mean?
-  // 2|s><s| - I.
-  // Implementation: H -> X -> Multi-Z -> X -> H.
-  // Multi-Z controls on 1.
-  // If we want to flip |00...0>, we X everything (to |11...1>), flip phase of
-  // |11...1>, then X back. That's what Lines 179-196 in original code did.
-
+  // 2|s><s| - I = H (2|0><0| - I) H, and 2|0><0| - I only negates every
+  // amplitude except |0...0>: one sign-flip pass between the H layers
+  state.applyHadamardAll();
   auto &vec = state.getStateVector();
-  // Manual phase flip of |1...1> state (index 2^N - 1)
-  // Or flip |0...0> if we are in X-basis?
-  // Original code flipped index 0 (state[0] = -state[0]) after X.
-  // If we apply X to |0>, we get |1>. So index 0 becomes index 2^N-1.
-  // Wait, apply_pauli_x(i) flips the bits.
-  // If state was |00...0> (index 0). After X on all, it is |11...1> (index
-  // N-1). Original code: if (i == 0) state[i] = -state[i]. This flips |00...0>
-  // component. Diffuser is H (2|0><0| - I) H = 2|s><s| - I. 2|0><0| - I acts on
-  // x: if x=0 -> |0>, else -|x>. So we assume the "center" is |0>. Use X to map
-  // 0 to 1 if using multi-control Z (which acts on 11...1). But direct state
-  // access is easier.
-
-  // Just flip |0...0> phase:
-  // This is 2|0><0| - I? No, (2|0><0| - I)|0> = |0>. (2|0><0| - I)|x> = -|x>.
-  // The operator is usually I - 2|0><0| (reflection about 0) or 2|0><0| - I.
-  // Grover diffusion is 2|s><s| - I.
-  // |s> = H|0>.
-  // H (2|0><0| - I) H.
-  // So we apply H, then (2|0><0| - I), then H.
-  // (2|0><0| - I) flips phase of every state orthogonal to |0> (i.e. |x != 0>),
-  // and keeps |0> same? Or better: - (I - 2|0><0|). I - 2|0><0| flips phase of
-  // |0> and keeps others. So usually implementation is: Flip phase of |0...0>
-  // and global phase -1.
-
-  // Original implementation flipped index 0.
-  // Let's stick to that.
-
-  vec(0) = -vec(0); // Phase flip |0...0>
-
-  for (int i = 0; i < num_qubits_; ++i)
-    state.applyPauliX(i);
-  for (int i = 0; i < num_qubits_; ++i)
-    state.applyHadamard(i);
+  vec.tail(vec.size() - 1) = -vec.tail(vec.size() - 1);
+  state.applyHadamardAll();
 }
 
 // Utility functions implementation
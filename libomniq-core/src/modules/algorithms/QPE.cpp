@@ -76,6 +76,8 @@ Circuit QPE::build_inverse_qft() const {
   return circuit;
 }
 
+Statevector QPE::execute() const { return execute(Statevector(get_total_qubits())); }
+
 Statevector QPE::execute(const Statevector &initial_state) const {
   // Direct simulation instead of Circuit for now
   int total_qubits = get_total_qubits();
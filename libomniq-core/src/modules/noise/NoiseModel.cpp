@@ -12,14 +12,86 @@ namespace noise {
 
 NoiseModel::NoiseModel() {
   // Use default hardware parameters and gate fidelities
+  rebuildGateNoise();
 }
 
 void NoiseModel::setHardwareParams(const HardwareParams &params) {
   hwParams_ = params;
+  rebuildGateNoise();
 }
 
 void NoiseModel::setGateFidelities(const GateFidelities &fidelities) {
   gateFidelities_ = fidelities;
+  rebuildGateNoise();
+}
+
+namespace {
+
+// vec(E rho E^dagger) = (conj(E) kron E) vec(rho) for column-major vec
+Eigen::Matrix4cd krausToSuperoperator(const std::vector<MatrixXcd> &kraus) {
+  Eigen::Matrix4cd superoperator = Eigen::Matrix4cd::Zero();
+  for (const auto &E : kraus) {
+    for (int i = 0; i < 2; ++i) {
+      for (int j = 0; j < 2; ++j) {
+        superoperator.block<2, 2>(2 * i, 2 * j) += std::conj(E(i, j)) * E;
+      }
+    }
+  }
+  return superoperator;
+}
+
+} // namespace
+
+Eigen::Matrix4cd
+NoiseModel::composeSuperoperator(double duration,
+                                 double depolarizingProb) const {
+  Eigen::Matrix4cd superoperator = Eigen::Matrix4cd::Identity();
+
+  // Depolarizing noise based on gate fidelity
+  if (depolarizingProb > 0.0) {
+    superoperator = krausToSuperoperator(
+        DepolarizingChannel(depolarizingProb).getKrausOperators());
+  }
+
+  if (duration > 0.0) {
+    // T1 relaxation (amplitude damping)
+    double gamma_T1 = 1.0 - std::exp(-duration / hwParams_.T1);
+    if (gamma_T1 > 0.0) {
+      superoperator = krausToSuperoperator(AmplitudeDampingChannel(gamma_T1)
+                                               .getKrausOperators()) *
+                      superoperator;
+    }
+
+    // T2 dephasing (phase damping)
+    // Note: T2* = (1/T2 - 1/2T1)^-1 for pure dephasing
+    double T2_star =
+        1.0 / (1.0 / hwParams_.T2 - 1.0 / (2.0 * hwParams_.T1));
+    double lambda_T2 = 1.0 - std::exp(-duration / T2_star);
+    if (lambda_T2 > 0.0) {
+      superoperator = krausToSuperoperator(PhaseDampingChannel(lambda_T2)
+                                               .getKrausOperators()) *
+                      superoperator;
+    }
+  }
+
+  return superoperator;
+}
+
+void NoiseModel::rebuildGateNoise() {
+  singleQubitGateNoise_ = composeSuperoperator(
+      hwParams_.singleQubitGateTime,
+      calculateDepolarizingError(gateFidelities_.singleQubit));
+  twoQubitGateNoise_ = composeSuperoperator(
+      hwParams_.twoQubitGateTime,
+      calculateDepolarizingError(gateFidelities_.twoQubit));
+}
+
+void NoiseModel::applySuperoperator(DensityMatrix &rho,
+                                    const Eigen::Matrix4cd &superoperator) {
+  MatrixXcd &matrix = rho.getDensityMatrix();
+  Eigen::Map<Eigen::Vector4cd> vecRho(matrix.data());
+  Eigen::Vector4cd result = superoperator * vecRho;
+  vecRho = result;
 }
 
 double NoiseModel::calculateDepolarizingError(double fidelity) const {
@@ -39,28 +111,15 @@ void NoiseModel::applyGateNoise(DensityMatrix &rho, const std::string &gateName,
     // Multi-qubit noise not yet implemented
     return;
   }
+  (void)qubits; // single-qubit density matrix: the target is implied
 
-  double fidelity;
-  double gateTime;
-
-  // Determine fidelity and gate time based on gate type
+  // Depolarizing noise followed by decoherence during gate execution,
+  // composed once per gate class
   if (gateName == "CNOT" || gateName == "CZ" || gateName == "SWAP") {
-    fidelity = gateFidelities_.twoQubit;
-    gateTime = hwParams_.twoQubitGateTime;
+    applySuperoperator(rho, twoQubitGateNoise_);
   } else {
-    fidelity = gateFidelities_.singleQubit;
-    gateTime = hwParams_.singleQubitGateTime;
-  }
-
-  // Apply depolarizing noise based on gate fidelity
-  double depolarizingProb = calculateDepolarizingError(fidelity);
-  if (depolarizingProb > 0.0) {
-    DepolarizingChannel depolarizing(depolarizingProb);
-    depolarizing.apply(rho, qubits[0]);
+    applySuperoperator(rho, singleQubitGateNoise_);
   }
-
-  // Apply decoherence during gate execution
-  applyIdleNoise(rho, qubits[0], gateTime);
 }
 
 void NoiseModel::applyIdleNoise(DensityMatrix &rho, int qubit,
@@ -71,22 +130,10 @@ void NoiseModel::applyIdleNoise(DensityMatrix &rho, int qubit,
     // Multi-qubit noise not yet implemented
     return;
   }
+  (void)qubit; // single-qubit density matrix: the target is implied
 
-  // Apply T1 relaxation (amplitude damping)
-  double gamma_T1 = 1.0 - std::exp(-idleTime / hwParams_.T1);
-  if (gamma_T1 > 0.0) {
-    AmplitudeDampingChannel relaxation(gamma_T1);
-    relaxation.apply(rho, qubit);
-  }
-
-  // Apply T2 dephasing (phase damping)
-  // Note: T2* = (1/T2 - 1/2T1)^-1 for pure dephasing
-  double T2_star = 1.0 / (1.0 / hwParams_.T2 - 1.0 / (2.0 * hwParams_.T1));
-  double lambda_T2 = 1.0 - std::exp(-idleTime / T2_star);
-  if (lambda_T2 > 0.0) {
-    PhaseDampingChannel dephasing(lambda_T2);
-    dephasing.apply(rho, qubit);
-  }
+  // Idle periods vary from call to call, so their noise is composed here
+  applySuperoperator(rho, composeSuperoperator(idleTime, 0.0));
 }
 
 int NoiseModel::applyMeasurementNoise(int measurementResult) const {
@@ -0,0 +1,97 @@
+#include "omniq/QEC/Decoder.h"
+#include "omniq/QEC/SurfaceCode.h"
+#include <algorithm>
+#include <cstdlib>
+#include <stdexcept>
+
+namespace omniq {
+namespace qec {
+
+// Plaquettes sit on a (d-1) x (d-1) grid; those of one type form a
+// checkerboard, so same-type neighbours are diagonal and share exactly one
+// data qubit. A diagonal step from (r, c) by (dr, dc) flips data qubit
+// (r + (dr > 0), c + (dc > 0)), which touches no other plaquette of the type.
+
+const std::vector<Decoder::Plaquette> &
+Decoder::lattice(const Syndrome &syndrome) {
+  if (latticeDistance_ != codeDistance_) {
+    SurfaceCode code(codeDistance_);
+    lattice_.clear();
+    for (const auto &info : code.getXStabilizers()) {
+      lattice_.push_back({info.row, info.col, true});
+    }
+    for (const auto &info : code.getZStabilizers()) {
+      lattice_.push_back({info.row, info.col, false});
+    }
+    latticeDistance_ = codeDistance_;
+  }
+  if (syndrome.size() != static_cast<int>(lattice_.size())) {
+    throw std::invalid_argument(
+        "Syndrome size does not match the decoder's code distance");
+  }
+  return lattice_;
+}
+
+int Decoder::latticeDistance(const Plaquette &a, const Plaquette &b) {
+  return std::max(std::abs(a.row - b.row), std::abs(a.col - b.col));
+}
+
+int Decoder::boundaryDistance(const Plaquette &p) const {
+  const int last = codeDistance_ - 2;
+  return 1 + std::min({p.row, p.col, last - p.row, last - p.col});
+}
+
+void Decoder::flipChain(std::vector<char> &flips, Plaquette a,
+                        const Plaquette &b) const {
+  const int last = codeDistance_ - 2;
+  while (a.row != b.row || a.col != b.col) {
+    // Zigzag along a row or column that is already aligned
+    int dr = (b.row > a.row) - (b.row < a.row);
+    int dc = (b.col > a.col) - (b.col < a.col);
+    if (dr == 0) {
+      dr = a.row < last ? 1 : -1;
+    }
+    if (dc == 0) {
+      dc = a.col < last ? 1 : -1;
+    }
+    flips[(a.row + (dr > 0)) * codeDistance_ + a.col + (dc > 0)] ^= 1;
+    a.row += dr;
+    a.col += dc;
+  }
+}
+
+void Decoder::flipChainToBoundary(std::vector<char> &flips,
+                                  Plaquette p) const {
+  const int last = codeDistance_ - 2;
+  // Diagonal steps towards the nearer row edge and nearer column edge bring
+  // both one closer, so the first edge is reached in boundaryDistance - 1
+  const int dr = p.row <= last - p.row ? -1 : 1;
+  const int dc = p.col <= last - p.col ? -1 : 1;
+  while (p.row > 0 && p.col > 0 && p.row < last && p.col < last) {
+    flips[(p.row + (dr > 0)) * codeDistance_ + p.col + (dc > 0)] ^= 1;
+    p.row += dr;
+    p.col += dc;
+  }
+  // The qubit whose other same-type plaquette lies outside the grid
+  if (p.row == 0 || p.col == 0) {
+    flips[p.row * codeDistance_ + p.col] ^= 1;
+  } else {
+    flips[(p.row + 1) * codeDistance_ + p.col + 1] ^= 1;
+  }
+}
+
+std::vector<int> Decoder::flippedQubits(const std::vector<char> &zFlips,
+                                        const std::vector<char> &xFlips) {
+  std::vector<int> correction;
+  for (const auto *flips : {&zFlips, &xFlips}) {
+    for (size_t q = 0; q < flips->size(); ++q) {
+      if ((*flips)[q]) {
+        correction.push_back(static_cast<int>(q));
+      }
+    }
+  }
+  return correction;
+}
+
+} // namespace qec
+} // namespace omniq
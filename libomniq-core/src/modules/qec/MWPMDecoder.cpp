@@ -4,7 +4,7 @@
 
 #include "omniq/QEC/MWPMDecoder.h"
 #include <algorithm>
-#include <cmath>
+#include <limits>
 
 namespace omniq {
 namespace qec {
@@ -14,6 +14,7 @@ MWPMDecoder::MWPMDecoder() {
 }
 
 std::vector<int> MWPMDecoder::decode(const Syndrome &syndrome) {
+  const auto &plaquettes = lattice(syndrome);
   auto violations = syndrome.getViolatedStabilizers();
 
   if (violations.empty()) {
@@ -21,59 +22,66 @@ std::vector<int> MWPMDecoder::decode(const Syndrome &syndrome) {
   }
 
   // Find matching pairs
-  auto matching = findMatching(violations);
+  auto matching = findMatching(violations, plaquettes);
 
-  // Extract correction path (simplified - returns qubit indices)
-  std::vector<int> correction;
+  // Flip the data qubits along each matched chain; X-stabilizer violations
+  // call for Z flips, Z-stabilizer violations for X flips
+  const int numDataQubits = codeDistance_ * codeDistance_;
+  std::vector<char> zFlips(numDataQubits, 0), xFlips(numDataQubits, 0);
   for (const auto &pair : matching) {
-    // In a real implementation, trace path between matched stabilizers
-    // For now, return the indices themselves as a placeholder
-    correction.push_back(pair.first);
-    correction.push_back(pair.second);
+    const Plaquette &first = plaquettes[pair.first];
+    auto &flips = first.isXType ? zFlips : xFlips;
+    if (pair.second < 0) {
+      flipChainToBoundary(flips, first);
+    } else {
+      flipChain(flips, first, plaquettes[pair.second]);
+    }
   }
 
-  return correction;
+  return flippedQubits(zFlips, xFlips);
 }
 
 std::vector<std::pair<int, int>>
-MWPMDecoder::findMatching(const std::vector<int> &violations) {
+MWPMDecoder::findMatching(const std::vector<int> &violations,
+                          const std::vector<Plaquette> &lattice) const {
   std::vector<std::pair<int, int>> matching;
   std::vector<bool> matched(violations.size(), false);
 
-  // Greedy matching: pair each violation with nearest unmatched partner
+  // Greedy matching: pair each violation with its nearest unmatched partner
+  // of the same type, unless both reach the edge more cheaply
   for (size_t i = 0; i < violations.size(); ++i) {
     if (matched[i])
       continue;
 
+    const Plaquette &p = lattice[violations[i]];
     int bestPartner = -1;
-    double bestWeight = 1e9;
+    int bestWeight = std::numeric_limits<int>::max();
 
     for (size_t j = i + 1; j < violations.size(); ++j) {
-      if (matched[j])
+      const Plaquette &q = lattice[violations[j]];
+      if (matched[j] || q.isXType != p.isXType)
         continue;
 
-      double weight = calculateWeight(violations[i], violations[j]);
+      int weight = latticeDistance(p, q);
       if (weight < bestWeight) {
         bestWeight = weight;
         bestPartner = j;
       }
     }
 
-    if (bestPartner != -1) {
+    matched[i] = true;
+    if (bestPartner != -1 &&
+        bestWeight <= boundaryDistance(p) +
+                          boundaryDistance(lattice[violations[bestPartner]])) {
       matching.push_back({violations[i], violations[bestPartner]});
-      matched[i] = true;
       matched[bestPartner] = true;
+    } else {
+      matching.push_back({violations[i], -1});
     }
   }
 
   return matching;
 }
 
-double MWPMDecoder::calculateWeight(int idx1, int idx2) const {
-  // Manhattan distance (simplified - assumes 1D layout)
-  // In real surface code, use 2D lattice positions
-  return std::abs(idx1 - idx2);
-}
-
 } // namespace qec
 } // namespace omniq
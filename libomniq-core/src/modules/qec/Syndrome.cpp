@@ -3,16 +3,35 @@
 //
 
 #include "omniq/QEC/Syndrome.h"
+#include <bitset>
 #include <sstream>
 #include <stdexcept>
 
 namespace omniq {
 namespace qec {
 
+namespace {
+
+inline int lowestSetBit(uint64_t word) {
+#if defined(__GNUC__) || defined(__clang__)
+  return __builtin_ctzll(word);
+#else
+  int bit = 0;
+  while (!(word & 1)) {
+    word >>= 1;
+    ++bit;
+  }
+  return bit;
+#endif
+}
+
+} // namespace
+
 Syndrome::Syndrome() : codeDistance_(0) {}
 
 Syndrome::Syndrome(int numStabilizers)
-    : measurements_(numStabilizers, 1), codeDistance_(0) {
+    : measurements_(numStabilizers, 1),
+      violationWords_((numStabilizers + 63) / 64, 0), codeDistance_(0) {
   // Initialize all to +1 (satisfied)
 }
 
@@ -31,34 +50,65 @@ void Syndrome::setMeasurement(int index, int value) {
     throw std::invalid_argument("Syndrome measurement must be +1 or -1");
   }
   measurements_[index] = value;
+  uint64_t mask = uint64_t(1) << (index % 64);
+  if (value == -1) {
+    violationWords_[index / 64] |= mask;
+  } else {
+    violationWords_[index / 64] &= ~mask;
+  }
 }
 
 void Syndrome::setMeasurements(const std::vector<int> &measurements) {
   measurements_ = measurements;
+  rebuildViolationWords();
+}
+
+void Syndrome::rebuildViolationWords() {
+  violationWords_.assign((measurements_.size() + 63) / 64, 0);
+  for (size_t i = 0; i < measurements_.size(); ++i) {
+    violationWords_[i / 64] |= uint64_t(measurements_[i] == -1) << (i % 64);
+  }
+}
+
+std::vector<int>
+Syndrome::setBitIndices(const std::vector<uint64_t> &words) {
+  std::vector<int> indices;
+  for (size_t w = 0; w < words.size(); ++w) {
+    uint64_t bits = words[w];
+    while (bits) {
+      indices.push_back(static_cast<int>(w * 64) + lowestSetBit(bits));
+      bits &= bits - 1; // clear lowest set bit
+    }
+  }
+  return indices;
 }
 
 int Syndrome::countViolations() const {
   int count = 0;
-  for (int m : measurements_) {
-    if (m == -1)
-      count++;
+  for (uint64_t word : violationWords_) {
+    count += static_cast<int>(std::bitset<64>(word).count());
   }
   return count;
 }
 
 std::vector<int> Syndrome::getViolatedStabilizers() const {
-  std::vector<int> violated;
-  for (size_t i = 0; i < measurements_.size(); ++i) {
-    if (measurements_[i] == -1) {
-      violated.push_back(static_cast<int>(i));
-    }
+  return setBitIndices(violationWords_);
+}
+
+std::vector<int> Syndrome::getDetectionEvents(const Syndrome &previous) const {
+  if (previous.size() != size()) {
+    throw std::invalid_argument("Syndromes must have the same size");
+  }
+  std::vector<uint64_t> diff(violationWords_.size());
+  for (size_t w = 0; w < diff.size(); ++w) {
+    diff[w] = violationWords_[w] ^ previous.violationWords_[w];
   }
-  return violated;
+  return setBitIndices(diff);
 }
 
 bool Syndrome::isAllZero() const {
-  for (int m : measurements_) {
-    if (m == -1)
+  for (uint64_t word : violationWords_) {
+    if (word)
       return false;
   }
   return true;
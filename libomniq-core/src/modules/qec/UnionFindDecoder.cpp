@@ -4,7 +4,7 @@
 
 #include "omniq/QEC/UnionFindDecoder.h"
 #include <algorithm>
-#include <set>
+#include <map>
 
 namespace omniq {
 namespace qec {
@@ -51,6 +51,7 @@ UnionFindDecoder::UnionFindDecoder() {
 }
 
 std::vector<int> UnionFindDecoder::decode(const Syndrome &syndrome) {
+  const auto &plaquettes = lattice(syndrome);
   auto violations = syndrome.getViolatedStabilizers();
 
   if (violations.empty()) {
@@ -61,37 +62,61 @@ std::vector<int> UnionFindDecoder::decode(const Syndrome &syndrome) {
   int n = syndrome.size();
   UnionFind uf(n);
 
-  // Grow clusters by uniting nearby violations
-  for (size_t i = 0; i < violations.size(); ++i) {
-    for (size_t j = i + 1; j < violations.size(); ++j) {
-      int dist = std::abs(violations[i] - violations[j]);
-      // Unite if close enough (simplified heuristic)
-      if (dist <= codeDistance_) {
-        uf.unite(violations[i], violations[j]);
+  // Grow each violation by one step: unite it with violated diagonal
+  // neighbours of its type. A grid lookup keeps this O(n).
+  const int side = codeDistance_ - 1;
+  std::vector<int> violationAt(2 * side * side, -1);
+  auto cell = [side](const Plaquette &p) {
+    return (p.isXType ? 0 : side * side) + p.row * side + p.col;
+  };
+  for (int v : violations) {
+    violationAt[cell(plaquettes[v])] = v;
+  }
+  for (int v : violations) {
+    const Plaquette &p = plaquettes[v];
+    for (int dr : {-1, 1}) {
+      for (int dc : {-1, 1}) {
+        Plaquette q{p.row + dr, p.col + dc, p.isXType};
+        if (q.row < 0 || q.col < 0 || q.row >= side || q.col >= side)
+          continue;
+        int neighbour = violationAt[cell(q)];
+        if (neighbour >= 0) {
+          uf.unite(v, neighbour);
+        }
       }
     }
   }
 
   // Extract correction from clusters
-  return extractCorrection(uf, violations);
+  return extractCorrection(uf, violations, plaquettes);
 }
 
 std::vector<int>
 UnionFindDecoder::extractCorrection(UnionFind &uf,
-                                    const std::vector<int> &violations) {
-  // Simplified: return cluster representatives
-  std::vector<int> correction;
-  std::set<int> roots;
-
+                                    const std::vector<int> &violations,
+                                    const std::vector<Plaquette> &lattice) {
+  // Gather each cluster's violations, in syndrome order
+  std::map<int, std::vector<int>> clusters;
   for (int v : violations) {
-    int root = uf.find(v);
-    if (roots.find(root) == roots.end()) {
-      roots.insert(root);
-      correction.push_back(root);
+    clusters[uf.find(v)].push_back(v);
+  }
+
+  // Within a cluster, chain consecutive violations in pairs; an odd one
+  // out is chained to the lattice edge
+  const int numDataQubits = codeDistance_ * codeDistance_;
+  std::vector<char> zFlips(numDataQubits, 0), xFlips(numDataQubits, 0);
+  for (const auto &[root, nodes] : clusters) {
+    auto &flips = lattice[root].isXType ? zFlips : xFlips;
+    size_t i = 0;
+    for (; i + 1 < nodes.size(); i += 2) {
+      flipChain(flips, lattice[nodes[i]], lattice[nodes[i + 1]]);
+    }
+    if (i < nodes.size()) {
+      flipChainToBoundary(flips, lattice[nodes[i]]);
     }
   }
 
-  return correction;
+  return flippedQubits(zFlips, xFlips);
 }
 
 } // namespace qec
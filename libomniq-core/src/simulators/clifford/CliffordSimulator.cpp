@@ -10,20 +10,22 @@
 namespace omniq {
 namespace simulators {
 
-CliffordSimulator::CliffordSimulator(int numQubits) : numQubits_(numQubits) {
+CliffordSimulator::CliffordSimulator(int numQubits)
+    : numQubits_(numQubits), numRows_(2 * numQubits + 1),
+      numWords_((static_cast<std::size_t>(numRows_) + 63) / 64) {
   // Initialize tableau to |0...0⟩ state
-  x_ = Eigen::MatrixXi::Zero(2 * numQubits, numQubits);
-  z_ = Eigen::MatrixXi::Zero(2 * numQubits, numQubits);
-  r_ = Eigen::VectorXi::Zero(2 * numQubits);
+  x_.assign(numWords_ * numQubits, 0);
+  z_.assign(numWords_ * numQubits, 0);
+  r_.assign(numWords_, 0);
 
   // Set stabilizers: Z_i for each qubit
   for (int i = 0; i < numQubits; ++i) {
-    z_(i, i) = 1;
+    setBit(zCol(i), i, 1);
   }
 
   // Set destabilizers: X_i for each qubit
   for (int i = 0; i < numQubits; ++i) {
-    x_(numQubits + i, i) = 1;
+    setBit(xCol(i), numQubits + i, 1);
   }
 }
 
@@ -42,40 +44,63 @@ int CliffordSimulator::g(int x1, int z1, int x2, int z2) const {
 
 void CliffordSimulator::rowsum(int h, int i) {
   // Add row i to row h (with appropriate phase)
-  int phase = 2 * r_(h) + 2 * r_(i);
+  int phase = 2 * getBit(r_.data(), h) + 2 * getBit(r_.data(), i);
 
   for (int j = 0; j < numQubits_; ++j) {
-    phase += g(x_(i, j), z_(i, j), x_(h, j), z_(h, j));
-    x_(h, j) = (x_(h, j) + x_(i, j)) % 2;
-    z_(h, j) = (z_(h, j) + z_(i, j)) % 2;
+    uint64_t *xj = xCol(j);
+    uint64_t *zj = zCol(j);
+    int xi = getBit(xj, i);
+    int zi = getBit(zj, i);
+    int xh = getBit(xj, h);
+    int zh = getBit(zj, h);
+    phase += g(xi, zi, xh, zh);
+    setBit(xj, h, xh ^ xi);
+    setBit(zj, h, zh ^ zi);
   }
 
-  r_(h) = (phase % 4) / 2;
+  setBit(r_.data(), h, (((phase % 4) + 4) % 4) / 2);
 }
 
-void CliffordSimulator::applyH(int qubit) {
-  // H transforms: X ↔ Z
-  for (int i = 0; i < 2 * numQubits_; ++i) {
-    int tmp = x_(i, qubit);
-    x_(i, qubit) = z_(i, qubit);
-    z_(i, qubit) = tmp;
+void CliffordSimulator::copyRow(int dst, int src) {
+  for (int j = 0; j < numQubits_; ++j) {
+    setBit(xCol(j), dst, getBit(xCol(j), src));
+    setBit(zCol(j), dst, getBit(zCol(j), src));
+  }
+  setBit(r_.data(), dst, getBit(r_.data(), src));
+}
 
-    // Phase: -1 if both X and Z
-    if (x_(i, qubit) && z_(i, qubit)) {
-      r_(i) = (r_(i) + 1) % 2;
-    }
+void CliffordSimulator::clearRow(int row) {
+  for (int j = 0; j < numQubits_; ++j) {
+    setBit(xCol(j), row, 0);
+    setBit(zCol(j), row, 0);
+  }
+  setBit(r_.data(), row, 0);
+}
+
+// Every gate below updates all rows at once: each loop walks the packed
+// column words, which the compiler turns into wide AND/XOR vector ops.
+
+void CliffordSimulator::applyH(int qubit) {
+  // H transforms: X ↔ Z, phase flips where both X and Z are set
+  uint64_t *x = xCol(qubit);
+  uint64_t *z = zCol(qubit);
+  uint64_t *r = r_.data();
+  for (std::size_t w = 0; w < numWords_; ++w) {
+    r[w] ^= x[w] & z[w];
+    uint64_t tmp = x[w];
+    x[w] = z[w];
+    z[w] = tmp;
   }
 }
 
 void CliffordSimulator::applyS(int qubit) {
   // S transforms: X → Y, Y → -X, Z → Z
-  for (int i = 0; i < 2 * numQubits_; ++i) {
-    if (x_(i, qubit)) {
-      z_(i, qubit) = (z_(i, qubit) + 1) % 2;
-      if (z_(i, qubit)) {
-        r_(i) = (r_(i) + 1) % 2;
-      }
-    }
+  const uint64_t *x = xCol(qubit);
+  uint64_t *z = zCol(qubit);
+  uint64_t *r = r_.data();
+  for (std::size_t w = 0; w < numWords_; ++w) {
+    r[w] ^= x[w] & z[w];
+    z[w] ^= x[w];
   }
 }
 
@@ -88,12 +113,15 @@ void CliffordSimulator::applySdag(int qubit) {
 
 void CliffordSimulator::applyCNOT(int control, int target) {
   // CNOT transforms: X_c → X_c X_t, Z_t → Z_c Z_t
-  for (int i = 0; i < 2 * numQubits_; ++i) {
-    r_(i) = (r_(i) + x_(i, control) * z_(i, target) *
-                         (x_(i, target) + z_(i, control) + 1)) %
-            2;
-    x_(i, target) = (x_(i, target) + x_(i, control)) % 2;
-    z_(i, control) = (z_(i, control) + z_(i, target)) % 2;
+  uint64_t *xc = xCol(control);
+  uint64_t *zc = zCol(control);
+  uint64_t *xt = xCol(target);
+  uint64_t *zt = zCol(target);
+  uint64_t *r = r_.data();
+  for (std::size_t w = 0; w < numWords_; ++w) {
+    r[w] ^= xc[w] & zt[w] & ~(xt[w] ^ zc[w]);
+    xt[w] ^= xc[w];
+    zc[w] ^= zt[w];
   }
 }
 
@@ -106,28 +134,29 @@ void CliffordSimulator::applyCZ(int q1, int q2) {
 
 void CliffordSimulator::applyX(int qubit) {
   // X flips phase of Z stabilizers
-  for (int i = 0; i < 2 * numQubits_; ++i) {
-    if (z_(i, qubit)) {
-      r_(i) = (r_(i) + 1) % 2;
-    }
+  const uint64_t *z = zCol(qubit);
+  uint64_t *r = r_.data();
+  for (std::size_t w = 0; w < numWords_; ++w) {
+    r[w] ^= z[w];
   }
 }
 
 void CliffordSimulator::applyY(int qubit) {
   // Y = iXZ
-  for (int i = 0; i < 2 * numQubits_; ++i) {
-    if (x_(i, qubit) ^ z_(i, qubit)) {
-      r_(i) = (r_(i) + 1) % 2;
-    }
+  const uint64_t *x = xCol(qubit);
+  const uint64_t *z = zCol(qubit);
+  uint64_t *r = r_.data();
+  for (std::size_t w = 0; w < numWords_; ++w) {
+    r[w] ^= x[w] ^ z[w];
   }
 }
 
 void CliffordSimulator::applyZ(int qubit) {
   // Z flips phase of X stabilizers
-  for (int i = 0; i < 2 * numQubits_; ++i) {
-    if (x_(i, qubit)) {
-      r_(i) = (r_(i) + 1) % 2;
-    }
+  const uint64_t *x = xCol(qubit);
+  uint64_t *r = r_.data();
+  for (std::size_t w = 0; w < numWords_; ++w) {
+    r[w] ^= x[w];
   }
 }
 
@@ -136,8 +165,9 @@ int CliffordSimulator::measure(int qubit) {
   bool isRandom = false;
   int p = -1;
 
+  const uint64_t *xq = xCol(qubit);
   for (int i = 0; i < numQubits_; ++i) {
-    if (x_(i, qubit)) {
+    if (getBit(xq, i)) {
       isRandom = true;
       p = i;
       break;
@@ -155,30 +185,60 @@ int CliffordSimulator::measure(int qubit) {
 
     // Update tableau
     for (int i = 0; i < 2 * numQubits_; ++i) {
-      if (i != p && x_(i, qubit)) {
+      if (i != p && getBit(xq, i)) {
         rowsum(i, p);
       }
     }
 
-    // Set row p to project onto measurement result
-    x_.row(p).setZero();
-    z_.row(p).setZero();
-    z_(p, qubit) = 1;
-    r_(p) = result;
+    // Old stabilizer becomes the destabilizer, row p projects onto result
+    copyRow(p + numQubits_, p);
+    clearRow(p);
+    setBit(zCol(qubit), p, 1);
+    setBit(r_.data(), p, result);
   } else {
-    // Deterministic outcome
-    result = 0;
+    // Deterministic outcome: accumulate stabilizers into the scratch row
+    int scratch = 2 * numQubits_;
+    clearRow(scratch);
     for (int i = numQubits_; i < 2 * numQubits_; ++i) {
-      if (x_(i, qubit)) {
-        result ^= r_(i);
+      if (getBit(xq, i)) {
+        rowsum(scratch, i - numQubits_);
       }
     }
+    result = getBit(r_.data(), scratch);
   }
 
   measurementHistory_.push_back(result);
   return result;
 }
 
+Eigen::MatrixXi CliffordSimulator::getXTableau() const {
+  Eigen::MatrixXi x(2 * numQubits_, numQubits_);
+  for (int j = 0; j < numQubits_; ++j) {
+    for (int i = 0; i < 2 * numQubits_; ++i) {
+      x(i, j) = getBit(xCol(j), i);
+    }
+  }
+  return x;
+}
+
+Eigen::MatrixXi CliffordSimulator::getZTableau() const {
+  Eigen::MatrixXi z(2 * numQubits_, numQubits_);
+  for (int j = 0; j < numQubits_; ++j) {
+    for (int i = 0; i < 2 * numQubits_; ++i) {
+      z(i, j) = getBit(zCol(j), i);
+    }
+  }
+  return z;
+}
+
+Eigen::VectorXi CliffordSimulator::getRVector() const {
+  Eigen::VectorXi r(2 * numQubits_);
+  for (int i = 0; i < 2 * numQubits_; ++i) {
+    r(i) = getBit(r_.data(), i);
+  }
+  return r;
+}
+
 bool CliffordSimulator::isPureState() const {
   // A state is pure if all stabilizers are independent
   // (This is a simplified check)
@@ -1,7 +1,8 @@
 """
 OmniQ: Seamless Quantum Programming Across Python and C.
 
-A modern, open-source software library designed for quantum computing research and development.
+A modern, open-source software library designed for quantum computing research
+and development.
 """
 
 __version__ = "0.1.0"
@@ -11,15 +12,12 @@ __email__ = "goutham.arcot@quantum-quorum.com"
 # Import core modules
 from .circuit import Circuit
 from .noise import NoiseModel
+
 # from .device import Device, SimulatorDevice, QPUDevice
 # from .algorithms import GroversAlgorithm, QPE
 # from .crypto import ShorsAlgorithm, GroversCrypto
 # from .qml import VariationalCircuit, QMLModel
 # from .optimization import QAOA, VQE
-from . import debugger
-
-# Add debugger methods to Circuit class
-debugger.add_debugger_to_circuit()
 
 # Import utility functions
 # from .utils import (
@@ -30,33 +28,52 @@ debugger.add_debugger_to_circuit()
 #     random_circuit
 # )
 
-# Import debugger functions
-from .debugger import show_debugger, QuantumDebugger
+# Debugger functions are resolved on first access (PEP 562) so that a
+# headless ``import omniq`` never loads the debugger module
+_LAZY_DEBUGGER_ATTRS = ("show_debugger", "QuantumDebugger", "debugger")
+
+
+def __getattr__(name):
+    if name in _LAZY_DEBUGGER_ATTRS:
+        import importlib
+
+        debugger = importlib.import_module(".debugger", __name__)
+        value = debugger if name == "debugger" else getattr(debugger, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_DEBUGGER_ATTRS))
+
 
 # Version info
 def version_info():
     """Return version information."""
-    return {
-        'version': __version__,
-        'author': __author__,
-        'email': __email__
-    }
+    return {"version": __version__, "author": __author__, "email": __email__}
 
-# Package level constants
-DEFAULT_DEVICE = 'default.qubit'
-SUPPORTED_DEVICES = ['default.qubit', 'lightning.qubit', 'ibmq.manila', 'ionq.simulator']
+
+# Package level constants; Circuit.execute() runs on DEFAULT_DEVICE, and
+# 'cuda.qubit' keeps the state vector on the GPU (requires CuPy)
+DEFAULT_DEVICE = "default.qubit"
+SUPPORTED_DEVICES = [
+    "default.qubit",
+    "lightning.qubit",
+    "cuda.qubit",
+    "ibmq.manila",
+    "ionq.simulator",
+]
 
 # Import all public API
 __all__ = [
     # Core classes
-    'Circuit',
-    'NoiseModel',
-    
+    "Circuit",
+    "NoiseModel",
     # Debugger
-    'show_debugger',
-    'QuantumDebugger',
-    
+    "show_debugger",
+    "QuantumDebugger",
     # Version
-    'version_info',
-    '__version__'
+    "version_info",
+    "__version__",
 ]
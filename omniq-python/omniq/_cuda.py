@@ -0,0 +1,184 @@
+"""
+CuPy statevector backend.
+
+Only importable with CuPy installed (the ``cuda`` extra). Amplitudes stay in
+GPU memory; gates run through cuStateVec when cuQuantum is installed and as
+a CuPy unfold + matmul otherwise. Bit k of an amplitude's index is qubit k,
+as for omniq.circuit.Statevector.
+"""
+
+import atexit
+import functools
+
+import cupy as cp
+import numpy as np
+
+from .circuit import _apply_matrix_unfold, _named_gate
+
+try:
+    import cuquantum
+    from cuquantum import custatevec as cusv
+except ImportError:
+    cusv = None
+
+if cusv is not None:
+    # (state/matrix data type, compute type) per amplitude dtype
+    _CUSV_TYPES = {
+        np.dtype(np.complex64): (
+            cuquantum.cudaDataType.CUDA_C_32F,
+            cuquantum.ComputeType.COMPUTE_32F,
+        ),
+        np.dtype(np.complex128): (
+            cuquantum.cudaDataType.CUDA_C_64F,
+            cuquantum.ComputeType.COMPUTE_64F,
+        ),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _handle():
+    """cuStateVec handle shared by every state, destroyed at exit"""
+    handle = cusv.create()
+    atexit.register(cusv.destroy, handle)
+    return handle
+
+
+class CudaStatevector:
+    """GPU-resident counterpart of omniq.circuit.Statevector
+
+    Results come back to the host only when asked for: get_amplitudes() and
+    probabilities() return NumPy copies, and sampling runs on the device.
+    """
+
+    __slots__ = ("_amplitudes", "_probabilities", "_cdf", "num_qubits")
+
+    device = "cuda"
+
+    def __init__(self, num_qubits=None, amplitudes=None, dtype=np.complex128):
+        if amplitudes is None:
+            amplitudes = cp.zeros(1 << num_qubits, dtype=dtype)
+            amplitudes[0] = 1.0
+        self._amplitudes = cp.ascontiguousarray(cp.asarray(amplitudes, dtype=dtype))
+        # Device-side measurement distribution, built on first use
+        self._probabilities = None
+        self._cdf = None
+        self.num_qubits = self._amplitudes.size.bit_length() - 1
+
+    @property
+    def dtype(self):
+        return self._amplitudes.dtype
+
+    def get_amplitudes(self):
+        """Return a read-only host copy of the amplitudes"""
+        amplitudes = cp.asnumpy(self._amplitudes)
+        amplitudes.flags.writeable = False
+        return amplitudes
+
+    get_amplitudes_view = get_amplitudes
+
+    def astype(self, dtype):
+        """Return a copy with amplitudes stored as ``dtype``, still on the GPU"""
+        return CudaStatevector(amplitudes=self._amplitudes.astype(dtype), dtype=dtype)
+
+    def apply_gate(self, gate_name, qubits, angle=0.0):
+        """Apply a named gate in place, e.g. apply_gate('CNOT', [0, 1])"""
+        matrix, qubits = _named_gate(
+            gate_name, qubits, angle, self.num_qubits, self.dtype
+        )
+        self._apply_matrix(matrix, qubits)
+        return self
+
+    def _apply_matrix(self, matrix, qubits):
+        """Apply a unitary whose most significant index bit is qubits[0]"""
+        n = self.num_qubits
+        matrix = cp.asarray(matrix, dtype=self.dtype)
+        if cusv is None:
+            psi = self._amplitudes.reshape((2,) * n)
+            psi = _apply_matrix_unfold(psi, matrix, [n - 1 - q for q in qubits])
+            self._amplitudes = cp.ascontiguousarray(psi).reshape(-1)
+        else:
+            data_type, compute_type = _CUSV_TYPES[self.dtype]
+            layout = cusv.MatrixLayout.ROW
+            # cuStateVec lists targets from the least significant matrix bit up
+            targets = list(reversed(qubits))
+            size = cusv.apply_matrix_get_workspace_size(
+                _handle(),
+                data_type,
+                n,
+                matrix.data.ptr,
+                data_type,
+                layout,
+                0,
+                len(targets),
+                0,
+                compute_type,
+            )
+            workspace = cp.cuda.alloc(size) if size else None
+            cusv.apply_matrix(
+                _handle(),
+                self._amplitudes.data.ptr,
+                data_type,
+                n,
+                matrix.data.ptr,
+                data_type,
+                layout,
+                0,
+                targets,
+                len(targets),
+                [],
+                [],
+                0,
+                compute_type,
+                workspace.ptr if workspace is not None else 0,
+                size,
+            )
+        self._probabilities = self._cdf = None
+
+    def _device_probabilities(self):
+        if self._probabilities is None:
+            self._probabilities = cp.square(self._amplitudes.real) + cp.square(
+                self._amplitudes.imag
+            )
+        return self._probabilities
+
+    def probabilities(self):
+        """Read-only host copy of the basis-state probabilities"""
+        probabilities = cp.asnumpy(self._device_probabilities())
+        probabilities.flags.writeable = False
+        return probabilities
+
+    def measure(self, qubit, seed=None):
+        """Sample one outcome (0 or 1) of ``qubit`` without collapsing the state"""
+        probabilities = self._device_probabilities()
+        p1 = float(probabilities.reshape(-1, 2, 1 << qubit)[:, 1, :].sum())
+        return int(
+            np.random.default_rng(seed).random() * float(probabilities.sum()) < p1
+        )
+
+    def measure_all(self, shots=1, seed=None):
+        """Sample ``shots`` basis-state indices (int64), drawn on the GPU"""
+        if self._cdf is None:
+            self._cdf = cp.cumsum(self._device_probabilities())
+        draws = cp.random.default_rng(seed).random(shots) * self._cdf[-1]
+        samples = cp.searchsorted(self._cdf, draws, side="right")
+        samples = cp.minimum(samples, self._cdf.size - 1)
+        return cp.asnumpy(samples).astype(np.int64, copy=False)
+
+    def measure_expectation(self, qubit, observable="Z"):
+        """Expectation value of a single-qubit Pauli observable (X, Y or Z)"""
+        psi = self._amplitudes.reshape(-1, 2, 1 << qubit)
+        a0, a1 = psi[:, 0, :], psi[:, 1, :]
+        observable = observable.upper()
+        if observable == "Z":
+            return float(cp.vdot(a0, a0).real - cp.vdot(a1, a1).real)
+        if observable == "X":
+            return float(2.0 * cp.vdot(a0, a1).real)
+        if observable == "Y":
+            return float(2.0 * cp.vdot(a0, a1).imag)
+        raise ValueError(f"Unsupported observable: {observable}")
+
+    def __str__(self):
+        return f"CudaStatevector({self.num_qubits} qubits)"
+
+    def __repr__(self):
+        return self.__str__()
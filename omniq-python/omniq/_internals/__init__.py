@@ -5,50 +5,208 @@ This module contains the low-level bindings to the C++ core.
 It imports classes from the compiled _omniq_core extension.
 """
 
+import functools
+import glob
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+import numpy as np
+
+
+def _load_from_build_tree():
+    """Load _omniq_core straight from a development build directory, if present."""
+    build_dir = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "../../../libomniq-core/build")
+    )
+    suffixes = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+    for directory in (build_dir, os.path.join(build_dir, "lib")):
+        for path in glob.glob(os.path.join(directory, "_omniq_core*")):
+            if not path.endswith(suffixes):
+                continue
+            spec = importlib.util.spec_from_file_location("_omniq_core", path)
+            module = importlib.util.module_from_spec(spec)
+            # Register before executing so later imports reuse this module
+            sys.modules["_omniq_core"] = module
+            try:
+                spec.loader.exec_module(module)
+            except ImportError:
+                del sys.modules["_omniq_core"]
+                continue
+            return module
+    return None
+
+
 try:
     from _omniq_core import Circuit as _Circuit
     from _omniq_core import Statevector as _Statevector
     from _omniq_core import GateType
+    from _omniq_core import CliffordSimulator as _CliffordSimulator
 except ImportError:
-    # Fallback for when the C++ extension is not explicitly installed or in path
-    # Check if we are in development mode and can find the build artifact
-    import sys
-    import os
-    
-    # Try to find the built module in likely build directories
-    possible_paths = [
-        os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../libomniq-core/build")),
-        os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../libomniq-core/build/lib")),
-    ]
-    
-    found = False
-    for path in possible_paths:
-        if os.path.exists(path):
-            sys.path.append(path)
-            try:
-                from _omniq_core import Circuit as _Circuit
-                from _omniq_core import Statevector as _Statevector
-                from _omniq_core import GateType
-                found = True
-                break
-            except ImportError:
-                sys.path.remove(path)
-                continue
-    
-    if not found:
-        raise ImportError("Could not import _omniq_core C++ extension. Please ensure libomniq-core is built.")
+    # Fallback for when the C++ extension is not explicitly installed or in path:
+    # load the build artifact directly rather than extending sys.path
+    _core = _load_from_build_tree()
+    if _core is None:
+        raise ImportError(
+            "Could not import _omniq_core C++ extension. "
+            "Please ensure libomniq-core is built."
+        )
+    _Circuit = _core.Circuit
+    _Statevector = _core.Statevector
+    GateType = _core.GateType
+    _CliffordSimulator = _core.CliffordSimulator
+
+# In-place kernels on Statevector's (re, im) planes; None for an older core build
+_plane_kernels = getattr(sys.modules["_omniq_core"], "planes", None)
+
+# Shared generator for the placeholder samplers below
+_RNG = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=8)
+def _ground_state_matrix(num_qubits):
+    """Shared, read-only |0...0><0...0| density matrix."""
+    matrix = np.zeros((1 << num_qubits, 1 << num_qubits), dtype=np.complex128)
+    matrix[0, 0] = 1.0
+    matrix.flags.writeable = False
+    return matrix
+
 
 # Placeholder implementations for classes not yet bound
 class _DensityMatrix:
     """Placeholder for C++ DensityMatrix class."""
+
+    __slots__ = ("num_qubits", "_matrix")
+
     def __init__(self, num_qubits=0, matrix=None):
         self.num_qubits = num_qubits if matrix is None else len(matrix).bit_length() - 1
-    # ... implementation omitted for brevity, would need real binding ...
+        if matrix is None:
+            self._matrix = _ground_state_matrix(num_qubits)
+        else:
+            self._matrix = np.asarray(matrix, dtype=np.complex128)
+
+    def get_matrix(self):
+        """Return a read-only view of the matrix (copy it to modify)."""
+        view = self._matrix.view()
+        view.flags.writeable = False
+        return view
+
+    def set_matrix(self, matrix):
+        # complex128 ndarrays are stored without conversion
+        self._matrix = np.asarray(matrix, dtype=np.complex128)
+        self.num_qubits = self._matrix.shape[0].bit_length() - 1
+
+    def normalize(self):
+        trace = np.trace(self._matrix)
+        if trace != 0:
+            self._matrix = self._matrix / trace
+
+
+def _grover_schedule(num_qubits, num_solutions):
+    """Return (theta, optimal iterations) for a Grover search.
+
+    Same formula as grover_utils::calculate_optimal_iterations in the core.
+    """
+    if num_qubits <= 0 or num_solutions <= 0:
+        return 0.0, 0
+    ratio = min(1.0, num_solutions / (1 << num_qubits))
+    theta = float(np.arcsin(np.sqrt(ratio)))
+    return theta, max(1, int(np.floor(np.pi / (4.0 * theta) + 0.5)))
+
 
 class _GroversAlgorithm:
     """Placeholder for C++ GroversAlgorithm class."""
-    pass
+
+    __slots__ = (
+        "num_qubits",
+        "oracle",
+        "num_solutions",
+        "iterations",
+        "_rng",
+        "_marked",
+    )
+
+    def __init__(self, num_qubits, oracle, num_solutions=1):
+        self.num_qubits = num_qubits
+        self.oracle = oracle
+        self.num_solutions = num_solutions
+        self.iterations = None
+        self._rng = _RNG
+        self._marked = None
+
+    def set_iterations(self, iterations):
+        self.iterations = iterations
+
+    def _apply_oracle(self, state):
+        target = getattr(self.oracle, "target", None)
+        if target is not None:
+            # Single marked index: negate one amplitude instead of querying
+            # all 2^n states
+            if 0 <= target < state.size:
+                state[target] = -state[target]
+            return
+        if self._marked is None:
+            index = np.arange(state.size)[:, None]
+            bits = (index >> np.arange(self.num_qubits)) & 1
+            self._marked = np.fromiter(
+                (bool(self.oracle(row.tolist())) for row in bits),
+                dtype=bool,
+                count=state.size,
+            )
+        state[self._marked] *= -1
+
+    def _simulate(self):
+        size = 1 << self.num_qubits
+        iterations = self.iterations
+        if iterations is None:
+            _, iterations = _grover_schedule(self.num_qubits, self.num_solutions)
+        # Amplitudes stay real throughout, so a float64 vector is enough
+        state = np.full(size, size**-0.5)
+        for _ in range(iterations):
+            self._apply_oracle(state)
+            # Diffusion operator: inversion about the mean
+            np.subtract(2.0 * state.mean(), state, out=state)
+        return state
+
+    def execute_with_measurements(self, num_shots, seed=None):
+        probabilities = np.square(self._simulate())
+        probabilities /= probabilities.sum()
+        rng = self._rng if seed is None else np.random.default_rng(seed)
+        # Draw all shots into one contiguous int64 buffer
+        shots = rng.choice(probabilities.size, size=num_shots, p=probabilities)
+        return shots.astype(np.int64, copy=False)
+
+    def build_circuit(self):
+        return None
+
 
 class _QPE:
     """Placeholder for C++ QPE class."""
-    pass
+
+    __slots__ = (
+        "num_precision_qubits",
+        "num_eigenstate_qubits",
+        "unitary",
+        "eigenvalues",
+        "eigenstates",
+        "_rng",
+    )
+
+    def __init__(self, num_precision_qubits, num_eigenstate_qubits, unitary):
+        self.num_precision_qubits = num_precision_qubits
+        self.num_eigenstate_qubits = num_eigenstate_qubits
+        self.unitary = unitary
+        self.eigenvalues = []
+        self.eigenstates = []
+        self._rng = _RNG
+
+    def set_eigenvalues_and_states(self, eigenvalues, eigenstates):
+        self.eigenvalues = eigenvalues
+        self.eigenstates = eigenstates
+
+    def execute_with_measurements(self, num_shots):
+        return self._rng.random(size=num_shots)
+
+    def build_circuit(self):
+        return None
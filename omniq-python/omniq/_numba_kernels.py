@@ -0,0 +1,39 @@
+"""
+Numba-compiled statevector kernels.
+
+Only importable with numba installed (the ``jit`` extra). The kernels update
+the real and imaginary planes used by Statevector.apply_gate in place; bit k
+of an amplitude's index is qubit k.
+"""
+
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def apply_1q(re, im, a, b, c, d, target):
+    """Apply the single-qubit gate [[a, b], [c, d]] to ``target``"""
+    stride = 1 << target
+    low_mask = stride - 1
+    for p in prange(re.size >> 1):
+        # Insert a zero at bit ``target`` to get the |0> index of pair p
+        lo = ((p >> target) << (target + 1)) | (p & low_mask)
+        hi = lo | stride
+        r0, i0, r1, i1 = re[lo], im[lo], re[hi], im[hi]
+        re[lo] = a.real * r0 - a.imag * i0 + b.real * r1 - b.imag * i1
+        im[lo] = a.real * i0 + a.imag * r0 + b.real * i1 + b.imag * r1
+        re[hi] = c.real * r0 - c.imag * i0 + d.real * r1 - d.imag * i1
+        im[hi] = c.real * i0 + c.imag * r0 + d.real * i1 + d.imag * r1
+
+
+@njit(cache=True, parallel=True)
+def apply_cnot(re, im, control, target):
+    """Swap the target's |0> and |1> amplitudes wherever ``control`` is set"""
+    low, high = min(control, target), max(control, target)
+    for p in prange(re.size >> 2):
+        # Insert zeros at both qubit positions, then set the control bit
+        base = ((p >> low) << (low + 1)) | (p & ((1 << low) - 1))
+        base = ((base >> high) << (high + 1)) | (base & ((1 << high) - 1))
+        i = base | (1 << control)
+        j = i | (1 << target)
+        re[i], re[j] = re[j], re[i]
+        im[i], im[j] = im[j], im[i]
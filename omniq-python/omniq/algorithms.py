@@ -4,104 +4,245 @@ Quantum algorithms module for OmniQ.
 Provides Python bindings to quantum algorithms like Grover's and QPE.
 """
 
+import math
+import warnings
 import numpy as np
-from typing import List, Callable, Optional, Union, Dict, Any
-from ._internals import _GroversAlgorithm, _QPE
+from typing import List, Callable, Optional, Union
+from ._internals import _GroversAlgorithm, _QPE, _grover_schedule
+from .circuit import Circuit
+from .noise import _DEPOLARIZING
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    from joblib import Parallel, delayed, effective_n_jobs
+except ImportError:
+    Parallel = None
+
 
 class GroversAlgorithm:
     """
     Grover's algorithm implementation.
-    
+
     This class provides a high-level interface for running Grover's algorithm
     for unstructured search problems.
     """
-    
-    def __init__(self, num_qubits: int, oracle: Callable[[List[int]], bool], num_solutions: int = 1):
+
+    __slots__ = (
+        "_grover",
+        "_oracle",
+        "_marked",
+        "num_qubits",
+        "num_solutions",
+        "_theta",
+        "_optimal_iterations",
+        "_iterations",
+        "_success_probability",
+    )
+
+    def __init__(
+        self,
+        num_qubits: int,
+        oracle: Callable[[List[int]], bool],
+        num_solutions: int = 1,
+    ):
         """
         Initialize Grover's algorithm.
-        
+
         Args:
             num_qubits: Number of qubits in the search space
             oracle: Oracle function that marks solutions
             num_solutions: Number of solutions (for optimal iteration count)
         """
         self._grover = _GroversAlgorithm(num_qubits, oracle, num_solutions)
+        self._oracle = oracle
+        # Boolean mask of marked basis states, built by the noisy path
+        self._marked = None
         self.num_qubits = num_qubits
         self.num_solutions = num_solutions
-    
+        self._recompute_optimal_iterations()
+
+    def _recompute_optimal_iterations(self) -> None:
+        """Refresh the cached iteration count and success probability."""
+        self._theta, self._optimal_iterations = _grover_schedule(
+            self.num_qubits, self.num_solutions
+        )
+        self._iterations = self._optimal_iterations
+        self._update_success_probability()
+
+    def _update_success_probability(self) -> None:
+        self._success_probability = float(
+            np.sin((2 * self._iterations + 1) * self._theta) ** 2
+        )
+
     def set_iterations(self, iterations: int) -> None:
         """
         Set the number of Grover iterations.
-        
+
         Args:
             iterations: Number of iterations
         """
         self._grover.set_iterations(iterations)
-    
+        self._iterations = iterations
+        self._update_success_probability()
+
     def get_optimal_iterations(self) -> int:
         """
         Calculate the optimal number of iterations.
-        
+
         Returns:
             Optimal number of iterations
         """
-        return self._grover.get_optimal_iterations()
-    
-    def execute(self, num_shots: int = 1000) -> List[int]:
+        return self._optimal_iterations
+
+    def execute(
+        self,
+        num_shots: int = 1000,
+        noise_model=None,
+        n_jobs: int = -1,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
         """
         Execute Grover's algorithm with measurements.
-        
+
+        Without noise the circuit is simulated once and every shot is drawn
+        from the final distribution. With a ``noise_model`` each shot is an
+        independent trajectory with its own random Pauli errors, so the shots
+        are split across ``n_jobs`` joblib workers (serially without joblib).
+
         Args:
             num_shots: Number of measurement shots
-            
+            noise_model: Optional NoiseModel; its depolarizing channels act on
+                every qubit after each layer of the circuit. Other channels
+                are ignored with a warning
+            n_jobs: Worker processes for noisy shots (-1 uses every core)
+            seed: Seed for the shots; results do not depend on ``n_jobs``
+
         Returns:
-            List of measurement results
+            Array of measurement results (use ``.tolist()`` for a list)
         """
-        return self._grover.execute_with_measurements(num_shots)
-    
+        if noise_model is None:
+            return self._grover.execute_with_measurements(num_shots, seed)
+        if num_shots <= 0:
+            raise ValueError("Number of shots must be positive")
+        ops, params = noise_model.to_arrays()
+        depolarizing = ops == _DEPOLARIZING
+        if not depolarizing.all():
+            # Relaxation channels need gate durations, which the model does not carry
+            warnings.warn(
+                "Noisy Grover trajectories only model depolarizing channels; "
+                f"ignoring {np.count_nonzero(~depolarizing)} other channel(s)",
+                stacklevel=2,
+            )
+        probability = 1.0 - np.prod(1.0 - params[depolarizing, 0])
+        seeds = np.random.SeedSequence(seed).spawn(num_shots)
+        args = (self.num_qubits, self._marked_states(), self._iterations, probability)
+        jobs = 1 if Parallel is None else min(effective_n_jobs(n_jobs), num_shots)
+        if jobs == 1:
+            return _noisy_grover_shots(*args, seeds)
+        # One contiguous chunk of shots per worker, so results match a serial run
+        bounds = np.linspace(0, num_shots, jobs + 1).astype(int).tolist()
+        chunks = [seeds[a:b] for a, b in zip(bounds, bounds[1:])]
+        results = Parallel(n_jobs=jobs, backend="loky")(
+            delayed(_noisy_grover_shots)(*args, chunk) for chunk in chunks
+        )
+        return np.concatenate(results)
+
+    def _marked_states(self) -> np.ndarray:
+        """Boolean mask over basis states accepted by the oracle (computed once)"""
+        if self._marked is None:
+            size = 1 << self.num_qubits
+            target = getattr(self._oracle, "target", None)
+            if target is not None:
+                marked = np.zeros(size, dtype=bool)
+                if 0 <= target < size:
+                    marked[target] = True
+            else:
+                bits = (np.arange(size)[:, None] >> np.arange(self.num_qubits)) & 1
+                marked = np.fromiter(
+                    (bool(self._oracle(row.tolist())) for row in bits),
+                    dtype=bool,
+                    count=size,
+                )
+            self._marked = marked
+        return self._marked
+
+    def most_common(self, results: np.ndarray, k: int = 5) -> List[tuple]:
+        """
+        Most frequent outcomes in ``execute()`` results, like ``Counter.most_common``.
+
+        Args:
+            results: Measurement results from ``execute()``
+            k: Number of outcomes to return
+
+        Returns:
+            Up to ``k`` (outcome, count) pairs, most frequent first
+        """
+        counts = np.bincount(results, minlength=1 << self.num_qubits)
+        k = min(k, np.count_nonzero(counts))
+        if k <= 0:
+            return []
+        # Partial selection of the k largest counts, then sort only those
+        top = np.argpartition(counts, -k)[-k:]
+        top = top[np.argsort(-counts[top], kind="stable")]
+        return list(zip(top.tolist(), counts[top].tolist()))
+
     def get_success_probability(self) -> float:
         """
         Get the theoretical success probability.
-        
+
         Returns:
             Success probability
         """
-        return self._grover.get_success_probability()
-    
+        return self._success_probability
+
     def build_circuit(self):
         """
         Build the complete Grover circuit.
-        
+
         Returns:
             Quantum circuit implementing Grover's algorithm
         """
-        from .circuit import Circuit
-        circuit_data = self._grover.build_circuit()
+        self._grover.build_circuit()
         # Convert C++ circuit to Python circuit
         # This would need proper implementation
         return Circuit(self.num_qubits)
-    
+
     def __str__(self) -> str:
         """String representation of Grover's algorithm."""
-        return f"GroversAlgorithm({self.num_qubits} qubits, {self.num_solutions} solutions)"
-    
+        return (
+            f"GroversAlgorithm({self.num_qubits} qubits, "
+            f"{self.num_solutions} solutions)"
+        )
+
     def __repr__(self) -> str:
         """Detailed string representation of Grover's algorithm."""
-        return f"GroversAlgorithm(num_qubits={self.num_qubits}, num_solutions={self.num_solutions})"
+        return (
+            f"GroversAlgorithm(num_qubits={self.num_qubits}, "
+            f"num_solutions={self.num_solutions})"
+        )
+
 
 class QPE:
     """
     Quantum Phase Estimation implementation.
-    
+
     This class provides a high-level interface for running QPE to estimate
     eigenvalues of unitary operators.
     """
-    
-    def __init__(self, num_precision_qubits: int, num_eigenstate_qubits: int, 
-                 unitary: Callable):
+
+    __slots__ = ("_qpe", "num_precision_qubits", "num_eigenstate_qubits")
+
+    def __init__(
+        self, num_precision_qubits: int, num_eigenstate_qubits: int, unitary: Callable
+    ):
         """
         Initialize QPE.
-        
+
         Args:
             num_precision_qubits: Number of precision qubits
             num_eigenstate_qubits: Number of eigenstate qubits
@@ -110,213 +251,411 @@ class QPE:
         self._qpe = _QPE(num_precision_qubits, num_eigenstate_qubits, unitary)
         self.num_precision_qubits = num_precision_qubits
         self.num_eigenstate_qubits = num_eigenstate_qubits
-    
-    def set_eigenvalues_and_states(self, eigenvalues: List[float], 
-                                 eigenstates: List[complex]) -> None:
+
+    def set_eigenvalues_and_states(
+        self, eigenvalues: List[float], eigenstates: List[complex]
+    ) -> None:
         """
         Set eigenvalues and eigenstates.
-        
+
         Args:
             eigenvalues: List of eigenvalues
             eigenstates: List of eigenstate amplitudes
         """
         self._qpe.set_eigenvalues_and_states(eigenvalues, eigenstates)
-    
-    def execute(self, num_shots: int = 1000) -> List[float]:
+
+    def execute(self, num_shots: int = 1000) -> np.ndarray:
         """
         Execute QPE with measurements.
-        
+
         Args:
             num_shots: Number of measurement shots
-            
+
         Returns:
-            List of phase estimates (normalized to [0, 1))
+            Array of phase estimates (normalized to [0, 1))
         """
         return self._qpe.execute_with_measurements(num_shots)
-    
+
     def build_circuit(self):
         """
         Build the complete QPE circuit.
-        
+
         Returns:
             Quantum circuit implementing QPE
         """
-        from .circuit import Circuit
-        circuit_data = self._qpe.build_circuit()
+        self._qpe.build_circuit()
         # Convert C++ circuit to Python circuit
         # This would need proper implementation
         return Circuit(self.num_precision_qubits + self.num_eigenstate_qubits)
-    
+
     def __str__(self) -> str:
         """String representation of QPE."""
-        return f"QPE({self.num_precision_qubits} precision, {self.num_eigenstate_qubits} eigenstate qubits)"
-    
+        return (
+            f"QPE({self.num_precision_qubits} precision, "
+            f"{self.num_eigenstate_qubits} eigenstate qubits)"
+        )
+
     def __repr__(self) -> str:
         """Detailed string representation of QPE."""
-        return f"QPE(num_precision_qubits={self.num_precision_qubits}, num_eigenstate_qubits={self.num_eigenstate_qubits})"
+        return (
+            f"QPE(num_precision_qubits={self.num_precision_qubits}, "
+            f"num_eigenstate_qubits={self.num_eigenstate_qubits})"
+        )
+
+
+# Noisy Grover trajectories (one state vector per shot)
+def _hadamard_layer(psi, num_qubits):
+    """Apply H to every qubit of psi in place"""
+    for q in range(num_qubits):
+        pairs = psi.reshape(-1, 2, 1 << q)
+        low = pairs[:, 0, :].copy()
+        pairs[:, 0, :] += pairs[:, 1, :]
+        np.subtract(low, pairs[:, 1, :], out=pairs[:, 1, :])
+    psi *= 2.0 ** (-num_qubits / 2)
+
+
+def _depolarize(psi, num_qubits, probability, rng):
+    """Apply a uniformly random X, Y or Z to each qubit with the given probability"""
+    hits = np.flatnonzero(rng.random(num_qubits) < probability)
+    for q, pauli in zip(hits.tolist(), rng.integers(3, size=hits.size).tolist()):
+        pairs = psi.reshape(-1, 2, 1 << q)
+        if pauli == 2:
+            # Z
+            pairs[:, 1, :] *= -1
+            continue
+        # X swaps the halves; Y is X followed by the phases -i (|0>) and i (|1>)
+        pairs[:, ::-1, :] = pairs.copy()
+        if pauli == 1:
+            pairs[:, 0, :] *= -1j
+            pairs[:, 1, :] *= 1j
+
+
+def _noisy_grover_shots(num_qubits, marked, iterations, probability, seeds):
+    """Measure one noisy Grover trajectory per seed"""
+    results = np.empty(len(seeds), dtype=np.int64)
+    for shot, seed in enumerate(seeds):
+        rng = np.random.default_rng(seed)
+        psi = np.zeros(1 << num_qubits, dtype=np.complex128)
+        psi[0] = 1.0
+        _hadamard_layer(psi, num_qubits)
+        _depolarize(psi, num_qubits, probability, rng)
+        for _ in range(iterations):
+            psi[marked] *= -1
+            _depolarize(psi, num_qubits, probability, rng)
+            # Diffusion: H, phase-flip every state but |0>, H (up to global phase)
+            _hadamard_layer(psi, num_qubits)
+            psi[1:] *= -1
+            _hadamard_layer(psi, num_qubits)
+            _depolarize(psi, num_qubits, probability, rng)
+        cdf = np.cumsum(np.square(psi.real) + np.square(psi.imag))
+        results[shot] = min(
+            np.searchsorted(cdf, rng.random() * cdf[-1], side="right"), cdf.size - 1
+        )
+    return results
+
 
 # Utility functions for creating oracles
-def create_database_oracle(target_value: int) -> Callable[[List[int]], bool]:
+def _sat_eval(pos, neg, x):
+    """Return True if assignment x satisfies every (pos, neg) clause mask."""
+    for i in range(pos.size):
+        if (pos[i] & x) == 0 and (neg[i] & ~x) == 0:
+            return False
+    return True
+
+
+def _sat_eval_batch(pos, neg, xs):
+    """Evaluate _sat_eval for every assignment in xs."""
+    out = np.empty(xs.size, dtype=np.bool_)
+    for j in prange(xs.size):
+        out[j] = _sat_eval(pos, neg, xs[j])
+    return out
+
+
+if njit is not None:
+    _sat_eval = njit(cache=True)(_sat_eval)
+    _sat_eval_batch = njit(cache=True, parallel=True)(_sat_eval_batch)
+
+
+def _bits_to_int(input_bits: Union[int, List[int], np.ndarray]) -> int:
+    """Interpret a little-endian bit sequence (or an int) as an integer."""
+    if isinstance(input_bits, (int, np.integer)):
+        return int(input_bits)
+    # Pack the bits into bytes and read them as one integer
+    packed = np.packbits(np.asarray(input_bits, dtype=bool), bitorder="little")
+    return int.from_bytes(packed.tobytes(), "little")
+
+
+class DatabaseOracle:
+    """
+    Oracle marking the single basis state ``target``.
+
+    Simulators can read ``target`` to phase-flip that amplitude directly
+    instead of evaluating the oracle on every basis state.
+    """
+
+    __slots__ = ("target",)
+
+    def __init__(self, target: int):
+        self.target = target
+
+    def __call__(self, input_bits: Union[int, List[int], np.ndarray]) -> bool:
+        return _bits_to_int(input_bits) == self.target
+
+    def batch(self, bits: np.ndarray) -> np.ndarray:
+        """Evaluate a 2D ``(n_candidates, n_bits)`` array, returning a bool array."""
+        bits = np.asarray(bits, dtype=bool)
+        if bits.shape[-1] > 64:
+            raise ValueError(
+                "Batched evaluation supports at most 64 bits per candidate"
+            )
+        # Pack each row into bytes, pad to 8 and reinterpret as one uint64
+        packed = np.packbits(bits, axis=-1, bitorder="little")
+        words = np.zeros(bits.shape[:-1] + (8,), dtype=np.uint8)
+        words[..., : packed.shape[-1]] = packed
+        return words.view("<u8")[..., 0] == self.target
+
+    def __repr__(self) -> str:
+        return f"DatabaseOracle(target={self.target})"
+
+
+def create_database_oracle(target_value: int) -> DatabaseOracle:
     """
     Create a simple oracle for database search.
-    
+
     Args:
         target_value: The value to search for
-        
+
     Returns:
-        Oracle function
+        Oracle object. It accepts an integer or a little-endian bit
+        sequence; ``oracle.batch(bits)`` evaluates a 2D
+        ``(n_candidates, n_bits)`` array at once and returns a bool array.
     """
-    def oracle(input_bits: List[int]) -> bool:
-        # Convert binary input to integer
-        value = 0
-        for i, bit in enumerate(input_bits):
-            value |= (bit << i)
-        return value == target_value
-    
-    return oracle
+    return DatabaseOracle(target_value)
+
 
-def create_sat_oracle(clauses: List[List[int]], num_variables: int) -> Callable[[List[int]], bool]:
+def create_sat_oracle(
+    clauses: List[List[int]], num_variables: int
+) -> Callable[[List[int]], bool]:
     """
     Create an oracle for SAT problems.
-    
+
     Args:
         clauses: List of clauses (each clause is a list of literals)
         num_variables: Number of variables
-        
+
     Returns:
-        Oracle function
+        Oracle function. ``oracle.batch(assignments)`` evaluates an array of
+        packed uint64 assignments (bit i = variable i+1) and returns a bool
+        array.
     """
-    def oracle(input_bits: List[int]) -> bool:
-        # Check if the assignment satisfies all clauses
-        for clause in clauses:
-            clause_satisfied = False
-            for literal in clause:
-                var = abs(literal) - 1  # Variables are 1-indexed in DIMACS format
-                if var >= num_variables:
-                    continue
-                
-                var_value = input_bits[var] if var < len(input_bits) else False
-                literal_value = var_value if literal > 0 else not var_value
-                
-                if literal_value:
-                    clause_satisfied = True
-                    break
-            
-            if not clause_satisfied:
-                return False  # This clause is not satisfied
-        
-        return True  # All clauses are satisfied
-    
+    # Compile each clause into positive- and negative-literal bitmasks; a
+    # clause holds when (pos & x) | (neg & ~x) is non-zero
+    pos_masks = []
+    neg_masks = []
+    for clause in clauses:
+        pos = neg = 0
+        for literal in clause:
+            var = abs(literal) - 1  # Variables are 1-indexed in DIMACS format
+            if var >= num_variables:
+                continue
+            if literal > 0:
+                pos |= 1 << var
+            else:
+                neg |= 1 << var
+        pos_masks.append(pos)
+        neg_masks.append(neg)
+
+    vectorized = num_variables <= 64
+    if vectorized:
+        pos_array = np.array(pos_masks, dtype=np.uint64)
+        neg_array = np.array(neg_masks, dtype=np.uint64)
+
+    def oracle(input_bits: Union[int, List[int], np.ndarray]) -> bool:
+        # Unassigned variables read as False
+        x = _bits_to_int(input_bits)
+        if vectorized:
+            x = np.uint64(x & 0xFFFFFFFFFFFFFFFF)
+            if njit is not None:
+                return bool(_sat_eval(pos_array, neg_array, x))
+            return bool((((pos_array & x) | (neg_array & ~x)) != 0).all())
+        return all((pos & x) or (neg & ~x) for pos, neg in zip(pos_masks, neg_masks))
+
+    def oracle_batch(assignments: np.ndarray) -> np.ndarray:
+        if not vectorized:
+            raise ValueError("Batched evaluation supports at most 64 variables")
+        x = np.asarray(assignments, dtype=np.uint64)
+        if njit is not None:
+            return _sat_eval_batch(pos_array, neg_array, x.ravel()).reshape(x.shape)
+        x = x[..., np.newaxis]
+        return (((pos_array & x) | (neg_array & ~x)) != 0).all(axis=-1)
+
+    oracle.batch = oracle_batch
     return oracle
 
-def create_graph_coloring_oracle(edges: List[tuple], num_vertices: int, 
-                               num_colors: int) -> Callable[[List[int]], bool]:
+
+def create_graph_coloring_oracle(
+    edges: List[tuple], num_vertices: int, num_colors: int
+) -> Callable[[List[int]], bool]:
     """
     Create an oracle for graph coloring problems.
-    
+
     Args:
         edges: List of edges as (vertex1, vertex2) tuples
         num_vertices: Number of vertices
         num_colors: Number of colors
-        
+
     Returns:
         Oracle function
     """
+    # Edge endpoints as parallel index arrays, dropping out-of-range vertices
+    in_range = [(a, b) for a, b in edges if a < num_vertices and b < num_vertices]
+    v1 = np.fromiter((a for a, _ in in_range), dtype=np.int64, count=len(in_range))
+    v2 = np.fromiter((b for _, b in in_range), dtype=np.int64, count=len(in_range))
+    size = num_vertices * num_colors
+
     def oracle(input_bits: List[int]) -> bool:
-        # Check if the coloring is valid (no adjacent vertices have the same color)
-        for v1, v2 in edges:
-            if v1 >= num_vertices or v2 >= num_vertices:
-                continue
-            
-            # Calculate color indices in the input
-            color1_idx = v1 * num_colors
-            color2_idx = v2 * num_colors
-            
-            # Find the assigned colors
-            color1 = -1
-            color2 = -1
-            for c in range(num_colors):
-                if color1_idx + c < len(input_bits) and input_bits[color1_idx + c]:
-                    color1 = c
-                if color2_idx + c < len(input_bits) and input_bits[color2_idx + c]:
-                    color2 = c
-            
-            # Check if adjacent vertices have the same color
-            if color1 == color2 and color1 != -1:
-                return False  # Invalid coloring
-        
-        return True  # Valid coloring
-    
+        # One-hot color bits per vertex; missing bits read as unset
+        bits = np.zeros(size, dtype=bool)
+        given = np.asarray(input_bits, dtype=bool)[:size]
+        bits[: given.size] = given
+        bits = bits.reshape(num_vertices, num_colors)
+
+        # The highest set bit wins when a vertex has several colors
+        colors = num_colors - 1 - bits[:, ::-1].argmax(axis=1)
+        colored = bits.any(axis=1)
+
+        # Invalid if any adjacent colored vertices share a color
+        clash = colored[v1] & colored[v2] & (colors[v1] == colors[v2])
+        return not clash.any()
+
     return oracle
 
+
 # Utility functions for QPE
 def create_phase_rotation_unitary(phase: float) -> Callable:
     """
     Create a simple phase rotation unitary.
-    
+
     Args:
         phase: Phase to rotate by
-        
+
     Returns:
         Unitary operator function
     """
+
     def unitary(state, start_qubit):
         # This would apply the phase rotation to the state
         # Implementation depends on the state representation
         pass
-    
+
     return unitary
 
+
 def phase_to_eigenvalue(phase_measurement: float, num_precision_qubits: int) -> float:
     """
     Convert phase measurement to eigenvalue.
-    
+
     Args:
         phase_measurement: Phase measurement (normalized to [0, 1))
         num_precision_qubits: Number of precision qubits
-        
+
     Returns:
         Eigenvalue
     """
     return 2.0 * np.pi * phase_measurement
 
+
 def eigenvalue_to_phase(eigenvalue: float, num_precision_qubits: int) -> float:
     """
     Convert eigenvalue to phase.
-    
+
     Args:
         eigenvalue: Eigenvalue
         num_precision_qubits: Number of precision qubits
-        
+
     Returns:
         Phase (normalized to [0, 1))
     """
     phase = eigenvalue / (2.0 * np.pi)
     return phase - np.floor(phase)  # Ensure phase is in [0, 1)
 
+
+def phases_to_eigenvalues(phases: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of phase measurements to eigenvalues.
+
+    Args:
+        phases: Phase measurements (normalized to [0, 1)), e.g. from QPE.execute
+
+    Returns:
+        Array of eigenvalues
+    """
+    return (2.0 * np.pi) * np.asarray(phases, dtype=float)
+
+
+def eigenvalues_to_phases(eigenvalues: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of eigenvalues to phases.
+
+    Args:
+        eigenvalues: Eigenvalues
+
+    Returns:
+        Array of phases (normalized to [0, 1))
+    """
+    phases = np.asarray(eigenvalues, dtype=float) / (2.0 * np.pi)
+    phases -= np.floor(phases)
+    return phases
+
+
 def estimate_precision(num_precision_qubits: int) -> float:
     """
     Estimate precision of QPE.
-    
+
     Args:
         num_precision_qubits: Number of precision qubits
-        
+
     Returns:
         Precision in bits
     """
     return float(num_precision_qubits)
 
-def calculate_success_probability(num_precision_qubits: int, true_phase: float) -> float:
+
+def calculate_success_probabilities(
+    num_precision_qubits: int, true_phases: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate success probabilities for many phases at once.
+
+    Args:
+        num_precision_qubits: Number of precision qubits
+        true_phases: Array of true phase values
+
+    Returns:
+        Array of success probabilities
+    """
+    true_phases = np.asarray(true_phases, dtype=float)
+    phases = true_phases / (2.0 * np.pi)
+    phases -= np.floor(phases)
+    phase_error = np.abs(true_phases - phases)
+    return np.cos(np.pi * phase_error * (1 << num_precision_qubits)) ** 2
+
+
+def calculate_success_probability(
+    num_precision_qubits: int, true_phase: float
+) -> float:
     """
     Calculate success probability for given precision.
-    
+
     Args:
         num_precision_qubits: Number of precision qubits
         true_phase: True phase value
-        
+
     Returns:
         Success probability
     """
-    phase_error = abs(true_phase - eigenvalue_to_phase(true_phase, num_precision_qubits))
-    success_prob = np.cos(np.pi * phase_error * (1 << num_precision_qubits))
-    return success_prob ** 2 
\ No newline at end of file
+    # Scalar path in plain math; mirrors calculate_success_probabilities
+    phase = true_phase / (2.0 * math.pi)
+    phase_error = abs(true_phase - (phase - math.floor(phase)))
+    c = math.cos(math.pi * phase_error * (1 << num_precision_qubits))
+    return c * c
@@ -2,109 +2,1631 @@
 Basic Circuit class for OmniQ debugger demo
 """
 
+import functools
+import math
+import os
+import string
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    import opt_einsum as oe
+except ImportError:
+    oe = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import quimb.tensor as qtn
+except ImportError:
+    qtn = None
+
+try:
+    import cotengra as ctg
+except ImportError:
+    ctg = None
+
+_SQRT1_2 = 1.0 / np.sqrt(2.0)
+
+# Fixed gate unitaries; for two-qubit gates the first listed qubit is the
+# most significant bit of the matrix index
+_FIXED_GATES = {
+    "H": np.array([[1, 1], [1, -1]], dtype=np.complex128) * _SQRT1_2,
+    "X": np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    "Z": np.array([[1, 0], [0, -1]], dtype=np.complex128),
+    "CNOT": np.array(
+        [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=np.complex128
+    ),
+    "SWAP": np.array(
+        [[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=np.complex128
+    ),
+}
+
+
+def _rx(angle):
+    c, s = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+
+
+def _ry(angle):
+    c, s = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array([[c, -s], [s, c]], dtype=np.complex128)
+
+
+def _rz(angle):
+    return np.diag([np.exp(-0.5j * angle), np.exp(0.5j * angle)])
+
+
+def _phase(angle):
+    return np.diag([1.0, np.exp(1j * angle)])
+
+
+def _cphase(angle):
+    return np.diag([1.0, 1.0, 1.0, np.exp(1j * angle)])
+
+
+_PARAMETRIC_GATES = {"RX": _rx, "RY": _ry, "RZ": _rz, "PHASE": _phase}
+
+_IDENTITY_2 = np.eye(2, dtype=np.complex128)
+_SWAP_QUBITS = _FIXED_GATES["SWAP"]
+
+
+# Gate op codes follow the C++ omniq::GateType enum
+_GATE_NAMES = ("H", "X", "Y", "Z", "CNOT", "SWAP", "PHASE", "RX", "RY", "RZ", "CP")
+_GATE_CODES = {name: code for code, name in enumerate(_GATE_NAMES)}
+(
+    _OP_H,
+    _OP_X,
+    _OP_Y,
+    _OP_Z,
+    _OP_CNOT,
+    _OP_SWAP,
+    _OP_PHASE,
+    _OP_RX,
+    _OP_RY,
+    _OP_RZ,
+    _OP_CP,
+) = range(len(_GATE_NAMES))
+_TWO_QUBIT_CODES = np.array(
+    [_GATE_CODES[n] for n in ("CNOT", "SWAP", "CP")], dtype=np.uint8
+)
+_PARAMETER_CODES = np.array(
+    [_GATE_CODES[n] for n in ("PHASE", "RX", "RY", "RZ", "CP")], dtype=np.uint8
+)
+
+
+# Record layout accepted by Circuit.add_gates; q1 is -1 for single-qubit gates
+GATE_DTYPE = np.dtype(
+    [("op", np.uint8), ("q0", np.int32), ("q1", np.int32), ("angle", np.float64)]
+)
+
+# Compiled ansatz layout: pidx indexes the parameter vector, -1 for a fixed angle
+BYTECODE_DTYPE = np.dtype(
+    [("op", np.uint8), ("q0", np.int32), ("q1", np.int32), ("pidx", np.int32)]
+)
+
+
+# Circuit.add_gate routing: upper-case gate name -> fn(circuit, qubits, angle)
+_GATE_DISPATCH = {
+    "H": lambda c, q, a: c.h(q[0]),
+    "X": lambda c, q, a: c.x(q[0]),
+    "Y": lambda c, q, a: c.y(q[0]),
+    "Z": lambda c, q, a: c.z(q[0]),
+    "CNOT": lambda c, q, a: c.cx(q[0], q[1]),
+    "CX": lambda c, q, a: c.cx(q[0], q[1]),
+    "SWAP": lambda c, q, a: c.swap(q[0], q[1]),
+    "RX": lambda c, q, a: c.rx(q[0], a),
+    "RY": lambda c, q, a: c.ry(q[0], a),
+    "RZ": lambda c, q, a: c.rz(q[0], a),
+    "PHASE": lambda c, q, a: c.phase(q[0], a),
+    "CP": lambda c, q, a: c.cp(a, q[0], q[1]),
+}
+
+# Canonical (already upper-case) names, checked before falling back to .upper()
+_CANONICAL_GATE_NAMES = frozenset(_GATE_DISPATCH)
+
+
+# Parametric gates are Clifford when the angle is a whole number of these steps
+_CLIFFORD_STEPS = {_GATE_CODES[n]: math.pi / 2 for n in ("PHASE", "RX", "RY", "RZ")}
+_CLIFFORD_STEPS[_GATE_CODES["CP"]] = math.pi
+_CLIFFORD_TOLERANCE = 1e-9
+
+
+def _is_clifford_gate(code, parameter):
+    step = _CLIFFORD_STEPS.get(code)
+    if step is None:
+        return True
+    turns = parameter / step
+    return abs(turns - round(turns)) * step < _CLIFFORD_TOLERANCE
+
+
+def _all_clifford(ops, params):
+    """Vectorized _is_clifford_gate over whole gate columns"""
+    step = np.array(
+        [_CLIFFORD_STEPS.get(code, 0.0) for code in range(len(_GATE_NAMES))]
+    )[ops]
+    parametric = step > 0
+    turns = params[parametric] / step[parametric]
+    return bool(
+        np.all(np.abs(turns - np.round(turns)) * step[parametric] < _CLIFFORD_TOLERANCE)
+    )
+
+
+# OpenQASM 2.0 line per op code, formatted with (qubit0, qubit1, parameter);
+# mirrors Circuit::gateToString in the C++ core
+_QASM_FORMATS = (
+    "h q[{0}];",
+    "x q[{0}];",
+    "y q[{0}];",
+    "z q[{0}];",
+    "cx q[{0}], q[{1}];",
+    "swap q[{0}], q[{1}];",
+    "u1({2:.6f}) q[{0}];",
+    "rx({2:.6f}) q[{0}];",
+    "ry({2:.6f}) q[{0}];",
+    "rz({2:.6f}) q[{0}];",
+    "cp({2:.6f}) q[{0}], q[{1}];",
+)
+
+
+# One gate in attribute-access form; q1 and param are None when unused
+GateRecord = namedtuple(
+    "GateRecord", "op q0 q1 param step", defaults=(None, None, None)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _gate_matrix(code, parameter=0.0, dtype=np.complex128):
+    """Shared, read-only, C-contiguous unitary for one gate op code
+
+    Built in complex128 and rounded once to ``dtype``, so complex64 states
+    reuse a cached single-precision copy instead of casting per gate.
+    """
+    name = _GATE_NAMES[code]
+    if name == "CP":
+        matrix = _cphase(parameter)
+    elif name in _PARAMETRIC_GATES:
+        matrix = _PARAMETRIC_GATES[name](parameter)
+    else:
+        matrix = _FIXED_GATES[name]
+    matrix = np.ascontiguousarray(matrix, dtype=dtype)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _gate_operation(code, qubit0, qubit1, parameter, dtype=np.complex128):
+    """Return (unitary, qubits) for one row of the gate columns"""
+    if code in _CLIFFORD_STEPS:
+        # Only parametric gates key the cache on their angle
+        matrix = _gate_matrix(code, float(parameter), dtype)
+    else:
+        matrix = _gate_matrix(code, 0.0, dtype)
+    if _GATE_NAMES[code] in ("CNOT", "SWAP", "CP"):
+        return matrix, (qubit0, qubit1)
+    return matrix, (qubit0,)
+
+
+def _gate_tuple(code, qubit0, qubit1, parameter):
+    """Legacy tuple form of one gate, e.g. ('RX', q, angle) or ('CP', c, t, angle)"""
+    name = _GATE_NAMES[code]
+    if name == "CP":
+        return (name, qubit0, qubit1, parameter)
+    if name in ("CNOT", "SWAP"):
+        return (name, qubit0, qubit1)
+    if name in _PARAMETRIC_GATES:
+        return (name, qubit0, parameter)
+    return (name, qubit0)
+
+
+# Below this width the tensor-network setup costs more than it saves
+_TN_MIN_QUBITS = 20
+
+
+@functools.lru_cache(maxsize=1)
+def _tn_optimizer():
+    """Shared contraction-path optimizer for the tensor-network backend
+
+    cotengra's reusable optimizer caches each path under a hash of the
+    network structure, so parameter sweeps over the same gate layout skip
+    the path search after the first call.
+    """
+    if ctg is None:
+        return "auto-hq"
+    return ctg.ReusableHyperOptimizer(max_repeats=16, progbar=False)
+
+
+def _tn_tensors(operations, wires, side, output_inds, conjugate=False):
+    """quimb tensors for |psi> (or <psi| when ``conjugate``) starting from |0...0>
+
+    Indices are named by (wire, time); the last index on each wire is taken
+    from ``output_inds`` so bra and ket can share or separate them.
+    """
+    depth = dict.fromkeys(wires, 0)
+    for _, qubits in operations:
+        for q in qubits:
+            depth[q] += 1
+
+    def ind(q, t):
+        return output_inds[q] if t == depth[q] else f"{side}{q}_{t}"
+
+    zero = np.array([1.0, 0.0], dtype=np.complex128)
+    tensors = [qtn.Tensor(zero, inds=(ind(q, 0),)) for q in wires]
+    time = dict.fromkeys(wires, 0)
+    for matrix, qubits in operations:
+        inputs = tuple(ind(q, time[q]) for q in qubits)
+        for q in qubits:
+            time[q] += 1
+        outputs = tuple(ind(q, time[q]) for q in qubits)
+        data = matrix.conj() if conjugate else matrix
+        tensors.append(
+            qtn.Tensor(data.reshape((2,) * (2 * len(qubits))), inds=outputs + inputs)
+        )
+    return tensors
+
+
+@functools.lru_cache(maxsize=256)
+def _unfold_permutation(axes, ndim):
+    """(forward, inverse) transposes that bring ``axes`` to the front, in order"""
+    forward = axes + tuple(axis for axis in range(ndim) if axis not in axes)
+    return forward, tuple(np.argsort(forward).tolist())
+
+
+def _apply_matrix_unfold(tensor, matrix, axes):
+    """Apply a k-qubit unitary to ``axes`` of a (2, 2, ...) tensor as one matmul
+
+    The target axes are moved to the front and the tensor unfolded to
+    (2^k, -1), so the product runs as a single BLAS GEMM; the first axis in
+    ``axes`` is the most significant bit of the matrix index.
+    """
+    forward, inverse = _unfold_permutation(tuple(axes), tensor.ndim)
+    unfolded = tensor.transpose(forward).reshape(1 << len(axes), -1)
+    return (matrix @ unfolded).reshape(tensor.shape).transpose(inverse)
+
+
+# Widest unitary built by block fusion (OMNIQ_FUSE_LEVEL=3)
+_MAX_FUSED_QUBITS = 4
+
+
+def _fused_unitary(rows, wires, dtype=np.complex128):
+    """Read-only product of a gate-row sequence acting on ``wires``
+
+    The first of ``wires`` is the most significant bit of the matrix index.
+    The product is always accumulated in complex128, then stored as ``dtype``.
+    """
+    k = len(wires)
+    # Identity as a (2,) * 2k tensor; gates act on the k row axes
+    unitary = np.eye(1 << k, dtype=np.complex128).reshape((2,) * (2 * k))
+    for row in rows:
+        matrix, qubits = _gate_operation(*row)
+        unitary = _apply_matrix_unfold(
+            unitary, matrix, [wires.index(q) for q in qubits]
+        )
+    unitary = np.ascontiguousarray(unitary.reshape(1 << k, 1 << k), dtype=dtype)
+    unitary.flags.writeable = False
+    return unitary
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_fused_unitary(rows, wires, dtype=np.complex128):
+    """Shared ``_fused_unitary`` for blocks without parametric gates
+
+    Blocks holding angles are not cached: in a parameter sweep every call
+    would miss and evict the fixed blocks that do repeat.
+    """
+    return _fused_unitary(rows, wires, dtype)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sub_slice(axes, bits, ndim):
+    """Index of the sub-tensor where each of ``axes`` holds the matching bit
+
+    Length-1 slices rather than integers keep every selection a view, even
+    for a one-qubit tensor.
+    """
+    index = [slice(None)] * ndim
+    for axis, bit in zip(axes, bits):
+        index[axis] = slice(bit, bit + 1)
+    return tuple(index)
+
+
+def _swap_slices(psi, first, second):
+    saved = psi[first].copy()
+    psi[first] = psi[second]
+    psi[second] = saved
+
+
+def _aligned_empty(shape, dtype, align=64):
+    """Uninitialized array whose data starts on an ``align``-byte boundary
+
+    Keeps the SIMD loads of the gate kernels from straddling cache lines.
+    """
+    dtype = np.dtype(dtype)
+    nbytes = math.prod(shape) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -raw.ctypes.data % align
+    return raw[offset : offset + nbytes].view(dtype).reshape(shape)
+
+
+def _apply_gate_kernel(psi, buffer, matrix, axes):
+    """Apply a unitary to ``axes`` of ``psi`` and return the new state tensor
+
+    Diagonal gates scale slices of ``psi`` in place, X-like gates and H
+    write a single pass into ``buffer`` (allocated if None), CNOT and SWAP
+    swap slices in place; other matrices use the unfold + matmul kernel.
+    The result is ``psi``, ``buffer`` or a new array, and ``psi`` may be
+    overwritten in any case, so it must be owned by the caller.
+    """
+    ndim = psi.ndim
+    axes = tuple(axes)
+    if len(axes) == 1:
+        zero, one = _sub_slice(axes, (0,), ndim), _sub_slice(axes, (1,), ndim)
+        m00, m01, m10, m11 = matrix.ravel().tolist()
+        if m01 == 0 and m10 == 0:
+            if m00 != 1:
+                psi[zero] *= m00
+            if m11 != 1:
+                psi[one] *= m11
+            return psi
+        if buffer is None:
+            buffer = _aligned_empty(psi.shape, psi.dtype)
+        if m00 == 0 and m11 == 0:
+            np.multiply(psi[one], m01, out=buffer[zero])
+            np.multiply(psi[zero], m10, out=buffer[one])
+            return buffer
+        if m00 == m01 == m10 == -m11:
+            # Hadamard up to scale: sum and difference of the two halves
+            np.add(psi[zero], psi[one], out=buffer[zero])
+            np.subtract(psi[zero], psi[one], out=buffer[one])
+            buffer *= m00
+            return buffer
+    elif len(axes) == 2:
+        diagonal = np.diagonal(matrix)
+        if np.count_nonzero(matrix) == np.count_nonzero(diagonal):
+            for bits, factor in zip(
+                ((0, 0), (0, 1), (1, 0), (1, 1)), diagonal.tolist()
+            ):
+                if factor != 1:
+                    psi[_sub_slice(axes, bits, ndim)] *= factor
+            return psi
+        if np.array_equal(matrix, _FIXED_GATES["CNOT"]):
+            _swap_slices(
+                psi, _sub_slice(axes, (1, 0), ndim), _sub_slice(axes, (1, 1), ndim)
+            )
+            return psi
+        if np.array_equal(matrix, _SWAP_QUBITS):
+            _swap_slices(
+                psi, _sub_slice(axes, (0, 1), ndim), _sub_slice(axes, (1, 0), ndim)
+            )
+            return psi
+    return _apply_matrix_unfold(psi, matrix, axes)
+
+
+# apply_gate hands single-qubit gates and CNOTs on states at least this
+# wide to the C++ plane kernels, or the numba ones when numba is installed
+_KERNEL_MIN_QUBITS = 8
+
+
+# Device names that select the CuPy backend (omniq._cuda)
+_CUDA_DEVICES = frozenset({"cuda", "cuda.qubit"})
+
+
+def _on_cuda(device):
+    """True if ``device``, or omniq.DEFAULT_DEVICE when None, is a CUDA device"""
+    if device is None:
+        from . import DEFAULT_DEVICE as device
+    return device in _CUDA_DEVICES
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cuda_backend():
+    """Import omniq._cuda on first use, so CuPy loads only when a GPU state is made"""
+    try:
+        from . import _cuda
+    except ImportError as exc:
+        raise ImportError("CuPy is required for the 'cuda' device") from exc
+    return _cuda
+
+
+@functools.lru_cache(maxsize=1)
+def _load_native_kernels():
+    """The C++ core's SIMD plane kernels (None if the extension is not built)
+
+    They share the apply_1q / apply_cnot interface of omniq._numba_kernels,
+    with float64 and float32 overloads picked by the planes' dtype.
+    """
+    try:
+        from ._internals import _plane_kernels
+    except ImportError:
+        return None
+    return _plane_kernels
+
+
+@functools.lru_cache(maxsize=1)
+def _load_numba_kernels():
+    """Import omniq._numba_kernels on first use (None without numba)
+
+    Deferred so that ``import omniq`` does not pay for importing numba.
+    """
+    try:
+        from . import _numba_kernels
+    except ImportError:
+        return None
+    return _numba_kernels
+
+
+def _apply_gate_planes(planes, matrix, axes, buffer=None):
+    """Apply a unitary to ``axes`` of a (re, im) plane tensor; axis 0 selects the plane
+
+    A real matrix acts on both planes alike, so it runs through the real
+    slice and matmul kernels with half the arithmetic of complex storage.
+    A complex diagonal rotates the (re, im) pairs of each slice in place, and
+    any other complex matrix A + iB is applied as the real block matrix
+    [[A, -B], [B, A]] over the plane axis and the target axes. ``buffer``
+    is passed on to _apply_gate_kernel.
+    """
+    if not matrix.imag.any():
+        return _apply_gate_kernel(
+            planes, buffer, matrix.real.astype(planes.dtype), axes
+        )
+    ndim = planes.ndim
+    axes = tuple(axes)
+    diagonal = np.diagonal(matrix)
+    if np.count_nonzero(matrix) == np.count_nonzero(diagonal):
+        bits = ((0,), (1,)) if len(axes) == 1 else ((0, 0), (0, 1), (1, 0), (1, 1))
+        for bit, factor in zip(bits, diagonal.tolist()):
+            if factor == 1:
+                continue
+            re = planes[_sub_slice((0,) + axes, (0,) + bit, ndim)]
+            im = planes[_sub_slice((0,) + axes, (1,) + bit, ndim)]
+            saved = re.copy()
+            re *= factor.real
+            re -= factor.imag * im
+            im *= factor.real
+            im += factor.imag * saved
+        return planes
+    block = np.block([[matrix.real, -matrix.imag], [matrix.imag, matrix.real]])
+    return _apply_matrix_unfold(planes, block.astype(planes.dtype), (0,) + axes)
+
+
+def _named_gate(gate_name, qubits, angle, num_qubits, dtype=np.complex128):
+    """Return (unitary, qubits) for e.g. ('CNOT', [control, target]) after validation"""
+    name = gate_name.upper()
+    name = "CNOT" if name == "CX" else name
+    if name not in _GATE_CODES:
+        raise ValueError(f"Unknown gate: {gate_name}")
+    qubits = [qubits] if isinstance(qubits, (int, np.integer)) else list(qubits)
+    for qubit in qubits:
+        if not 0 <= qubit < num_qubits:
+            raise ValueError(f"Qubit {qubit} out of range for {num_qubits} qubits")
+    return _gate_operation(
+        _GATE_CODES[name], qubits[0], qubits[1] if len(qubits) > 1 else -1, angle, dtype
+    )
+
+
+class Statevector:
+    """State vector produced by Circuit.execute()
+
+    Amplitudes are held as one complex array, as separate real and
+    imaginary planes (structure of arrays, used by apply_gate), or both;
+    each form is built from the other on demand and kept until the state
+    changes. ``device='cuda'`` returns an omniq._cuda.CudaStatevector with
+    the same interface whose amplitudes live on the GPU (requires CuPy).
+    """
+
+    __slots__ = (
+        "_amplitudes",
+        "_planes",
+        "_spare",
+        "_probabilities",
+        "_cdf",
+        "num_qubits",
+    )
+
+    def __new__(
+        cls, num_qubits=None, amplitudes=None, dtype=np.complex128, device=None
+    ):
+        # Only an explicit device moves a state to the GPU; states made
+        # inside the NumPy simulator always stay on the host
+        if device is not None and device in _CUDA_DEVICES:
+            return _load_cuda_backend().CudaStatevector(num_qubits, amplitudes, dtype)
+        return super().__new__(cls)
+
+    def __init__(
+        self, num_qubits=None, amplitudes=None, dtype=np.complex128, device=None
+    ):
+        if amplitudes is None:
+            amplitudes = _aligned_empty((1 << num_qubits,), dtype)
+            amplitudes.fill(0.0)
+            amplitudes[0] = 1.0
+        self._amplitudes = np.asarray(amplitudes, dtype=dtype)
+        self._planes = None
+        # Second plane array that apply_gate ping-pongs with _planes
+        self._spare = None
+        # Measurement distribution and its running sum, built on first use
+        self._probabilities = None
+        self._cdf = None
+        self.num_qubits = self._amplitudes.size.bit_length() - 1
+
+    @property
+    def dtype(self):
+        if self._amplitudes is not None:
+            return self._amplitudes.dtype
+        return np.result_type(self._planes.dtype, np.complex64)
+
+    def _complex(self):
+        """Complex amplitudes, recombined from the planes if needed"""
+        if self._amplitudes is None:
+            amplitudes = _aligned_empty((self._planes.shape[1],), self.dtype)
+            amplitudes.real = self._planes[0]
+            amplitudes.imag = self._planes[1]
+            self._amplitudes = amplitudes
+        return self._amplitudes
+
+    def _soa(self):
+        """(2, 2^n) array of real and imaginary planes, split out if needed"""
+        if self._planes is None:
+            amplitudes = self._amplitudes
+            planes = _aligned_empty((2, amplitudes.size), amplitudes.real.dtype)
+            planes[0] = amplitudes.real
+            planes[1] = amplitudes.imag
+            self._planes = planes
+        return self._planes
+
+    def get_amplitudes(self):
+        """Return a read-only view of the amplitudes (qubit 0 is the lowest bit)
+
+        No copy is made; call .copy() on the result for a writable array.
+        """
+        view = self._complex().view()
+        view.flags.writeable = False
+        return view
+
+    get_amplitudes_view = get_amplitudes
+
+    def astype(self, dtype):
+        """Return a copy with amplitudes stored as ``dtype`` (e.g. np.complex64)"""
+        return Statevector(amplitudes=self._complex().astype(dtype), dtype=dtype)
+
+    def apply_gate(self, gate_name, qubits, angle=0.0):
+        """Apply a named gate in place, e.g. apply_gate('CNOT', [0, 1])
+
+        Gates run on the real and imaginary planes, so consecutive calls
+        never recombine the amplitudes. Views returned earlier by
+        get_amplitudes() keep the previous amplitudes.
+        """
+        matrix, qubits = _named_gate(
+            gate_name, qubits, angle, self.num_qubits, self.dtype
+        )
+        n = self.num_qubits
+        kernels = None
+        if n >= _KERNEL_MIN_QUBITS:
+            kernels = _load_native_kernels() or _load_numba_kernels()
+        if kernels is not None and (
+            len(qubits) == 1 or gate_name.upper() in ("CNOT", "CX")
+        ):
+            re, im = self._soa()
+            if len(qubits) == 1:
+                kernels.apply_1q(re, im, *matrix.ravel().tolist(), qubits[0])
+            else:
+                kernels.apply_cnot(re, im, qubits[0], qubits[1])
+            self._amplitudes = None
+            self._probabilities = self._cdf = None
+            return self
+        planes = self._soa()
+        if self._spare is None:
+            self._spare = _aligned_empty(planes.shape, planes.dtype)
+        # Axis 0 selects the plane; qubit 0 is the least significant bit, i.e.
+        # the last axis
+        shape = (2,) * (n + 1)
+        result = _apply_gate_planes(
+            planes.reshape(shape),
+            matrix,
+            [n - q for q in qubits],
+            self._spare.reshape(shape),
+        )
+        if not np.may_share_memory(result, planes):
+            # The gate wrote elsewhere, so the old planes become the spare
+            self._spare = planes
+            self._planes = result.reshape(2, -1)
+        self._amplitudes = None
+        self._probabilities = self._cdf = None
+        return self
+
+    def probabilities(self):
+        """Read-only basis-state probabilities, computed once per state"""
+        if self._probabilities is None:
+            if self._amplitudes is None:
+                re, im = self._planes
+                probabilities = re * re + im * im
+            else:
+                probabilities = np.square(self._amplitudes.real) + np.square(
+                    self._amplitudes.imag
+                )
+            probabilities.flags.writeable = False
+            self._probabilities = probabilities
+        return self._probabilities
+
+    def measure(self, qubit, seed=None):
+        """Sample one outcome (0 or 1) of ``qubit`` without collapsing the state"""
+        p1 = self.probabilities().reshape(-1, 2, 1 << qubit)[:, 1, :].sum()
+        return int(
+            np.random.default_rng(seed).random() * self.probabilities().sum() < p1
+        )
+
+    def measure_all(self, shots=1, seed=None):
+        """Sample ``shots`` basis-state indices (int64) from the cached distribution"""
+        if self._cdf is None:
+            self._cdf = np.cumsum(self.probabilities())
+        draws = np.random.default_rng(seed).random(shots) * self._cdf[-1]
+        samples = np.searchsorted(self._cdf, draws, side="right")
+        # Guard against draws landing on the final rounding of the running sum
+        return np.minimum(samples, self._cdf.size - 1, out=samples)
+
+    def measure_expectation(self, qubit, observable="Z"):
+        """Expectation value of a single-qubit Pauli observable (X, Y or Z)"""
+        # Split the amplitudes by the value of this qubit's bit
+        psi = self._complex().reshape(-1, 2, 1 << qubit)
+        a0, a1 = psi[:, 0, :], psi[:, 1, :]
+        observable = observable.upper()
+        if observable == "Z":
+            return float(np.vdot(a0, a0).real - np.vdot(a1, a1).real)
+        if observable == "X":
+            return float(2.0 * np.vdot(a0, a1).real)
+        if observable == "Y":
+            return float(2.0 * np.vdot(a0, a1).imag)
+        raise ValueError(f"Unsupported observable: {observable}")
+
+    def pauli_expectation(self, pauli):
+        """Expectation of a Pauli string such as 'XZI'; character k acts on qubit k
+
+        Strings of only I and Z reduce the cached probabilities; X and Y
+        reverse the matching tensor axes of the amplitudes, so no operator
+        matrix is ever built.
+        """
+        n = self.num_qubits
+        pauli = pauli.upper()
+        if len(pauli) != n or not set(pauli) <= set("IXYZ"):
+            raise ValueError(
+                f"Expected one of I, X, Y, Z for each of {n} qubits, got '{pauli}'"
+            )
+        shape = (2,) * n
+        # Qubit q is tensor axis n - 1 - q
+        flip_axes = tuple(n - 1 - q for q, p in enumerate(pauli) if p in "XY")
+        sign_axes = tuple(n - 1 - q for q, p in enumerate(pauli) if p in "YZ")
+        if not flip_axes:
+            # Marginal over the Z qubits, then difference out one axis at a time
+            p = self.probabilities().reshape(shape)
+            p = p.sum(axis=tuple(axis for axis in range(n) if axis not in sign_axes))
+            for _ in sign_axes:
+                p = p[0] - p[1]
+            return float(p)
+        # P|i> = i^(#Y) (-1)^(bits of i on Y/Z qubits) |i with X/Y bits flipped>
+        psi = self._complex().reshape(shape)
+        signed = psi.copy()
+        for axis in sign_axes:
+            signed[_sub_slice((axis,), (1,), n)] *= -1
+        value = np.vdot(np.flip(psi, flip_axes), signed) * 1j ** pauli.count("Y")
+        return float(value.real)
+
+    def __str__(self):
+        return f"Statevector({self.num_qubits} qubits)"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class DensityMatrix:
+    """Density matrix of a (possibly mixed) state
+
+    Pure states are backed by a Statevector, so gates cost O(2^n) instead
+    of O(4^n); the matrix |psi><psi| is only built when requested.
+    """
+
+    __slots__ = ("_matrix", "_state", "_eigenvalues", "num_qubits")
+
+    _PURE_TOLERANCE = 1e-12
+
+    def __init__(self, num_qubits=None, matrix=None, dtype=np.complex128):
+        if matrix is None:
+            self._state = Statevector(num_qubits, dtype=dtype)
+            self._matrix = None
+            self.num_qubits = self._state.num_qubits
+        else:
+            self._state = None
+            self._matrix = np.asarray(matrix, dtype=dtype)
+            self.num_qubits = len(self._matrix).bit_length() - 1
+        # Spectrum of the current matrix, shared by purity() and the entropy
+        self._eigenvalues = None
+
+    @classmethod
+    def from_statevector(cls, state):
+        """Build |psi><psi| from a Statevector (kept as the vector until needed)"""
+        rho = cls(state.num_qubits, dtype=state.dtype)
+        rho._state = state.astype(state.dtype)
+        return rho
+
+    @property
+    def dtype(self):
+        if self._state is not None:
+            return self._state.dtype
+        return self._matrix.dtype
+
+    def _materialize(self):
+        if self._matrix is None:
+            amplitudes = self._state.get_amplitudes()
+            self._matrix = np.outer(amplitudes, amplitudes.conj())
+        return self._matrix
+
+    def _spectrum(self):
+        if self._eigenvalues is None:
+            self._eigenvalues = np.linalg.eigvalsh(self._materialize())
+        return self._eigenvalues
+
+    def get_matrix(self):
+        """Return a read-only view of the matrix
+
+        No copy is made; call .copy() on the result for a writable array.
+        """
+        view = self._materialize().view()
+        view.flags.writeable = False
+        return view
+
+    get_matrix_view = get_matrix
+
+    def is_pure(self):
+        if self._state is not None:
+            return True
+        return self.purity() > 1.0 - self._PURE_TOLERANCE
+
+    def apply_gate(self, gate_name, qubits, angle=0.0):
+        """Apply a named gate, e.g. apply_gate('CNOT', [control, target])"""
+        if self._state is not None:
+            self._state.apply_gate(gate_name, qubits, angle)
+            self._matrix = None
+            self._eigenvalues = None
+            return self
+        matrix, qubits = _named_gate(
+            gate_name, qubits, angle, self.num_qubits, self.dtype
+        )
+        n = self.num_qubits
+        # Qubit 0 is the least significant bit, i.e. the last axis
+        axes = [n - 1 - q for q in qubits]
+        # rho -> U rho U^dag: U on the row axes, conj(U) on the column axes
+        rho = self._matrix.reshape((2,) * (2 * n))
+        rho = _apply_matrix_unfold(rho, matrix, axes)
+        rho = _apply_matrix_unfold(rho, matrix.conj(), [n + a for a in axes])
+        self._matrix = rho.reshape(1 << n, 1 << n)
+        self._eigenvalues = None
+        return self
+
+    def purity(self):
+        """Tr(rho^2); for Hermitian rho this is the squared Frobenius norm"""
+        if self._state is not None:
+            amplitudes = self._state.get_amplitudes()
+            return float(np.vdot(amplitudes, amplitudes).real ** 2)
+        if self._eigenvalues is not None:
+            return float(np.dot(self._eigenvalues, self._eigenvalues))
+        flat = self._matrix.ravel()
+        return float(np.vdot(flat, flat).real)
+
+    def von_neumann_entropy(self):
+        """Von Neumann entropy in bits"""
+        if self.purity() > 1.0 - self._PURE_TOLERANCE:
+            return 0.0
+        eigenvalues = self._spectrum()
+        eigenvalues = eigenvalues[eigenvalues > 1e-15]
+        return float(-np.sum(eigenvalues * np.log2(eigenvalues)))
+
+    def __str__(self):
+        return f"DensityMatrix({self.num_qubits} qubits)"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+_SUPPORTED_DTYPES = (np.dtype(np.complex64), np.dtype(np.complex128))
+
+
 class Circuit:
-    def __init__(self, num_qubits):
-        self.num_qubits = num_qubits
-        self.gates = []
-    
+    __slots__ = (
+        "num_qubits",
+        "dtype",
+        "_tensor_shape",
+        "_ops",
+        "_qubit0",
+        "_qubit1",
+        "_params",
+        "_num_gates",
+        "_is_clifford",
+        "_gates_cache",
+        "_qasm_cache",
+        "_contractions",
+        "_c_circuit",
+        "_flushed",
+    )
+
+    def __init__(self, num_qubits, dtype=np.complex128):
+        dtype = np.dtype(dtype)
+        if dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(
+                f"Unsupported dtype '{dtype}'; use complex64 or complex128"
+            )
+        # Plain int (not e.g. np.int64) so hot-path arithmetic stays in Python ints
+        self.num_qubits = int(num_qubits)
+        self._tensor_shape = (2,) * self.num_qubits
+        # complex64 halves the memory traffic of execute() at single precision
+        self.dtype = dtype
+        # Gates are stored column-wise: op code, first qubit, second qubit
+        # (-1 for single-qubit gates) and parameter, grown by doubling
+        self._ops = np.empty(16, dtype=np.uint8)
+        self._qubit0 = np.empty(16, dtype=np.int32)
+        self._qubit1 = np.empty(16, dtype=np.int32)
+        self._params = np.empty(16, dtype=np.float64)
+        self._num_gates = 0
+        # Kept up to date on append so execute_clifford() needs no scan
+        self._is_clifford = True
+        self._gates_cache = None
+        self._qasm_cache = None
+        # Compiled _omniq_core circuit fed by flush()
+        self._c_circuit = None
+        self._flushed = 0
+        # Compiled opt_einsum contractions keyed by (qubits, num_qubits); the
+        # gate layout repeats across parameter sweeps so the path is derived once
+        self._contractions = {}
+
+    def _reserve(self, capacity):
+        """Grow the gate columns to hold at least ``capacity`` gates"""
+        if capacity <= self._ops.size:
+            return
+        capacity = max(capacity, 2 * self._ops.size)
+        n = self._num_gates
+        for attr in ("_ops", "_qubit0", "_qubit1", "_params"):
+            column = getattr(self, attr)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:n] = column[:n]
+            setattr(self, attr, grown)
+
+    def _extend(self, ops, qubit0, qubit1, params):
+        """Append whole gate columns at once"""
+        n = self._num_gates
+        count = len(ops)
+        self._reserve(n + count)
+        self._ops[n : n + count] = ops
+        self._qubit0[n : n + count] = qubit0
+        self._qubit1[n : n + count] = qubit1
+        self._params[n : n + count] = params
+        self._num_gates = n + count
+        if self._is_clifford:
+            self._is_clifford = _all_clifford(
+                self._ops[n : n + count], self._params[n : n + count]
+            )
+        self._gates_cache = None
+        self._qasm_cache = None
+
+    def _append(self, code, qubit0, qubit1=-1, parameter=0.0):
+        n = self._num_gates
+        if n == self._ops.size:
+            self._reserve(n + 1)
+        if self._is_clifford:
+            self._is_clifford = _is_clifford_gate(code, parameter)
+        self._ops[n] = code
+        self._qubit0[n] = qubit0
+        self._qubit1[n] = qubit1
+        self._params[n] = parameter
+        self._num_gates = n + 1
+        self._gates_cache = None
+        self._qasm_cache = None
+
+    def _set_parameters(self, params):
+        """Overwrite every gate angle in place, keeping the layout and contractions"""
+        n = self._num_gates
+        self._params[:n] = params
+        self._is_clifford = _all_clifford(self._ops[:n], self._params[:n])
+        self._gates_cache = None
+        self._qasm_cache = None
+        # flush() only sends new gates, so the compiled copy would go stale
+        self._c_circuit = None
+        self._flushed = 0
+
+    def _gate_columns(self):
+        """Return (ops, qubit0, qubit1, params) views trimmed to the gate count"""
+        n = self._num_gates
+        return self._ops[:n], self._qubit0[:n], self._qubit1[:n], self._params[:n]
+
+    def _gate_rows(self):
+        """Iterate gates as plain Python (code, qubit0, qubit1, parameter) rows"""
+        return zip(*(column.tolist() for column in self._gate_columns()))
+
+    @property
+    def gates(self):
+        """Gates as a list of tuples, built on first access"""
+        if self._gates_cache is None:
+            self._gates_cache = [_gate_tuple(*row) for row in self._gate_rows()]
+        return self._gates_cache
+
     def h(self, qubit):
         """Add Hadamard gate"""
-        self.gates.append(('H', qubit))
+        self._append(_OP_H, qubit)
         return self
-    
+
     def x(self, qubit):
         """Add X gate"""
-        self.gates.append(('X', qubit))
+        self._append(_OP_X, qubit)
         return self
-    
+
     def y(self, qubit):
         """Add Y gate"""
-        self.gates.append(('Y', qubit))
+        self._append(_OP_Y, qubit)
         return self
-    
+
     def z(self, qubit):
         """Add Z gate"""
-        self.gates.append(('Z', qubit))
+        self._append(_OP_Z, qubit)
         return self
-    
+
     def cx(self, control, target):
         """Add CNOT gate"""
-        self.gates.append(('CNOT', control, target))
+        self._append(_OP_CNOT, control, target)
         return self
-    
+
     def swap(self, qubit1, qubit2):
         """Add SWAP gate"""
-        self.gates.append(('SWAP', qubit1, qubit2))
+        self._append(_OP_SWAP, qubit1, qubit2)
         return self
-    
+
     def rx(self, qubit, angle):
         """Add RX gate"""
-        self.gates.append(('RX', qubit, angle))
+        self._append(_OP_RX, qubit, -1, angle)
         return self
-    
+
     def ry(self, qubit, angle):
         """Add RY gate"""
-        self.gates.append(('RY', qubit, angle))
+        self._append(_OP_RY, qubit, -1, angle)
         return self
-    
+
     def rz(self, qubit, angle):
         """Add RZ gate"""
-        self.gates.append(('RZ', qubit, angle))
+        self._append(_OP_RZ, qubit, -1, angle)
         return self
-    
+
     def phase(self, qubit, angle):
         """Add Phase gate"""
-        self.gates.append(('PHASE', qubit, angle))
+        self._append(_OP_PHASE, qubit, -1, angle)
         return self
 
     def cp(self, angle, control, target):
         """Add Controlled-Phase gate"""
-        self.gates.append(('CP', control, target, angle))
+        self._append(_OP_CP, control, target, angle)
         return self
 
-    def to_dict(self):
-        """Convert circuit to dictionary for serialization"""
-        gate_list = []
-        for i, g in enumerate(self.gates):
-            g_type = g[0]
-            gate_data = {
-                "type": g_type,
-                "qubit": g[1],
-                "step": i 
+    def add_gate(self, gate_name, qubits, angle=0.0):
+        """Add a gate by name, e.g. add_gate('RX', [0], angle=0.5)
+
+        Names are case-insensitive; canonical upper-case names are looked up
+        without allocating an upper-cased copy. In hot loops prefer the
+        positional methods (h, cx, rx, ...), which skip the lookup entirely.
+        """
+        key = gate_name if gate_name in _CANONICAL_GATE_NAMES else gate_name.upper()
+        fn = _GATE_DISPATCH.get(key)
+        if fn is None:
+            raise ValueError(f"Unknown gate: {gate_name}")
+        fn(self, qubits, angle)
+        return self
+
+    def add_gates(self, gates):
+        """Append many gates in one call
+
+        ``gates`` is a GATE_DTYPE structured array or a sequence of
+        (op, q0, q1, angle) tuples, where op is a gate code or name.
+        """
+        if not (isinstance(gates, np.ndarray) and gates.dtype.names):
+            gates = np.array(
+                [
+                    (_GATE_CODES[op] if isinstance(op, str) else op, q0, q1, angle)
+                    for op, q0, q1, angle in gates
+                ],
+                dtype=GATE_DTYPE,
+            )
+        if gates.size and gates["op"].max() >= len(_GATE_NAMES):
+            raise ValueError(f"Unknown gate code: {gates['op'].max()}")
+        self._extend(gates["op"], gates["q0"], gates["q1"], gates["angle"])
+        return self
+
+    def gate_records(self):
+        """Return the gates as a list of GateRecord named tuples"""
+        ops, qubit0, qubit1, params = self._gate_columns()
+        names = np.array(_GATE_NAMES)[ops].tolist()
+        targets = np.where(np.isin(ops, _TWO_QUBIT_CODES), qubit1, -1).tolist()
+        has_parameter = np.isin(ops, _PARAMETER_CODES).tolist()
+        return [
+            GateRecord(
+                name,
+                qubit,
+                target if target >= 0 else None,
+                parameter if with_parameter else None,
+                step,
+            )
+            for step, (name, qubit, target, parameter, with_parameter) in enumerate(
+                zip(names, qubit0.tolist(), targets, params.tolist(), has_parameter)
+            )
+        ]
+
+    def to_dict(self, legacy=True):
+        """Convert circuit to dictionary for serialization
+
+        The legacy form (read by the debugger) has one dict per gate;
+        legacy=False returns the gate columns as arrays instead.
+        """
+        if not legacy:
+            ops, qubit0, qubit1, params = self._gate_columns()
+            return {
+                "num_qubits": self.num_qubits,
+                "ops": ops.copy(),
+                "q0": qubit0.copy(),
+                "q1": qubit1.copy(),
+                "params": params.copy(),
             }
-            
-            if g_type in ('CNOT', 'SWAP'):
-                gate_data["target"] = g[2]
-            elif g_type == 'CP':
-                gate_data["target"] = g[2]
-                gate_data["parameter"] = g[3]
-            elif g_type in ('RX', 'RY', 'RZ', 'PHASE'):
-                gate_data["parameter"] = g[2]
-                
+
+        gate_list = []
+        for record in self.gate_records():
+            gate_data = {"type": record.op, "qubit": record.q0, "step": record.step}
+            if record.q1 is not None:
+                gate_data["target"] = record.q1
+            if record.param is not None:
+                gate_data["parameter"] = record.param
             gate_list.append(gate_data)
-        
-        return {
-            "num_qubits": self.num_qubits,
-            "gates": gate_list
-        }
 
-    def save_json(self, path):
-        """Save circuit as JSON"""
+        return {"num_qubits": self.num_qubits, "gates": gate_list}
+
+    def to_qasm(self):
+        """OpenQASM 2.0 source for the circuit, built once until gates change"""
+        if self._qasm_cache is None:
+            lines = [
+                "OPENQASM 2.0;",
+                'include "qelib1.inc";',
+                "",
+                f"qreg q[{self.num_qubits}];",
+                "",
+            ]
+            lines.extend(
+                _QASM_FORMATS[code].format(q0, q1, parameter)
+                for code, q0, q1, parameter in self._gate_rows()
+            )
+            lines.append("")
+            self._qasm_cache = "\n".join(lines)
+        return self._qasm_cache
+
+    def flush(self):
+        """Send gates added since the last flush to the C++ core in one call"""
+        from ._internals import _Circuit
+
+        if self._c_circuit is None:
+            self._c_circuit = _Circuit(self.num_qubits)
+        columns = [column[self._flushed :] for column in self._gate_columns()]
+        self._c_circuit.add_gates_batch(*columns)
+        self._flushed = self._num_gates
+        return self._c_circuit
+
+    @property
+    def is_clifford(self):
+        """True if every gate is a Clifford operation (angles at multiples of pi/2)"""
+        return self._is_clifford
+
+    def execute_clifford(self):
+        """Run the circuit on the stabilizer simulator and return it
+
+        Clifford circuits cost O(n^2) memory this way instead of O(2^n), so
+        wide circuits such as large GHZ states stay tractable. Use the
+        returned simulator's measure() to sample outcomes.
+        """
+        if not self._is_clifford:
+            raise ValueError("Circuit contains non-Clifford gates; use execute()")
+        from ._internals import _CliffordSimulator
+
+        simulator = _CliffordSimulator(self.num_qubits)
+        simulator.apply_gates(*self._gate_columns())
+        return simulator
+
+    def execute(self, initial_state=None, backend="numpy", mode="sv", device=None):
+        """Simulate the circuit and return the final Statevector
+
+        ``mode='tn'`` contracts the circuit as a tensor network (requires
+        quimb) instead of applying gates to the state vector; ``'auto'``
+        keeps the state vector, since the full state is requested anyway.
+        A CUDA ``device`` (default: omniq.DEFAULT_DEVICE) runs the state
+        vector on the GPU and returns a CudaStatevector.
+        """
+        if mode not in ("auto", "sv", "tn"):
+            raise ValueError(f"Unknown mode '{mode}'; use 'auto', 'sv' or 'tn'")
+        if mode == "tn":
+            if initial_state is not None:
+                raise ValueError("mode='tn' always starts from |0...0>")
+            return self._execute_tn()
+        if _on_cuda(device):
+            return self._execute_cuda(initial_state)
+        if backend != "numpy" and oe is None:
+            raise ImportError(f"opt_einsum is required for backend='{backend}'")
+
+        if initial_state is None:
+            psi = Statevector(self.num_qubits, dtype=self.dtype)._amplitudes
+        else:
+            if initial_state.num_qubits != self.num_qubits:
+                raise ValueError(
+                    f"Initial state has {initial_state.num_qubits} qubits, "
+                    f"circuit has {self.num_qubits}"
+                )
+            # astype copies, so the caller's state is never modified
+            psi = initial_state.get_amplitudes_view().astype(self.dtype)
+        psi = psi.reshape(self._tensor_shape)
+
+        # Gates are fused in double precision and cast once per fused unitary
+        psi, _ = self._apply_operations(self._fuse(), psi, backend)
+        return Statevector(amplitudes=psi.reshape(-1), dtype=self.dtype)
+
+    def _execute_cuda(self, initial_state):
+        cuda = _load_cuda_backend()
+        if initial_state is not None and initial_state.num_qubits != self.num_qubits:
+            raise ValueError(
+                f"Initial state has {initial_state.num_qubits} qubits, "
+                f"circuit has {self.num_qubits}"
+            )
+        amplitudes = None if initial_state is None else initial_state.get_amplitudes()
+        state = cuda.CudaStatevector(self.num_qubits, amplitudes, self.dtype)
+        for matrix, qubits in self._fuse():
+            state._apply_matrix(matrix, qubits)
+        return state
+
+    def expectation(self, qubit=0, observable="Z", mode="auto"):
+        """Expectation of a single-qubit Pauli observable on the final state
+
+        ``mode='tn'`` contracts <0|U^dag P U|0> over the light cone of
+        ``qubit`` as a tensor network, costing roughly 2^treewidth rather
+        than 2^num_qubits; ``'auto'`` picks it for wide, shallow circuits
+        when quimb is installed.
+        """
+        if mode not in ("auto", "sv", "tn"):
+            raise ValueError(f"Unknown mode '{mode}'; use 'auto', 'sv' or 'tn'")
+        if mode == "auto":
+            # Contraction cost ~2^(width * log2(bond dim)) against 2^num_qubits
+            use_tn = (
+                qtn is not None
+                and self.num_qubits >= _TN_MIN_QUBITS
+                and self._cut_width() < self.num_qubits
+            )
+            mode = "tn" if use_tn else "sv"
+        if mode == "sv":
+            return self.execute().measure_expectation(qubit, observable)
+        return self._expectation_tn(qubit, observable)
+
+    def _cut_width(self):
+        """Most two-qubit gates crossing a cut between wires (cheap treewidth bound)"""
+        _, qubit0, qubit1, _ = self._gate_columns()
+        pairs = qubit1 >= 0
+        low = np.minimum(qubit0[pairs], qubit1[pairs])
+        high = np.maximum(qubit0[pairs], qubit1[pairs])
+        # A gate on (low, high) crosses every cut k with low < k <= high
+        size = self.num_qubits + 1
+        crossings = np.cumsum(
+            np.bincount(low + 1, minlength=size) - np.bincount(high + 1, minlength=size)
+        )
+        return int(crossings.max(initial=0))
+
+    def _light_cone(self, qubit):
+        """Operations that can influence ``qubit``, and the wires they touch
+
+        Every other gate cancels against its adjoint in <psi|P|psi>.
+        """
+        wires = {qubit}
+        kept = []
+        for row in reversed(list(self._gate_rows())):
+            touched = (row[1],) if row[2] < 0 else (row[1], row[2])
+            if wires.intersection(touched):
+                wires.update(touched)
+                kept.append(row)
+        kept.reverse()
+        return [_gate_operation(*row) for row in kept], sorted(wires)
+
+    def _execute_tn(self):
+        if qtn is None:
+            raise ImportError("quimb is required for mode='tn'")
+        wires = range(self.num_qubits)
+        output_inds = {q: f"out{q}" for q in wires}
+        operations = [_gate_operation(*row) for row in self._gate_rows()]
+        network = qtn.TensorNetwork(_tn_tensors(operations, wires, "k", output_inds))
+        # Qubit 0 is the least significant bit, i.e. the last axis
+        inds = tuple(output_inds[q] for q in reversed(wires))
+        psi = network.contract(..., output_inds=inds, optimize=_tn_optimizer())
+        return Statevector(
+            amplitudes=psi.transpose(*inds).data.reshape(-1), dtype=self.dtype
+        )
+
+    def _expectation_tn(self, qubit, observable):
+        if qtn is None:
+            raise ImportError("quimb is required for mode='tn'")
+        observable = observable.upper()
+        if observable not in ("X", "Y", "Z"):
+            raise ValueError(f"Unsupported observable: {observable}")
+        operations, wires = self._light_cone(qubit)
+        # Bra and ket share their final indices except on the measured wire,
+        # where the observable sits between them
+        ket_inds = {q: f"out{q}" for q in wires}
+        bra_inds = dict(ket_inds)
+        bra_inds[qubit] = "obs"
+        tensors = _tn_tensors(operations, wires, "k", ket_inds)
+        tensors += _tn_tensors(operations, wires, "b", bra_inds, conjugate=True)
+        tensors.append(
+            qtn.Tensor(_FIXED_GATES[observable], inds=("obs", ket_inds[qubit]))
+        )
+        value = qtn.TensorNetwork(tensors).contract(..., optimize=_tn_optimizer())
+        return float(np.real(value))
+
+    def parameter_shift_expectations(
+        self, qubit=0, observable="Z", shift=np.pi / 2, gate_indices=None
+    ):
+        """Expectations of ``observable`` on ``qubit`` with each parametric gate shifted
+
+        Returns a (2, P) array: row 0 holds the +shift and row 1 the -shift
+        values for the P gates in ``gate_indices`` (default: every parametric
+        gate, in circuit order). The state before each shifted gate is carried
+        forward, so only the remainder of the circuit is re-simulated per shift.
+        """
+        ops, qubit0, qubit1, params = (
+            column.tolist() for column in self._gate_columns()
+        )
+        if gate_indices is None:
+            gate_indices = np.flatnonzero(
+                np.isin(self._ops[: self._num_gates], _PARAMETER_CODES)
+            )
+        gate_indices = [int(i) for i in gate_indices]
+        for i in gate_indices:
+            if not 0 <= i < self._num_gates or ops[i] not in _PARAMETER_CODES:
+                raise ValueError(f"Gate {i} is not a parametric gate")
+
+        operations = [
+            _gate_operation(*row, self.dtype)
+            for row in zip(ops, qubit0, qubit1, params)
+        ]
+        backend = "numpy"
+        psi = Statevector(self.num_qubits, dtype=self.dtype)._amplitudes.reshape(
+            self._tensor_shape
+        )
+        buffer = scratch = None
+        applied = 0
+        results = np.empty((2, len(gate_indices)))
+        for column, i in sorted(enumerate(gate_indices), key=lambda item: item[1]):
+            # Advance the shared prefix state up to (not including) gate i
+            psi, buffer = self._apply_operations(
+                operations[applied:i], psi, backend, buffer
+            )
+            applied = i
+            for row, delta in enumerate((shift, -shift)):
+                matrix, qubits = _gate_operation(
+                    ops[i], qubit0[i], qubit1[i], params[i] + delta, self.dtype
+                )
+                # Without a buffer _contract leaves the shared prefix state intact
+                phi = self._contract(
+                    matrix.astype(self.dtype, copy=False), qubits, psi, backend
+                )
+                phi, scratch = self._apply_operations(
+                    operations[i + 1 :], phi, backend, scratch
+                )
+                state = Statevector(amplitudes=phi.reshape(-1), dtype=self.dtype)
+                results[row, column] = state.measure_expectation(qubit, observable)
+        return results
+
+    def _fuse(self):
+        """Merge adjacent gates into fewer unitaries, returning (matrix, qubits) pairs
+
+        OMNIQ_FUSE_LEVEL selects the pass: 0 disables fusion, 1 merges runs
+        of single-qubit gates on a wire, 2 additionally folds single-qubit
+        gates and repeated gates on the same pair into 4x4 unitaries, and 3
+        (default) instead groups runs of adjacent gates spanning at most
+        _MAX_FUSED_QUBITS qubits into one dense unitary each.
+        """
+        level = int(os.environ.get("OMNIQ_FUSE_LEVEL", "3"))
+        if level >= 3:
+            return self._fuse_blocks(_MAX_FUSED_QUBITS)
+        ops = []
+        if level <= 0:
+            for row in self._gate_rows():
+                ops.append(_gate_operation(*row, self.dtype))
+            return ops
+
+        pending = {}
+        last = {}
+
+        def flush(qubit):
+            matrix = pending.pop(qubit, None)
+            if matrix is None:
+                return
+            i = last.get(qubit)
+            if level >= 2 and i is not None and len(ops[i][1]) == 2:
+                # Nothing after ops[i] touches this qubit, so fold it in
+                pair_matrix, pair = ops[i]
+                if pair[0] == qubit:
+                    embedded = np.kron(matrix, _IDENTITY_2)
+                else:
+                    embedded = np.kron(_IDENTITY_2, matrix)
+                ops[i] = (embedded @ pair_matrix, pair)
+                return
+            last[qubit] = len(ops)
+            ops.append((matrix, (qubit,)))
+
+        for row in self._gate_rows():
+            matrix, qubits = _gate_operation(*row)
+            if len(qubits) == 1:
+                q = qubits[0]
+                previous = pending.get(q)
+                pending[q] = matrix if previous is None else matrix @ previous
+                continue
+
+            a, b = qubits
+            if level >= 2:
+                pa, pb = pending.pop(a, None), pending.pop(b, None)
+                if pa is not None or pb is not None:
+                    matrix = matrix @ np.kron(
+                        _IDENTITY_2 if pa is None else pa,
+                        _IDENTITY_2 if pb is None else pb,
+                    )
+                i = last.get(a)
+                if i is not None and i == last.get(b):
+                    prev_matrix, pair = ops[i]
+                    if pair == (b, a):
+                        matrix = _SWAP_QUBITS @ matrix @ _SWAP_QUBITS
+                    ops[i] = (matrix @ prev_matrix, pair)
+                    continue
+            else:
+                flush(a)
+                flush(b)
+            last[a] = last[b] = len(ops)
+            ops.append((matrix, (a, b)))
+
+        for qubit in list(pending):
+            flush(qubit)
+        return ops
+
+    def _fuse_blocks(self, max_qubits):
+        """Greedy block fusion: extend the current block while its qubits fit
+
+        A block becomes one k-qubit unitary only when it holds at least k
+        gates; sparser blocks are cheaper as separate kernel calls. Blocks of
+        fixed gates are cached on their rows, so re-executing a circuit (or a
+        repeated gate pattern) reuses them; blocks with rotation angles are
+        rebuilt on each call.
+        """
+        ops = []
+        rows = []
+        wires = set()
+
+        def emit():
+            if len(rows) >= max(2, len(wires)):
+                block = tuple(sorted(wires, reverse=True))
+                if any(row[0] in _CLIFFORD_STEPS for row in rows):
+                    fuse = _fused_unitary
+                else:
+                    fuse = _cached_fused_unitary
+                ops.append((fuse(tuple(rows), block, self.dtype), block))
+            else:
+                ops.extend(_gate_operation(*row, self.dtype) for row in rows)
+            rows.clear()
+            wires.clear()
+
+        for row in self._gate_rows():
+            qubits = {row[1], row[2]} if row[2] >= 0 else {row[1]}
+            if len(wires | qubits) > max_qubits:
+                emit()
+            rows.append(row)
+            wires |= qubits
+        emit()
+        return ops
+
+    def _apply_operations(self, operations, psi, backend, buffer=None):
+        """Apply (matrix, qubits) pairs to an owned state tensor
+
+        Returns the final state and the spare buffer, which ping-pongs with
+        the state whenever a gate kernel writes into it.
+        """
+        if backend == "numpy" and buffer is None:
+            buffer = _aligned_empty(psi.shape, psi.dtype)
+        for matrix, qubits in operations:
+            result = self._contract(
+                matrix.astype(self.dtype, copy=False), qubits, psi, backend, buffer
+            )
+            if result is buffer:
+                buffer = psi
+            psi = result
+        return psi, buffer
+
+    def _contract(self, matrix, qubits, psi, backend, buffer=None):
+        """Apply a gate to the state tensor
+
+        NumPy states use the slice kernels when given a ``buffer`` (``psi``
+        may then be overwritten) and the unfold + matmul kernel otherwise;
+        other opt_einsum backends go through a cached contraction expression.
+        """
+        if backend == "numpy":
+            axes = [psi.ndim - 1 - q for q in qubits]
+            if buffer is not None:
+                return _apply_gate_kernel(psi, buffer, matrix, axes)
+            return _apply_matrix_unfold(psi, matrix, axes)
+        k = len(qubits)
+        gate = matrix.reshape((2,) * (2 * k))
+        key = (qubits, psi.ndim)
+        expr = self._contractions.get(key)
+        if expr is None:
+            expr = self._compile_contraction(qubits, gate.shape, psi.shape)
+            self._contractions[key] = expr
+        return expr(gate, psi, backend=backend)
+
+    @staticmethod
+    def _compile_contraction(qubits, gate_shape, state_shape):
+        """opt_einsum expression for a gate, with its contraction path precomputed
+
+        Only non-NumPy backends get here, and execute() requires opt_einsum
+        for those.
+        """
+        n = len(state_shape)
+        # Qubit 0 is the least significant bit, i.e. the last tensor axis
+        axes = [n - 1 - q for q in qubits]
+        state_idx = string.ascii_letters[:n]
+        new_idx = string.ascii_letters[n : n + len(qubits)]
+        out_idx = list(state_idx)
+        for axis, idx in zip(axes, new_idx):
+            out_idx[axis] = idx
+        spec = "{}{},{}->{}".format(
+            new_idx, "".join(state_idx[a] for a in axes), state_idx, "".join(out_idx)
+        )
+        return oe.contract_expression(spec, gate_shape, state_shape, optimize="auto-hq")
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a circuit from either to_dict() form"""
+        circuit = cls(data["num_qubits"])
+        if "ops" in data:
+            circuit._extend(
+                np.asarray(data["ops"], dtype=np.uint8),
+                np.asarray(data["q0"], dtype=np.int32),
+                np.asarray(data["q1"], dtype=np.int32),
+                np.asarray(data["params"], dtype=np.float64),
+            )
+        else:
+            for gate in data["gates"]:
+                circuit._append(
+                    _GATE_CODES[gate["type"]],
+                    gate["qubit"],
+                    gate.get("target", -1),
+                    gate.get("parameter", 0.0),
+                )
+        return circuit
+
+    def save_json(self, path, legacy=True):
+        """Save circuit as JSON (legacy=False writes the compact column form)"""
+        data = self.to_dict(legacy=legacy)
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if legacy:
+                option |= orjson.OPT_INDENT_2
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=option))
+            return
+
         import json
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+
+        if legacy:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+            return
+        data = {
+            key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in data.items()
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
 
     def debug(self, noise_model=None, view_mode=None):
         """Open debugger (like df.head())"""
         from .debugger import show_debugger
+
         return show_debugger(self, noise_model=noise_model, view_mode=view_mode)
-    
+
     def show(self, view_mode=None):
         """Open debugger (like df.show())"""
         return self.debug(view_mode=view_mode)
-    
+
     def __str__(self):
-        return f"Circuit({self.num_qubits} qubits, {len(self.gates)} gates)"
-    
+        return f"Circuit({self.num_qubits} qubits, {self._num_gates} gates)"
+
     def __repr__(self):
         return self.__str__()
+
+
+class GateBytecode:
+    """A parameterized circuit lowered to gate records plus a constant-angle buffer
+
+    ``code`` is a BYTECODE_DTYPE array: gates with ``pidx >= 0`` take their
+    angle from the parameter vector, the rest from ``constants``. The layout
+    never changes, so every execution just rebinds angles on one shared
+    circuit.
+    """
+
+    __slots__ = ("code", "constants", "num_params", "_bound", "_circuit")
+
+    def __init__(self, num_qubits, code, constants, num_params, dtype=np.complex128):
+        self.code = code
+        self.constants = constants
+        self.num_params = num_params
+        self._bound = np.flatnonzero(code["pidx"] >= 0)
+        self._circuit = Circuit(num_qubits, dtype=dtype)
+        self._circuit._extend(code["op"], code["q0"], code["q1"], constants)
+
+    @classmethod
+    def from_ansatz(cls, ansatz, num_params, dtype=np.complex128):
+        """Compile ``ansatz(params) -> Circuit`` by tracing two random parameter sets
+
+        Angles that change between the traces must equal one parameter
+        exactly; anything else (e.g. 2 * params[0]) is rejected.
+        """
+        probes = np.random.default_rng(0).uniform(-np.pi, np.pi, (2, num_params))
+        first, second = ansatz(probes[0]), ansatz(probes[1])
+        ops, qubit0, qubit1, angles = first._gate_columns()
+        other_ops, other_qubit0, other_qubit1, other_angles = second._gate_columns()
+        if not (
+            np.array_equal(ops, other_ops)
+            and np.array_equal(qubit0, other_qubit0)
+            and np.array_equal(qubit1, other_qubit1)
+        ):
+            raise ValueError("Ansatz gate layout depends on its parameters")
+
+        pidx = np.full(ops.size, -1, dtype=np.int32)
+        for i in np.flatnonzero(angles != other_angles).tolist():
+            match = np.flatnonzero(
+                (probes[0] == angles[i]) & (probes[1] == other_angles[i])
+            )
+            if match.size != 1:
+                raise ValueError(f"Gate {i} angle is not a plain ansatz parameter")
+            pidx[i] = match[0]
+
+        code = np.empty(ops.size, dtype=BYTECODE_DTYPE)
+        code["op"], code["q0"], code["q1"], code["pidx"] = ops, qubit0, qubit1, pidx
+        constants = np.where(pidx >= 0, 0.0, angles)
+        return cls(first.num_qubits, code, constants, num_params, dtype=dtype)
+
+    def bind(self, params):
+        """Write ``params`` into the shared circuit's angles and return it"""
+        angles = self.constants.copy()
+        angles[self._bound] = np.asarray(params, dtype=np.float64)[
+            self.code["pidx"][self._bound]
+        ]
+        self._circuit._set_parameters(angles)
+        return self._circuit
+
+    def execute_with_params(self, params):
+        """Simulate with ``params`` bound and return the final Statevector"""
+        return self.bind(params).execute()
+
+    def expectation(self, params, qubit=0, observable="Z"):
+        return self.bind(params).expectation(qubit, observable)
+
+    def gradient(self, params, qubit=0, observable="Z"):
+        """Parameter-shift gradient of ``expectation`` with respect to ``params``"""
+        circuit = self.bind(params)
+        shifted = circuit.parameter_shift_expectations(
+            qubit, observable, gate_indices=self._bound
+        )
+        # A parameter feeding several gates collects each gate's derivative
+        return np.bincount(
+            self.code["pidx"][self._bound],
+            weights=(shifted[0] - shifted[1]) / 2.0,
+            minlength=self.num_params,
+        )
+
+    def __len__(self):
+        return self.code.size
+
+    def __repr__(self):
+        return f"GateBytecode({self.code.size} gates, {self.num_params} params)"
@@ -2,11 +2,25 @@
 Noise models for OmniQ simulations.
 """
 
+from array import array
+
+import numpy as np
+
+# Channel op codes; each channel stores two parameters
+_CHANNEL_NAMES = ("DEPOLARIZING", "RELAXATION")
+_DEPOLARIZING, _RELAXATION = range(len(_CHANNEL_NAMES))
+
+
 class NoiseModel:
+    __slots__ = ("name", "_ops", "_params")
+
     def __init__(self, name="Custom Noise"):
         self.name = name
-        self.channels = []
-    
+        # Channels are kept as parallel contiguous buffers: one op code and
+        # two float parameters per channel
+        self._ops = array("B")
+        self._params = array("d")
+
     @staticmethod
     def createTypicalModel():
         """Create a typical noise model with T1=50us, T2=70us"""
@@ -14,20 +28,43 @@ class NoiseModel:
         model.add_depolarizing_noise(0.001)
         model.add_relaxation_noise(50.0, 70.0)
         return model
-    
+
     def add_depolarizing_noise(self, probability):
-        self.channels.append(('DEPOLARIZING', probability))
+        self._ops.append(_DEPOLARIZING)
+        self._params.extend((probability, 0.0))
         return self
-    
+
     def add_relaxation_noise(self, t1, t2):
-        self.channels.append(('RELAXATION', t1, t2))
+        self._ops.append(_RELAXATION)
+        self._params.extend((t1, t2))
         return self
-    
+
+    @property
+    def channels(self):
+        """Channels as a tuple of tuples, e.g. ('RELAXATION', t1, t2)
+
+        The tuple is a snapshot, so add channels with add_depolarizing_noise
+        and add_relaxation_noise rather than by mutating it.
+        """
+        channels = []
+        params = self._params
+        for i, op in enumerate(self._ops):
+            if op == _DEPOLARIZING:
+                channels.append((_CHANNEL_NAMES[op], params[2 * i]))
+            else:
+                channels.append((_CHANNEL_NAMES[op], params[2 * i], params[2 * i + 1]))
+        return tuple(channels)
+
+    def to_arrays(self):
+        """Return (ops, params) as uint8 and (n, 2) float64 arrays"""
+        # Copied (one memcpy each): a live frombuffer view would stop the
+        # array.array buffers from growing when more channels are added
+        ops = np.frombuffer(self._ops, dtype=np.uint8).copy()
+        params = np.frombuffer(self._params, dtype=np.float64).reshape(-1, 2).copy()
+        return ops, params
+
     def to_dict(self):
-        return {
-            "name": self.name,
-            "channels": self.channels
-        }
-    
+        return {"name": self.name, "channels": list(self.channels)}
+
     def __str__(self):
-        return f"NoiseModel(name='{self.name}', channels={len(self.channels)})"
+        return f"NoiseModel(name='{self.name}', channels={len(self._ops)})"
@@ -5,24 +5,118 @@ Quantum Machine Learning model implementation.
 import numpy as np
 from typing import Optional, Callable
 
+from ..circuit import BYTECODE_DTYPE, GateBytecode, _GATE_CODES
+
+
 class QMLModel:
-    """Base class for quantum machine learning models."""
-    
-    def __init__(self, circuit, optimizer=None):
+    """Base class for quantum machine learning models.
+
+    ``circuit`` is a VariationalCircuit. Each sample's features are
+    angle-encoded as RY rotations on the first qubits, followed by the
+    ansatz, and the prediction is the circuit's expectation value.
+    """
+
+    def __init__(
+        self,
+        circuit,
+        optimizer: Optional[Callable] = None,
+        dtype=np.complex64,
+        learning_rate: float = 0.1,
+        batch_size: int = 32,
+    ):
         self.circuit = circuit
+        # optimizer(params, gradient) -> new params; plain gradient descent if None
         self.optimizer = optimizer
-    
-    def fit(self, X, y, **kwargs):
-        """Train the model."""
-        # Placeholder implementation
-        pass
-    
+        # complex64 states halve the bytes moved per gate; training tolerates it
+        self.dtype = np.dtype(dtype)
+        self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        # ((ansatz bytecode, feature count), encoded GateBytecode)
+        self._encoded = None
+
+    def _encoded_bytecode(self, x):
+        """Ansatz bytecode behind RY feature gates whose angles are set to ``x``
+
+        The encoding gates are constants, so gradients (and parameter
+        indices) are those of the ansatz alone.
+        """
+        features = np.asarray(x, dtype=np.float64).ravel()
+        if features.size > self.circuit.num_qubits:
+            raise ValueError(
+                f"{features.size} features do not fit on "
+                f"{self.circuit.num_qubits} qubits"
+            )
+        ansatz = self.circuit._bytecode()
+        if (
+            self._encoded is None
+            or self._encoded[0][0] is not ansatz
+            or self._encoded[0][1] != features.size
+        ):
+            encoding = np.empty(features.size, dtype=BYTECODE_DTYPE)
+            encoding["op"] = _GATE_CODES["RY"]
+            encoding["q0"] = np.arange(features.size)
+            encoding["q1"] = -1
+            encoding["pidx"] = -1
+            bytecode = GateBytecode(
+                self.circuit.num_qubits,
+                np.concatenate([encoding, ansatz.code]),
+                np.concatenate([features, ansatz.constants]),
+                ansatz.num_params,
+                dtype=self.dtype,
+            )
+            self._encoded = ((ansatz, features.size), bytecode)
+        bytecode = self._encoded[1]
+        bytecode.constants[: features.size] = features
+        return bytecode
+
+    def _predict_one(self, x, params):
+        return self._encoded_bytecode(x).expectation(
+            params, self.circuit.qubit, self.circuit.observable
+        )
+
+    def fit(self, X, y, epochs: int = 10, shuffle: bool = True, seed=None, **kwargs):
+        """Train the model on mean squared error; returns the loss after each epoch."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        rng = np.random.default_rng(seed)
+        params = np.asarray(self.circuit.params, dtype=np.float64)
+        qubit, observable = self.circuit.qubit, self.circuit.observable
+        history = []
+        for _ in range(epochs):
+            order = rng.permutation(len(X)) if shuffle else np.arange(len(X))
+            for start in range(0, len(X), self.batch_size):
+                batch = order[start : start + self.batch_size]
+                # One parameter update per minibatch; each sample needs a
+                # single parameter-shift sweep that reuses its prefix states
+                gradient = np.zeros_like(params)
+                for i in batch:
+                    bytecode = self._encoded_bytecode(X[i])
+                    value = bytecode.expectation(params, qubit, observable)
+                    # d/dθ of the squared error: 2 (f - y) df/dθ
+                    slope = bytecode.gradient(params, qubit, observable)
+                    gradient += 2.0 * (value - y[i]) * slope
+                gradient /= len(batch)
+                if self.optimizer is None:
+                    params = params - self.learning_rate * gradient
+                else:
+                    params = self.optimizer(params, gradient)
+            self.circuit.params = params
+            history.append(self.evaluate(X, y))
+        return history
+
     def predict(self, X):
         """Make predictions."""
-        # Placeholder implementation
-        return None
-    
+        if self.circuit.ansatz is None:
+            # Placeholder implementation
+            return None
+        params = self.circuit.params
+        return np.array(
+            [self._predict_one(x, params) for x in np.asarray(X, dtype=np.float64)]
+        )
+
     def evaluate(self, X, y):
-        """Evaluate the model."""
-        # Placeholder implementation
-        return None 
\ No newline at end of file
+        """Evaluate the model (mean squared error)."""
+        predictions = self.predict(X)
+        if predictions is None:
+            return None
+        return float(np.mean(np.square(predictions - np.asarray(y, dtype=np.float64))))
@@ -3,24 +3,62 @@ Variational circuit implementation for quantum machine learning.
 """
 
 import numpy as np
-from typing import List, Optional, Callable
+from typing import Optional, Callable
+
+from ..circuit import GateBytecode
+
 
 class VariationalCircuit:
     """Variational quantum circuit for parameterized quantum computing."""
-    
-    def __init__(self, num_qubits: int, num_params: int):
+
+    def __init__(
+        self,
+        num_qubits: int,
+        num_params: int,
+        ansatz: Optional[Callable] = None,
+        qubit: int = 0,
+        observable: str = "Z",
+    ):
         self.num_qubits = num_qubits
         self.num_params = num_params
         self.params = np.random.randn(num_params)
-    
+        # ansatz(params) -> Circuit whose parametric gates take params in order
+        self.ansatz = ansatz
+        self.qubit = qubit
+        self.observable = observable
+        self._compiled = None
+
+    def compile(self):
+        """Lower the ansatz once into a GateBytecode for forward() and gradient()."""
+        if self.ansatz is None:
+            raise ValueError("VariationalCircuit has no ansatz to compile")
+        self._compiled = (
+            self.ansatz,
+            GateBytecode.from_ansatz(self.ansatz, self.num_params),
+        )
+        return self._compiled[1]
+
+    def _bytecode(self):
+        # Recompile if the ansatz was replaced after the last compile()
+        if self._compiled is None or self._compiled[0] is not self.ansatz:
+            return self.compile()
+        return self._compiled[1]
+
     def forward(self, params: Optional[np.ndarray] = None):
         """Forward pass of the variational circuit."""
         if params is not None:
             self.params = params
-        # Placeholder implementation
-        return None
-    
+        if self.ansatz is None:
+            # Placeholder implementation
+            return None
+        return self._bytecode().expectation(self.params, self.qubit, self.observable)
+
     def gradient(self, params: Optional[np.ndarray] = None):
         """Calculate gradients with respect to parameters."""
-        # Placeholder implementation
-        return np.zeros_like(self.params) 
\ No newline at end of file
+        if params is not None:
+            self.params = params
+        if self.ansatz is None:
+            # Placeholder implementation
+            return np.zeros_like(self.params)
+        # Parameter-shift rule: all 2P shifted expectations in one call
+        return self._bytecode().gradient(self.params, self.qubit, self.observable)
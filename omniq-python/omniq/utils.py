@@ -5,129 +5,165 @@ Provides helper functions for common quantum computing tasks.
 """
 
 import numpy as np
-from typing import List, Optional
-from .circuit import Circuit, Statevector, DensityMatrix
+from typing import Optional
+from .circuit import Circuit, Statevector, DensityMatrix, GATE_DTYPE, _GATE_CODES
+
 
 def create_bell_state() -> Statevector:
     """
     Create a Bell state (|00⟩ + |11⟩)/√2.
-    
+
     Returns:
         Bell state as Statevector
     """
     circuit = Circuit(2)
-    circuit.add_gate('H', [0])
-    circuit.add_gate('CNOT', [0, 1])
+    circuit.add_gates([("H", 0, -1, 0.0), ("CNOT", 0, 1, 0.0)])
     return circuit.execute()
 
+
 def create_ghz_state(num_qubits: int) -> Statevector:
     """
     Create a GHZ state (|0...0⟩ + |1...1⟩)/√2.
-    
+
     Args:
         num_qubits: Number of qubits
-        
+
     Returns:
         GHZ state as Statevector
     """
+    # H on qubit 0 then a CNOT fan-out to every other qubit, appended in one call
+    fanout = np.zeros(num_qubits, dtype=GATE_DTYPE)
+    fanout["op"] = _GATE_CODES["CNOT"]
+    fanout["op"][0] = _GATE_CODES["H"]
+    fanout["q1"] = np.arange(num_qubits)
+    fanout["q1"][0] = -1
+
     circuit = Circuit(num_qubits)
-    circuit.add_gate('H', [0])
-    for i in range(1, num_qubits):
-        circuit.add_gate('CNOT', [0, i])
+    circuit.add_gates(fanout)
     return circuit.execute()
 
+
 def measure_expectation(state: Statevector, qubit: int, observable: str = "Z") -> float:
     """
     Measure expectation value of an observable.
-    
+
     Args:
         state: Quantum state
         qubit: Qubit index
         observable: Observable to measure
-        
+
     Returns:
         Expectation value
     """
     return state.measure_expectation(qubit, observable)
 
+
+def bloch_xyz(theta, phi):
+    """
+    Convert Bloch-sphere angles to Cartesian coordinates.
+
+    Accepts scalars or arrays, so a whole trajectory of states can be
+    converted in one call.
+
+    Args:
+        theta: Polar angle(s)
+        phi: Azimuthal angle(s)
+
+    Returns:
+        Tuple (x, y, z) of coordinate arrays
+    """
+    theta = np.asarray(theta, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    sin_theta = np.sin(theta)
+    return sin_theta * np.cos(phi), sin_theta * np.sin(phi), np.cos(theta)
+
+
 def calculate_fidelity(state1: Statevector, state2: Statevector) -> float:
     """
     Calculate fidelity between two quantum states.
-    
+
     Args:
         state1: First quantum state
         state2: Second quantum state
-        
+
     Returns:
         Fidelity value
     """
     # Calculate |⟨ψ₁|ψ₂⟩|²
-    amps1 = state1.get_amplitudes()
-    amps2 = state2.get_amplitudes()
-    
-    overlap = np.sum(np.conj(amps1) * amps2)
-    fidelity = np.abs(overlap) ** 2
-    
-    return float(fidelity)
+    amps1 = state1.get_amplitudes_view()
+    amps2 = state2.get_amplitudes_view()
+
+    # vdot conjugates its first argument in one pass, without temporaries
+    overlap = np.vdot(amps1, amps2)
+    return float(overlap.real * overlap.real + overlap.imag * overlap.imag)
+
 
 def random_circuit(num_qubits: int, depth: int, seed: Optional[int] = None) -> Circuit:
     """
     Generate a random quantum circuit.
-    
+
     Args:
         num_qubits: Number of qubits
         depth: Circuit depth
         seed: Random seed
-        
+
     Returns:
         Random quantum circuit
     """
-    if seed is not None:
-        np.random.seed(seed)
-    
+    rng = np.random.default_rng(seed)
+    gates = np.array(
+        [_GATE_CODES[g] for g in ("H", "X", "Y", "Z", "RX", "RY", "RZ")], dtype=np.uint8
+    )
+    rotations = np.array([_GATE_CODES[g] for g in ("RX", "RY", "RZ")], dtype=np.uint8)
+    num_pairs = num_qubits // 2 if num_qubits > 1 else 0
+
+    # Draw every layer up front: one row of records per layer, the random
+    # single-qubit gates followed by the random CNOT pairs
+    layers = np.empty((depth, num_qubits + num_pairs), dtype=GATE_DTYPE)
+    singles = layers[:, :num_qubits]
+    singles["op"] = gates[rng.integers(0, gates.size, (depth, num_qubits))]
+    singles["q0"] = np.arange(num_qubits)
+    singles["q1"] = -1
+    angles = rng.uniform(0.0, 2 * np.pi, (depth, num_qubits))
+    singles["angle"] = np.where(np.isin(singles["op"], rotations), angles, 0.0)
+
+    pairs = rng.integers(0, num_qubits, (depth, num_pairs, 2))
+    cnots = layers[:, num_qubits:]
+    cnots["op"] = _GATE_CODES["CNOT"]
+    cnots["q0"] = pairs[..., 0]
+    cnots["q1"] = pairs[..., 1]
+    cnots["angle"] = 0.0
+
+    # Pairs that drew the same qubit twice are dropped
+    keep = np.ones(layers.shape, dtype=bool)
+    keep[:, num_qubits:] = pairs[..., 0] != pairs[..., 1]
+
     circuit = Circuit(num_qubits)
-    gates = ['H', 'X', 'Y', 'Z', 'RX', 'RY', 'RZ']
-    
-    for layer in range(depth):
-        # Apply random single-qubit gates
-        for qubit in range(num_qubits):
-            gate = np.random.choice(gates)
-            if gate in ['RX', 'RY', 'RZ']:
-                angle = np.random.uniform(0, 2 * np.pi)
-                circuit.add_gate(gate, [qubit], angle=angle)
-            else:
-                circuit.add_gate(gate, [qubit])
-        
-        # Apply random two-qubit gates
-        if num_qubits > 1:
-            for _ in range(num_qubits // 2):
-                qubit1 = np.random.randint(0, num_qubits)
-                qubit2 = np.random.randint(0, num_qubits)
-                if qubit1 != qubit2:
-                    circuit.add_gate('CNOT', [qubit1, qubit2])
-    
+    circuit.add_gates(layers[keep])
     return circuit
 
+
 def create_quantum_state_from_amplitudes(amplitudes: np.ndarray) -> Statevector:
     """
     Create a quantum state from given amplitudes.
-    
+
     Args:
         amplitudes: Complex amplitudes array
-        
+
     Returns:
         Quantum state
     """
     return Statevector(amplitudes=amplitudes)
 
+
 def create_mixed_state_from_matrix(matrix: np.ndarray) -> DensityMatrix:
     """
     Create a mixed state from given density matrix.
-    
+
     Args:
         matrix: Density matrix
-        
+
     Returns:
         Mixed quantum state
     """
-    return DensityMatrix(matrix=matrix) 
\ No newline at end of file
+    return DensityMatrix(matrix=matrix)
@@ -0,0 +1,221 @@
+"""Grover sampling and the oracle builders in omniq.algorithms."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip(
+    "omniq._internals", reason="C++ core not built", exc_type=ImportError
+)
+
+from omniq import algorithms  # noqa: E402
+from omniq.algorithms import (  # noqa: E402
+    GroversAlgorithm,
+    create_database_oracle,
+    create_graph_coloring_oracle,
+    create_sat_oracle,
+)
+from omniq.noise import NoiseModel  # noqa: E402
+
+SHOTS = 4000
+
+
+def grover(num_qubits=4, target=11):
+    return GroversAlgorithm(num_qubits, create_database_oracle(target))
+
+
+def test_noise_free_seed_is_reproducible():
+    algorithm = grover()
+    first = algorithm.execute(500, seed=7)
+    np.testing.assert_array_equal(first, algorithm.execute(500, seed=7))
+    assert not np.array_equal(first, algorithm.execute(500, seed=8))
+
+
+# -1 may resolve to a single worker on small machines; 2 always splits shots
+@pytest.mark.parametrize("n_jobs", [-1, 2])
+def test_noisy_counts_do_not_depend_on_n_jobs(n_jobs):
+    algorithm = grover()
+    noise = NoiseModel().add_depolarizing_noise(0.05)
+    serial = algorithm.execute(200, noise_model=noise, n_jobs=1, seed=3)
+    parallel = algorithm.execute(200, noise_model=noise, n_jobs=n_jobs, seed=3)
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_zero_depolarizing_matches_noise_free_distribution():
+    algorithm = grover()
+    noise = NoiseModel().add_depolarizing_noise(0.0)
+    size = 1 << algorithm.num_qubits
+    noisy = np.bincount(
+        algorithm.execute(SHOTS, noise_model=noise, n_jobs=1, seed=1), minlength=size
+    )
+    clean = np.bincount(algorithm.execute(SHOTS, seed=2), minlength=size)
+    # Total variation distance between the two empirical distributions
+    assert 0.5 * np.abs(noisy - clean).sum() / SHOTS < 0.03
+    p = algorithm.get_success_probability()
+    for counts in (noisy, clean):
+        assert abs(counts[11] / SHOTS - p) < 4 * np.sqrt(p * (1 - p) / SHOTS)
+
+
+def test_relaxation_channels_are_reported():
+    noise = NoiseModel().add_depolarizing_noise(0.01).add_relaxation_noise(50, 70)
+    with pytest.warns(UserWarning, match="1 other channel"):
+        results = grover().execute(10, noise_model=noise, n_jobs=1, seed=0)
+    assert results.shape == (10,)
+
+
+# Loop-based references, as the oracles were written before vectorization
+def database_reference(target, bits):
+    return sum(int(bit) << i for i, bit in enumerate(bits)) == target
+
+
+def sat_reference(clauses, num_variables, bits):
+    for clause in clauses:
+        satisfied = False
+        for literal in clause:
+            var = abs(literal) - 1
+            if var >= num_variables:
+                continue
+            value = bool(bits[var]) if var < len(bits) else False
+            if value == (literal > 0):
+                satisfied = True
+                break
+        if not satisfied:
+            return False
+    return True
+
+
+def coloring_reference(edges, num_vertices, num_colors, bits):
+    for v1, v2 in edges:
+        if v1 >= num_vertices or v2 >= num_vertices:
+            continue
+        color1 = color2 = -1
+        for c in range(num_colors):
+            if v1 * num_colors + c < len(bits) and bits[v1 * num_colors + c]:
+                color1 = c
+            if v2 * num_colors + c < len(bits) and bits[v2 * num_colors + c]:
+                color2 = c
+        if color1 == color2 and color1 != -1:
+            return False
+    return True
+
+
+def all_assignments(num_bits):
+    """Every assignment as rows of little-endian bits, row i encoding i"""
+    return (np.arange(1 << num_bits)[:, None] >> np.arange(num_bits)) & 1
+
+
+def random_clauses(rng, num_variables, num_clauses, max_literal):
+    clauses = []
+    for _ in range(num_clauses):
+        size = int(rng.integers(1, 4))
+        variables = rng.choice(np.arange(1, max_literal + 1), size, replace=False)
+        signs = rng.choice([-1, 1], size)
+        clauses.append((variables * signs).tolist())
+    return clauses
+
+
+@pytest.mark.parametrize("target", [0, 5, 37, 63, 64])
+def test_database_oracle_matches_reference(target):
+    oracle = create_database_oracle(target)
+    bits = all_assignments(6)
+    expected = np.array([database_reference(target, row) for row in bits])
+    assert [oracle(row.tolist()) for row in bits] == expected.tolist()
+    assert [oracle(row) for row in bits] == expected.tolist()
+    assert [oracle(i) for i in range(len(bits))] == expected.tolist()
+    np.testing.assert_array_equal(oracle.batch(bits), expected)
+
+
+def test_database_oracle_batch_bit_widths():
+    rng = np.random.default_rng(0)
+    for width in (1, 8, 9, 63, 64):
+        bits = rng.integers(0, 2, (50, width))
+        target = int(sum(int(b) << i for i, b in enumerate(bits[7])))
+        expected = [database_reference(target, row) for row in bits]
+        np.testing.assert_array_equal(
+            create_database_oracle(target).batch(bits), expected
+        )
+    with pytest.raises(ValueError):
+        create_database_oracle(0).batch(np.zeros((2, 65)))
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def sat_kernels(request, monkeypatch):
+    """Run the SAT oracles with the Numba kernels (when installed) and without"""
+    if request.param == "numba":
+        if algorithms.njit is None:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(algorithms, "njit", None)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_sat_oracle_matches_reference(sat_kernels, seed):
+    rng = np.random.default_rng(seed)
+    num_variables = 6
+    # Literals past num_variables are ignored by both implementations
+    clauses = random_clauses(rng, num_variables, 5, num_variables + 1)
+    oracle = create_sat_oracle(clauses, num_variables)
+    bits = all_assignments(num_variables)
+    expected = [sat_reference(clauses, num_variables, row) for row in bits]
+    assert [oracle(row.tolist()) for row in bits] == expected
+    assert [oracle(i) for i in range(len(bits))] == expected
+    packed = np.arange(len(bits), dtype=np.uint64)
+    np.testing.assert_array_equal(oracle.batch(packed), expected)
+    np.testing.assert_array_equal(
+        oracle.batch(packed.reshape(8, -1)), np.reshape(expected, (8, -1))
+    )
+    # Short inputs leave the remaining variables False
+    short = [row[:3].tolist() for row in bits]
+    assert [oracle(row) for row in short] == [
+        sat_reference(clauses, num_variables, row) for row in short
+    ]
+
+
+def test_sat_oracle_64_variables(sat_kernels):
+    clauses = [[1, -64], [-1, 64], [63, 2]]
+    oracle = create_sat_oracle(clauses, 64)
+    rng = np.random.default_rng(1)
+    bits = rng.integers(0, 2, (200, 64))
+    bits[:, 63] = bits[:, 0]
+    expected = [sat_reference(clauses, 64, row) for row in bits]
+    assert [oracle(row.tolist()) for row in bits] == expected
+    packed = np.array(
+        [sum(int(b) << i for i, b in enumerate(row)) for row in bits], dtype=np.uint64
+    )
+    np.testing.assert_array_equal(oracle.batch(packed), expected)
+
+
+def test_sat_oracle_over_64_variables():
+    # Past 64 variables the masks stay Python ints and there is no batch path
+    num_variables = 70
+    relevant = [1, 2, 3, 66, 67, 70]
+    clauses = [[1, -66], [-2, 67, 70], [3, -70], [-67, -1], [71, 66]]
+    oracle = create_sat_oracle(clauses, num_variables)
+    rng = np.random.default_rng(2)
+    for values in all_assignments(len(relevant)):
+        bits = rng.integers(0, 2, num_variables)
+        bits[np.array(relevant) - 1] = values
+        expected = sat_reference(clauses, num_variables, bits)
+        assert oracle(bits.tolist()) == expected
+        assert oracle(sum(int(b) << i for i, b in enumerate(bits))) == expected
+    with pytest.raises(ValueError):
+        oracle.batch(np.zeros(4, dtype=np.uint64))
+
+
+@pytest.mark.parametrize(
+    "edges, num_vertices, num_colors",
+    [
+        ([(0, 1), (1, 2)], 3, 2),
+        ([(0, 1), (0, 2), (1, 2), (2, 5)], 3, 2),
+        ([(0, 1), (1, 0)], 2, 3),
+    ],
+)
+def test_graph_coloring_oracle_matches_reference(edges, num_vertices, num_colors):
+    oracle = create_graph_coloring_oracle(edges, num_vertices, num_colors)
+    size = num_vertices * num_colors
+    # Every assignment, multi-hot and uncolored vertices included, plus
+    # truncated and over-long inputs
+    for row in all_assignments(size):
+        for bits in (row.tolist(), row[: size - 1].tolist(), row.tolist() + [1]):
+            assert oracle(bits) == coloring_reference(
+                edges, num_vertices, num_colors, bits
+            ), bits
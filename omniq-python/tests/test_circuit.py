@@ -0,0 +1,269 @@
+"""Circuit.execute() and Statevector against a dense matrix reference."""
+
+import numpy as np
+import pytest
+
+from omniq import circuit as circuit_module
+from omniq.circuit import Circuit, Statevector
+
+H = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+X = np.array([[0, 1], [1, 0]])
+Y = np.array([[0, -1j], [1j, 0]])
+Z = np.diag([1, -1])
+I2 = np.eye(2)
+
+
+def rx(t):
+    return np.array(
+        [[np.cos(t / 2), -1j * np.sin(t / 2)], [-1j * np.sin(t / 2), np.cos(t / 2)]]
+    )
+
+
+def ry(t):
+    return np.array([[np.cos(t / 2), -np.sin(t / 2)], [np.sin(t / 2), np.cos(t / 2)]])
+
+
+def rz(t):
+    return np.diag([np.exp(-0.5j * t), np.exp(0.5j * t)])
+
+
+def phase(t):
+    return np.diag([1, np.exp(1j * t)])
+
+
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+
+def cp(t):
+    return np.diag([1, 1, 1, np.exp(1j * t)])
+
+
+def embed(matrix, qubits, n):
+    """Full 2^n unitary of ``matrix`` on ``qubits``; qubits[0] is the matrix MSB"""
+    k = len(qubits)
+    full = np.zeros((1 << n, 1 << n), dtype=complex)
+    for i in range(1 << n):
+        sub = 0
+        for q in qubits:
+            sub = (sub << 1) | ((i >> q) & 1)
+        for out in range(1 << k):
+            j = i
+            for pos, q in enumerate(qubits):
+                bit = (out >> (k - 1 - pos)) & 1
+                j = (j & ~(1 << q)) | (bit << q)
+            full[j, i] += matrix[out, sub]
+    return full
+
+
+def random_circuit(n, depth, rng):
+    """(Circuit, dense reference state) built from the same random gates"""
+    circuit = Circuit(n)
+    psi = np.zeros(1 << n, dtype=complex)
+    psi[0] = 1
+    single = [
+        ("h", H),
+        ("x", X),
+        ("y", Y),
+        ("z", Z),
+    ]
+    rotations = [("rx", rx), ("ry", ry), ("rz", rz), ("phase", phase)]
+    for _ in range(depth):
+        kind = rng.integers(4)
+        if kind == 0:
+            name, matrix = single[rng.integers(len(single))]
+            q = int(rng.integers(n))
+            getattr(circuit, name)(q)
+            psi = embed(matrix, [q], n) @ psi
+        elif kind == 1:
+            name, make = rotations[rng.integers(len(rotations))]
+            q = int(rng.integers(n))
+            t = float(rng.uniform(0, 2 * np.pi))
+            getattr(circuit, name)(q, t)
+            psi = embed(make(t), [q], n) @ psi
+        else:
+            a, b = (int(q) for q in rng.choice(n, 2, replace=False))
+            which = rng.integers(3)
+            if which == 0:
+                circuit.cx(a, b)
+                psi = embed(CNOT, [a, b], n) @ psi
+            elif which == 1:
+                circuit.swap(a, b)
+                psi = embed(SWAP, [a, b], n) @ psi
+            else:
+                t = float(rng.uniform(0, 2 * np.pi))
+                circuit.cp(t, a, b)
+                psi = embed(cp(t), [a, b], n) @ psi
+    return circuit, psi
+
+
+@pytest.mark.parametrize(
+    "name, matrix",
+    [("h", H), ("x", X), ("y", Y), ("z", Z)],
+)
+@pytest.mark.parametrize("qubit", [0, 1, 2])
+def test_single_qubit_gate(name, matrix, qubit):
+    n = 3
+    psi = np.random.default_rng(qubit).normal(size=(1 << n, 2)) @ [1, 1j]
+    psi /= np.linalg.norm(psi)
+    circuit = Circuit(n)
+    getattr(circuit, name)(qubit)
+    out = circuit.execute(Statevector(amplitudes=psi)).get_amplitudes()
+    np.testing.assert_allclose(out, embed(matrix, [qubit], n) @ psi, atol=1e-12)
+
+
+@pytest.mark.parametrize("name, make", [("rx", rx), ("ry", ry), ("rz", rz)])
+def test_rotation_gate(name, make):
+    circuit = Circuit(2)
+    circuit.h(0)
+    circuit.h(1)
+    getattr(circuit, name)(1, 0.7)
+    psi = np.full(4, 0.5, dtype=complex)
+    expected = embed(make(0.7), [1], 2) @ psi
+    np.testing.assert_allclose(circuit.execute().get_amplitudes(), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("control, target", [(0, 1), (1, 0), (0, 2), (2, 0)])
+def test_cnot_qubit_order(control, target):
+    # Qubit k is bit k of the basis index
+    circuit = Circuit(3)
+    circuit.x(control)
+    circuit.cx(control, target)
+    amplitudes = circuit.execute().get_amplitudes()
+    expected = np.zeros(8)
+    expected[(1 << control) | (1 << target)] = 1
+    np.testing.assert_allclose(amplitudes, expected, atol=1e-12)
+
+
+def test_single_x_sets_its_bit():
+    circuit = Circuit(4)
+    circuit.x(2)
+    assert np.argmax(np.abs(circuit.execute().get_amplitudes())) == 0b0100
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_circuit_matches_dense_reference(seed):
+    rng = np.random.default_rng(seed)
+    circuit, expected = random_circuit(4, 40, rng)
+    out = circuit.execute().get_amplitudes()
+    np.testing.assert_allclose(out, expected, atol=1e-10)
+
+
+def test_backends_without_opt_einsum(monkeypatch):
+    # Only the NumPy backend runs without opt_einsum; others fail up front
+    monkeypatch.setattr(circuit_module, "oe", None)
+    circuit, expected = random_circuit(4, 20, np.random.default_rng(3))
+    out = circuit.execute(backend="numpy").get_amplitudes()
+    np.testing.assert_allclose(out, expected, atol=1e-10)
+    with pytest.raises(ImportError, match="opt_einsum"):
+        circuit.execute(backend="torch")
+
+
+def test_opt_einsum_contraction_matches_dense_reference():
+    pytest.importorskip("opt_einsum")
+    circuit, expected = random_circuit(4, 30, np.random.default_rng(5))
+    psi = np.zeros((2,) * 4, dtype=np.complex128)
+    psi[(0,) * 4] = 1.0
+    for matrix, qubits in circuit._fuse():
+        gate = matrix.reshape((2,) * (2 * len(qubits)))
+        expr = Circuit._compile_contraction(qubits, gate.shape, psi.shape)
+        psi = expr(gate, psi, backend="numpy")
+    np.testing.assert_allclose(psi.reshape(-1), expected, atol=1e-10)
+
+
+def test_complex64_close_to_complex128():
+    circuit, expected = random_circuit(4, 30, np.random.default_rng(11))
+    single = Circuit(4, dtype=np.complex64)
+    single.add_gates(
+        [
+            (r.op, r.q0, -1 if r.q1 is None else r.q1, r.param or 0.0)
+            for r in circuit.gate_records()
+        ]
+    )
+    out = single.execute().get_amplitudes()
+    assert out.dtype == np.complex64
+    np.testing.assert_allclose(out, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_statevector_apply_gate_matches_execute(seed):
+    circuit, expected = random_circuit(3, 25, np.random.default_rng(seed))
+    state = Statevector(3)
+    for record in circuit.gate_records():
+        qubits = [record.q0] if record.q1 is None else [record.q0, record.q1]
+        state.apply_gate(record.op, qubits, record.param or 0.0)
+    np.testing.assert_allclose(state.get_amplitudes(), expected, atol=1e-10)
+
+
+def test_measure_all_statistics():
+    circuit = Circuit(2)
+    circuit.ry(0, 2 * np.arccos(np.sqrt(0.2)))
+    circuit.h(1)
+    state = circuit.execute()
+    probabilities = np.abs(state.get_amplitudes()) ** 2
+    shots = 40000
+    samples = state.measure_all(shots, seed=3)
+    assert samples.dtype == np.int64
+    assert samples.min() >= 0 and samples.max() < 4
+    counts = np.bincount(samples, minlength=4) / shots
+    np.testing.assert_allclose(counts, probabilities, atol=0.01)
+    # Seeded sampling is reproducible
+    np.testing.assert_array_equal(samples, state.measure_all(shots, seed=3))
+
+
+def test_measure_marginal_statistics():
+    circuit = Circuit(3)
+    circuit.ry(1, 2 * np.arcsin(np.sqrt(0.3)))
+    state = circuit.execute()
+    outcomes = [state.measure(1, seed=s) for s in range(4000)]
+    assert abs(np.mean(outcomes) - 0.3) < 0.03
+    assert all(state.measure(0, seed=s) == 0 for s in range(50))
+
+
+@pytest.mark.parametrize("pauli", ["ZII", "IXI", "YZX", "XXY", "ZZZ", "IYI", "III"])
+def test_pauli_expectation(pauli):
+    circuit, psi = random_circuit(3, 30, np.random.default_rng(5))
+    operators = {"I": I2, "X": X, "Y": Y, "Z": Z}
+    # Character k acts on qubit k, the k-th least significant bit
+    dense = np.array([[1]])
+    for p in pauli:
+        dense = np.kron(operators[p], dense)
+    expected = np.vdot(psi, dense @ psi).real
+    state = circuit.execute()
+    assert state.pauli_expectation(pauli) == pytest.approx(expected, abs=1e-10)
+
+
+def test_measure_expectation_matches_pauli_expectation():
+    circuit, _ = random_circuit(3, 30, np.random.default_rng(8))
+    state = circuit.execute()
+    for qubit in range(3):
+        for p in "XYZ":
+            pauli = "".join(p if q == qubit else "I" for q in range(3))
+            assert state.measure_expectation(qubit, p) == pytest.approx(
+                state.pauli_expectation(pauli), abs=1e-10
+            )
+
+
+@pytest.mark.parametrize("legacy", [True, False])
+def test_json_round_trip(tmp_path, legacy):
+    import json
+
+    circuit, _ = random_circuit(4, 30, np.random.default_rng(2))
+    path = tmp_path / "circuit.json"
+    circuit.save_json(path, legacy=legacy)
+    with open(path) as f:
+        restored = Circuit.from_dict(json.load(f))
+    assert restored.num_qubits == circuit.num_qubits
+    assert restored.gate_records() == circuit.gate_records()
+    np.testing.assert_allclose(
+        restored.execute().get_amplitudes(),
+        circuit.execute().get_amplitudes(),
+        atol=1e-12,
+    )
+
+
+def test_dict_round_trip():
+    circuit, _ = random_circuit(3, 20, np.random.default_rng(4))
+    for legacy in (True, False):
+        restored = Circuit.from_dict(circuit.to_dict(legacy=legacy))
+        assert restored.gate_records() == circuit.gate_records()
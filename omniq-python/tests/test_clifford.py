@@ -0,0 +1,90 @@
+"""execute_clifford must sample the same outcomes as the dense simulator."""
+
+import numpy as np
+import pytest
+
+from omniq.circuit import Circuit
+
+pytest.importorskip(
+    "omniq._internals", reason="C++ core not built", exc_type=ImportError
+)
+
+SHOTS = 400
+
+
+def random_clifford(n, depth, seed):
+    rng = np.random.default_rng(seed)
+    circuit = Circuit(n)
+    for _ in range(depth):
+        kind = rng.integers(4)
+        q = int(rng.integers(n))
+        if kind == 0:
+            getattr(circuit, ("h", "x", "y", "z")[rng.integers(4)])(q)
+        elif kind == 1:
+            # Quarter turns are Clifford: S powers and their H/S conjugates
+            name = ("rx", "ry", "rz", "phase")[rng.integers(4)]
+            getattr(circuit, name)(q, float(rng.integers(1, 4)) * np.pi / 2)
+        else:
+            a, b = (int(x) for x in rng.choice(n, 2, replace=False))
+            which = rng.integers(3)
+            if which == 0:
+                circuit.cx(a, b)
+            elif which == 1:
+                circuit.swap(a, b)
+            else:
+                circuit.cp(np.pi, a, b)
+    return circuit
+
+
+def sample(circuit, shots):
+    counts = np.zeros(1 << circuit.num_qubits)
+    for _ in range(shots):
+        simulator = circuit.execute_clifford()
+        outcome = sum(simulator.measure(q) << q for q in range(circuit.num_qubits))
+        counts[outcome] += 1
+    return counts / shots
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_random_clifford_matches_dense_distribution(seed):
+    circuit = random_clifford(3, 20, seed)
+    expected = circuit.execute().probabilities()
+    frequencies = sample(circuit, SHOTS)
+    # Outcomes off the support point at a sign or phase error in the tableau
+    assert np.all(expected[frequencies > 0] > 1e-9)
+    np.testing.assert_allclose(frequencies, expected, atol=0.1)
+
+
+def test_ghz_outcomes_agree():
+    circuit = Circuit(5)
+    circuit.h(0)
+    for q in range(1, 5):
+        circuit.cx(q - 1, q)
+    frequencies = sample(circuit, SHOTS)
+    assert set(np.flatnonzero(frequencies)) <= {0, 31}
+    assert abs(frequencies[0] - 0.5) < 0.1
+
+
+def test_phase_chain_is_deterministic():
+    # H S S H = X on qubit 0; H Z H on qubit 1 of a Bell pair flips parity
+    circuit = Circuit(3)
+    circuit.h(0)
+    circuit.phase(0, np.pi / 2)
+    circuit.phase(0, np.pi / 2)
+    circuit.h(0)
+    circuit.h(1)
+    circuit.cx(1, 2)
+    circuit.z(2)
+    circuit.h(1)
+    circuit.h(2)
+    expected = circuit.execute().probabilities()
+    frequencies = sample(circuit, 50)
+    np.testing.assert_allclose(frequencies[expected < 1e-9], 0.0)
+    assert all(frequencies[i] > 0 for i in np.flatnonzero(expected > 0.4))
+
+
+def test_non_clifford_circuit_is_rejected():
+    circuit = Circuit(1)
+    circuit.rx(0, 0.3)
+    with pytest.raises(ValueError):
+        circuit.execute_clifford()
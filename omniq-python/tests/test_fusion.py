@@ -0,0 +1,117 @@
+"""Every OMNIQ_FUSE_LEVEL must produce the same state as unfused execution."""
+
+import numpy as np
+import pytest
+
+from omniq import circuit as circuit_module
+from omniq.circuit import Circuit
+
+LEVELS = [0, 1, 2, 3]
+
+
+def random_circuit(n, depth, seed):
+    rng = np.random.default_rng(seed)
+    circuit = Circuit(n)
+    for _ in range(depth):
+        kind = rng.integers(5)
+        q = int(rng.integers(n))
+        if kind == 0:
+            getattr(circuit, ("h", "x", "y", "z")[rng.integers(4)])(q)
+        elif kind == 1:
+            name = ("rx", "ry", "rz", "phase")[rng.integers(4)]
+            getattr(circuit, name)(q, float(rng.uniform(0, 2 * np.pi)))
+        else:
+            # Any ordered pair, so non-adjacent and reversed (high, low) pairs occur
+            a, b = (int(x) for x in rng.choice(n, 2, replace=False))
+            which = rng.integers(3)
+            if which == 0:
+                circuit.cx(a, b)
+            elif which == 1:
+                circuit.swap(a, b)
+            else:
+                circuit.cp(float(rng.uniform(0, 2 * np.pi)), a, b)
+    return circuit
+
+
+def prefix(circuit, length):
+    """The first ``length`` gates of ``circuit`` as a new circuit"""
+    data = circuit.to_dict(legacy=False)
+    for key in ("ops", "q0", "q1", "params"):
+        data[key] = data[key][:length]
+    return Circuit.from_dict(data)
+
+
+def execute_at(monkeypatch, circuit, level):
+    monkeypatch.setenv("OMNIQ_FUSE_LEVEL", str(level))
+    return circuit.execute()
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("n", [3, 5, 7])
+def test_levels_agree(monkeypatch, n, seed):
+    circuit = random_circuit(n, 60, seed)
+    reference = execute_at(monkeypatch, circuit, 0).get_amplitudes()
+    for level in LEVELS[1:]:
+        out = execute_at(monkeypatch, circuit, level).get_amplitudes()
+        assert np.allclose(out, reference, atol=1e-10), f"level {level}"
+
+
+def test_reversed_and_distant_pairs(monkeypatch):
+    circuit = Circuit(6)
+    for q in range(6):
+        circuit.h(q)
+    circuit.cx(5, 0)
+    circuit.rz(0, 0.3)
+    circuit.cx(0, 5)
+    circuit.cp(0.9, 4, 1)
+    circuit.swap(1, 4)
+    circuit.ry(4, 1.1)
+    circuit.cx(3, 2)
+    circuit.cx(2, 3)
+    reference = execute_at(monkeypatch, circuit, 0).get_amplitudes()
+    for level in LEVELS[1:]:
+        out = execute_at(monkeypatch, circuit, level).get_amplitudes()
+        assert np.allclose(out, reference, atol=1e-12), f"level {level}"
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_measurement_inside_fusion_window(monkeypatch, seed):
+    # Stopping after every gate cuts fusion blocks at arbitrary points; the
+    # measurement statistics there must not depend on the fusion level
+    circuit = random_circuit(4, 24, seed)
+    for length in range(1, 25):
+        partial = prefix(circuit, length)
+        states = [execute_at(monkeypatch, partial, level) for level in LEVELS]
+        reference = states[0].probabilities()
+        for level, state in zip(LEVELS[1:], states[1:]):
+            assert np.allclose(state.probabilities(), reference, atol=1e-10)
+            for qubit in range(4):
+                assert state.measure_expectation(qubit) == pytest.approx(
+                    states[0].measure_expectation(qubit), abs=1e-10
+                ), f"level {level}, {length} gates"
+
+
+def test_parametric_blocks_bypass_the_fused_cache(monkeypatch):
+    # A sweep over angles must neither fill the cache nor evict fixed blocks
+    monkeypatch.setenv("OMNIQ_FUSE_LEVEL", "3")
+    circuit_module._cached_fused_unitary.cache_clear()
+    fixed = Circuit(2)
+    fixed.h(0)
+    fixed.cx(0, 1)
+    fixed.h(1)
+    fixed.execute()
+    assert circuit_module._cached_fused_unitary.cache_info().currsize == 1
+
+    for angle in np.linspace(0.0, np.pi, 20):
+        swept = Circuit(2)
+        swept.h(0)
+        swept.rx(1, float(angle))
+        swept.cx(0, 1)
+        reference = execute_at(monkeypatch, swept, 0).get_amplitudes()
+        out = execute_at(monkeypatch, swept, 3).get_amplitudes()
+        assert np.allclose(out, reference, atol=1e-12)
+    info = circuit_module._cached_fused_unitary.cache_info()
+    assert info.currsize == 1
+
+    fixed.execute()
+    assert circuit_module._cached_fused_unitary.cache_info().hits == info.hits + 1
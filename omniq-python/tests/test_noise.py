@@ -0,0 +1,28 @@
+"""NoiseModel channel bookkeeping."""
+
+import numpy as np
+import pytest
+
+from omniq.noise import NoiseModel
+
+
+def test_channels_is_an_immutable_snapshot():
+    model = NoiseModel().add_depolarizing_noise(0.01)
+    channels = model.channels
+    assert channels == (("DEPOLARIZING", 0.01),)
+    with pytest.raises(AttributeError):
+        channels.append(("DEPOLARIZING", 0.2))
+    model.add_relaxation_noise(50.0, 70.0)
+    assert channels == (("DEPOLARIZING", 0.01),)
+    assert model.channels == (("DEPOLARIZING", 0.01), ("RELAXATION", 50.0, 70.0))
+
+
+def test_to_dict_and_to_arrays_follow_added_channels():
+    model = NoiseModel.createTypicalModel()
+    assert model.to_dict() == {
+        "name": "Typical Hardware Noise",
+        "channels": [("DEPOLARIZING", 0.001), ("RELAXATION", 50.0, 70.0)],
+    }
+    ops, params = model.to_arrays()
+    np.testing.assert_array_equal(ops, [0, 1])
+    np.testing.assert_array_equal(params, [[0.001, 0.0], [50.0, 70.0]])
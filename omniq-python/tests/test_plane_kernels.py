@@ -0,0 +1,89 @@
+"""Every SIMD path of the native plane kernels must match the NumPy kernel."""
+
+import numpy as np
+import pytest
+
+from omniq.circuit import _apply_gate_planes
+
+_internals = pytest.importorskip(
+    "omniq._internals", reason="C++ core not built", exc_type=ImportError
+)
+planes = _internals._plane_kernels
+if planes is None or not hasattr(planes, "set_isa"):
+    pytest.skip("core built without plane kernels", allow_module_level=True)
+
+ISAS = ["scalar", "avx2", "avx512"]
+SUPPORTED = ISAS[: ISAS.index(planes.best_isa()) + 1]
+TOLERANCE = {np.float64: 1e-12, np.float32: 1e-5}
+
+
+@pytest.fixture(params=ISAS)
+def isa(request):
+    if request.param not in SUPPORTED:
+        pytest.skip(f"CPU lacks {request.param}")
+    previous = planes.isa()
+    planes.set_isa(request.param)
+    yield request.param
+    planes.set_isa(previous)
+
+
+def random_planes(n, dtype, rng):
+    return rng.normal(size=(2, 1 << n)).astype(dtype)
+
+
+def reference(state, matrix, qubits):
+    """The NumPy plane kernel, as used by Statevector.apply_gate"""
+    n = state.shape[1].bit_length() - 1
+    shape = (2,) * (n + 1)
+    result = _apply_gate_planes(
+        state.copy().reshape(shape), matrix, [n - q for q in qubits]
+    )
+    return result.reshape(2, -1)
+
+
+def random_unitary(rng):
+    q, r = np.linalg.qr(rng.normal(size=(2, 2)) + 1j * rng.normal(size=(2, 2)))
+    return q * (np.diagonal(r) / np.abs(np.diagonal(r)))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("n", [8, 9, 11])
+def test_single_qubit_matches_numpy(isa, n, dtype):
+    rng = np.random.default_rng(n)
+    for target in range(n):
+        matrix = random_unitary(rng)
+        state = random_planes(n, dtype, rng)
+        expected = reference(state, matrix.astype(np.complex128), [target])
+        re, im = state[0].copy(), state[1].copy()
+        planes.apply_1q(re, im, *matrix.ravel().tolist(), target)
+        np.testing.assert_allclose(re, expected[0], atol=TOLERANCE[dtype])
+        np.testing.assert_allclose(im, expected[1], atol=TOLERANCE[dtype])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("n", [8, 9, 11])
+def test_cnot_matches_numpy(isa, n, dtype):
+    rng = np.random.default_rng(n)
+    cnot = np.eye(4)[[0, 1, 3, 2]].astype(np.complex128)
+    for control, target in [(0, n - 1), (n - 1, 0), (3, 4), (5, 2)]:
+        state = random_planes(n, dtype, rng)
+        expected = reference(state, cnot, [control, target])
+        re, im = state[0].copy(), state[1].copy()
+        planes.apply_cnot(re, im, control, target)
+        np.testing.assert_array_equal(re, expected[0])
+        np.testing.assert_array_equal(im, expected[1])
+
+
+def test_set_isa_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        planes.set_isa("sse")
+
+
+def test_set_isa_round_trips():
+    previous = planes.isa()
+    try:
+        for name in SUPPORTED:
+            planes.set_isa(name)
+            assert planes.isa() == name
+    finally:
+        planes.set_isa(previous)
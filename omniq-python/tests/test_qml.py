@@ -0,0 +1,95 @@
+"""Parameter-shift training through GateBytecode."""
+
+import numpy as np
+import pytest
+
+from omniq.circuit import Circuit
+from omniq.qml import QMLModel, VariationalCircuit
+
+
+def ansatz(params):
+    # A fixed-angle rotation and params[0] feeding two gates
+    circuit = Circuit(2)
+    circuit.ry(0, params[0])
+    circuit.rz(1, 0.3)
+    circuit.cx(0, 1)
+    circuit.ry(1, params[1])
+    circuit.rx(0, params[0])
+    circuit.cp(params[2], 1, 0)
+    circuit.rx(1, params[2])
+    return circuit
+
+
+def loss(model, X, y, params):
+    model.circuit.params = params
+    return model.evaluate(X, y)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, np.pi, (8, 2))
+    y = np.cos(X[:, 0]) * 0.5
+    return X, y
+
+
+def test_variational_gradient_matches_finite_differences():
+    vc = VariationalCircuit(2, 3, ansatz=ansatz)
+    params = np.array([0.4, -1.2, 0.9])
+    eps = 1e-6
+    numeric = np.array(
+        [
+            (vc.forward(params + eps * e) - vc.forward(params - eps * e)) / (2 * eps)
+            for e in np.eye(3)
+        ]
+    )
+    np.testing.assert_allclose(vc.gradient(params), numeric, atol=1e-6)
+
+
+def test_fit_with_fixed_and_shared_parameters(data):
+    X, y = data
+    vc = VariationalCircuit(2, 3, ansatz=ansatz)
+    vc.params = np.array([0.4, -1.2, 0.9])
+    model = QMLModel(vc, dtype=np.complex128, learning_rate=0.2, batch_size=4)
+    before = model.evaluate(X, y)
+    history = model.fit(X, y, epochs=5, seed=1)
+    assert len(history) == 5
+    assert history[-1] < before
+
+
+def test_fit_step_follows_loss_gradient(data):
+    X, y = data
+    vc = VariationalCircuit(2, 3, ansatz=ansatz)
+    start = np.array([0.4, -1.2, 0.9])
+    vc.params = start.copy()
+    model = QMLModel(vc, dtype=np.complex128, learning_rate=0.1, batch_size=len(X))
+    model.fit(X, y, epochs=1, shuffle=False)
+    step = (start - vc.params) / 0.1
+    eps = 1e-6
+    numeric = np.array(
+        [
+            (loss(model, X, y, start + eps * e) - loss(model, X, y, start - eps * e))
+            / (2 * eps)
+            for e in np.eye(3)
+        ]
+    )
+    np.testing.assert_allclose(step, numeric, atol=1e-6)
+
+
+def test_predict_encodes_features():
+    vc = VariationalCircuit(2, 3, ansatz=ansatz)
+    vc.params = np.zeros(3)
+    model = QMLModel(vc, dtype=np.complex128)
+    x = np.array([0.7, 0.2])
+    reference = Circuit(2)
+    reference.ry(0, 0.7)
+    reference.ry(1, 0.2)
+    reference.add_gates(
+        [
+            (r.op, r.q0, -1 if r.q1 is None else r.q1, r.param or 0.0)
+            for r in ansatz(np.zeros(3)).gate_records()
+        ]
+    )
+    assert model.predict([x])[0] == pytest.approx(reference.expectation(0), abs=1e-12)
+    with pytest.raises(ValueError):
+        model.predict([np.zeros(3)])
@@ -0,0 +1,35 @@
+"""State-preparation and conversion helpers in omniq.utils."""
+
+import numpy as np
+import pytest
+
+from omniq.utils import bloch_xyz, create_bell_state, create_ghz_state
+
+
+def test_bell_state():
+    expected = np.array([1, 0, 0, 1]) / np.sqrt(2)
+    np.testing.assert_allclose(create_bell_state().get_amplitudes(), expected)
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 6])
+def test_ghz_state(n):
+    expected = np.zeros(1 << n)
+    expected[[0, -1]] = 1 / np.sqrt(2)
+    np.testing.assert_allclose(create_ghz_state(n).get_amplitudes(), expected)
+
+
+def test_bloch_xyz_basis_states():
+    # |0>, |+> and |+i> as amplitudes (a, b); theta and phi follow from
+    # a = cos(theta/2), b = e^(i phi) sin(theta/2)
+    states = np.array([[1, 0], [1, 1], [1, 1j]])
+    states = states / np.linalg.norm(states, axis=1, keepdims=True)
+    theta = 2 * np.arccos(np.abs(states[:, 0]))
+    phi = np.angle(states[:, 1]) - np.angle(states[:, 0])
+    xyz = np.column_stack(bloch_xyz(theta, phi))
+    np.testing.assert_allclose(xyz, [[0, 0, 1], [1, 0, 0], [0, 1, 0]], atol=1e-12)
+
+
+def test_bloch_xyz_scalar():
+    x, y, z = bloch_xyz(np.pi / 2, 0.0)
+    assert (x.shape, y.shape, z.shape) == ((), (), ())
+    np.testing.assert_allclose([x, y, z], [1, 0, 0], atol=1e-12)
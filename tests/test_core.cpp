@@ -1,7 +1,23 @@
 #include "omniq/Circuit.h"
+#include "omniq/Grovers.h"
+#include "omniq/Noise/NoiseModel.h"
+#include "omniq/QEC/MWPMDecoder.h"
+#include "omniq/QEC/SurfaceCode.h"
+#include "omniq/QEC/UnionFindDecoder.h"
+#include "omniq/Simulators/CliffordSimulator.h"
 #include "omniq/Statevector.h"
 #include <gtest/gtest.h>
 
+#include <algorithm>
+#include <cmath>
+#include <memory>
+#include <random>
+#include <thread>
+#include <stdexcept>
+#include <vector>
+
+using omniq::simulators::CliffordSimulator;
+
 TEST(CoreTest, CircuitCreation) {
   omniq::Circuit circuit(2);
   EXPECT_EQ(circuit.getNumQubits(), 2);
@@ -12,3 +28,562 @@ TEST(CoreTest, StatevectorNormalization) {
   omniq::Statevector sv(2);
   EXPECT_NEAR(sv.getNorm(), 1.0, 1e-6);
 }
+
+namespace {
+
+// One Clifford gate: 0 H, 1 S, 2 CNOT, 3 X, 4 Y, 5 Z, 6 CZ, 7 Sdag
+struct CliffordOp {
+  int kind, a, b;
+};
+
+std::vector<CliffordOp> randomClifford(int n, int depth, std::mt19937 &gen) {
+  std::uniform_int_distribution<int> kind(0, 7), qubit(0, n - 1);
+  std::vector<CliffordOp> ops;
+  for (int i = 0; i < depth; ++i) {
+    int a = qubit(gen), b = qubit(gen);
+    while (b == a) {
+      b = qubit(gen);
+    }
+    ops.push_back({kind(gen), a, b});
+  }
+  return ops;
+}
+
+void applyClifford(CliffordSimulator &sim, const std::vector<CliffordOp> &ops) {
+  for (const CliffordOp &op : ops) {
+    switch (op.kind) {
+    case 0: sim.applyH(op.a); break;
+    case 1: sim.applyS(op.a); break;
+    case 2: sim.applyCNOT(op.a, op.b); break;
+    case 3: sim.applyX(op.a); break;
+    case 4: sim.applyY(op.a); break;
+    case 5: sim.applyZ(op.a); break;
+    case 6: sim.applyCZ(op.a, op.b); break;
+    default: sim.applySdag(op.a); break;
+    }
+  }
+}
+
+// Dense reference. Statevector single-qubit gates treat qubit 0 as the most
+// significant bit while applyCNOT takes raw bit positions, so CNOT operands
+// are mirrored and qubit q is bit n-1-q of the returned index
+Eigen::VectorXd denseProbabilities(int n, const std::vector<CliffordOp> &ops) {
+  omniq::Statevector sv(n);
+  auto bit = [n](int qubit) { return n - 1 - qubit; };
+  for (const CliffordOp &op : ops) {
+    switch (op.kind) {
+    case 0: sv.applyHadamard(op.a); break;
+    case 1: sv.applyPhaseShift(op.a, M_PI / 2); break;
+    case 2: sv.applyCNOT(bit(op.a), bit(op.b)); break;
+    case 3: sv.applyPauliX(op.a); break;
+    case 4: sv.applyPauliY(op.a); break;
+    case 5: sv.applyPauliZ(op.a); break;
+    case 6:
+      sv.applyHadamard(op.b);
+      sv.applyCNOT(bit(op.a), bit(op.b));
+      sv.applyHadamard(op.b);
+      break;
+    default: sv.applyPhaseShift(op.a, -M_PI / 2); break;
+    }
+  }
+  return sv.getStateVector().cwiseAbs2();
+}
+
+// Measures every qubit into an index in the dense reference bit order
+int measureAll(CliffordSimulator &sim) {
+  int outcome = 0;
+  for (int q = 0; q < sim.getNumQubits(); ++q) {
+    outcome |= sim.measure(q) << (sim.getNumQubits() - 1 - q);
+  }
+  return outcome;
+}
+
+} // namespace
+
+TEST(CliffordTest, DeterministicMeasurement) {
+  CliffordSimulator sim(3);
+  EXPECT_EQ(sim.measure(0), 0);
+  sim.applyX(1);
+  EXPECT_EQ(sim.measure(1), 1);
+  EXPECT_EQ(sim.measure(2), 0);
+  // H twice is the identity, and Y flips like X
+  sim.applyH(2);
+  sim.applyH(2);
+  sim.applyY(2);
+  EXPECT_EQ(sim.measure(2), 1);
+  // A repeated measurement returns the same outcome
+  EXPECT_EQ(sim.measure(1), 1);
+}
+
+TEST(CliffordTest, RandomMeasurementCollapses) {
+  int ones = 0;
+  const int trials = 2000;
+  for (int t = 0; t < trials; ++t) {
+    CliffordSimulator sim(2);
+    sim.applyH(0);
+    sim.applyCNOT(0, 1);
+    int first = sim.measure(0);
+    ones += first;
+    // The Bell partner is now determined, and so is a second look at qubit 0
+    EXPECT_EQ(sim.measure(1), first);
+    EXPECT_EQ(sim.measure(0), first);
+  }
+  EXPECT_NEAR(static_cast<double>(ones) / trials, 0.5, 0.05);
+}
+
+TEST(CliffordTest, PhaseAfterSHChains) {
+  // H S S H = H Z H = X
+  CliffordSimulator x(1);
+  x.applyH(0);
+  x.applyS(0);
+  x.applyS(0);
+  x.applyH(0);
+  EXPECT_EQ(x.measure(0), 1);
+
+  // S Sdag is the identity, so H S Sdag H leaves |0>
+  CliffordSimulator identity(1);
+  identity.applyH(0);
+  identity.applyS(0);
+  identity.applySdag(0);
+  identity.applyH(0);
+  EXPECT_EQ(identity.measure(0), 0);
+
+  CliffordSimulator chain(2);
+  chain.applyH(0);
+  chain.applyCNOT(0, 1);
+  chain.applyS(1);
+  chain.applyS(1);
+  chain.applyH(0);
+  chain.applyH(1);
+  // (Z on qubit 1) maps |Phi+> to |Phi->; H x H |Phi-> = |Psi+>
+  EXPECT_NE(chain.measure(0), chain.measure(1));
+
+  // Phases accumulated through a longer chain: (H S)^3 is a global phase
+  CliffordSimulator cycle(1);
+  for (int i = 0; i < 3; ++i) {
+    cycle.applyH(0);
+    cycle.applyS(0);
+  }
+  EXPECT_EQ(cycle.measure(0), 0);
+}
+
+TEST(CliffordTest, RandomCircuitsMatchDenseSimulator) {
+  std::mt19937 gen(12345);
+  const int n = 3;
+  const int shots = 400;
+  for (int circuit = 0; circuit < 30; ++circuit) {
+    std::vector<CliffordOp> ops = randomClifford(n, 25, gen);
+    Eigen::VectorXd expected = denseProbabilities(n, ops);
+    std::vector<int> counts(1 << n, 0);
+    for (int shot = 0; shot < shots; ++shot) {
+      CliffordSimulator sim(n);
+      applyClifford(sim, ops);
+      int outcome = measureAll(sim);
+      // Outcomes outside the support expose sign/phase errors in the tableau
+      ASSERT_GT(expected(outcome), 1e-9) << "circuit " << circuit;
+      ++counts[outcome];
+    }
+    // Stabilizer states are uniform over their support
+    for (int i = 0; i < (1 << n); ++i) {
+      EXPECT_NEAR(static_cast<double>(counts[i]) / shots, expected(i), 0.1)
+          << "circuit " << circuit << ", outcome " << i;
+    }
+  }
+}
+
+TEST(CliffordTest, WideTableauSpansSeveralWords) {
+  // 70 qubits puts rows in more than one uint64_t word
+  const int n = 70;
+  CliffordSimulator sim(n);
+  sim.applyH(0);
+  for (int q = 1; q < n; ++q) {
+    sim.applyCNOT(q - 1, q);
+  }
+  int first = sim.measure(0);
+  for (int q = 1; q < n; ++q) {
+    EXPECT_EQ(sim.measure(q), first);
+  }
+}
+
+namespace {
+
+// floor(pi/4 sqrt(N)) iterations for a single marked state
+int groverIterations(int n) {
+  return static_cast<int>(std::floor(M_PI / 4.0 * std::sqrt(double(1 << n))));
+}
+
+} // namespace
+
+TEST(GroverTest, MarkedStateDominatesAfterOptimalIterations) {
+  for (int n = 3; n <= 6; ++n) {
+    const int size = 1 << n;
+    for (int target : {0, size / 3, size - 1}) {
+      omniq::GroversAlgorithm grover(
+          n, omniq::grover_utils::create_database_oracle(target));
+      grover.set_iterations(groverIterations(n));
+      omniq::Statevector state = grover.execute();
+      EXPECT_NEAR(state.getNorm(), 1.0, 1e-9);
+      EXPECT_GT(std::norm(state.getStateVector()(target)), 0.9)
+          << "n = " << n << ", target = " << target;
+    }
+  }
+}
+
+TEST(GroverTest, MeasurementsConcentrateOnMarkedState) {
+  for (int n = 3; n <= 6; ++n) {
+    const int target = (1 << n) - 2;
+    omniq::GroversAlgorithm grover(
+        n, omniq::grover_utils::create_database_oracle(target));
+    grover.set_iterations(groverIterations(n));
+    const int shots = 2000;
+    std::vector<int> results = grover.execute_with_measurements(shots);
+    ASSERT_EQ(static_cast<int>(results.size()), shots);
+    int hits = 0;
+    for (int outcome : results) {
+      ASSERT_GE(outcome, 0);
+      ASSERT_LT(outcome, 1 << n);
+      hits += outcome == target;
+    }
+    EXPECT_GT(static_cast<double>(hits) / shots, 0.85) << "n = " << n;
+  }
+}
+
+TEST(GroverTest, ExecuteRejectsMismatchedInitialState) {
+  omniq::GroversAlgorithm grover(
+      3, omniq::grover_utils::create_database_oracle(5));
+  EXPECT_THROW(grover.execute(omniq::Statevector(4)), std::invalid_argument);
+}
+
+namespace {
+
+using omniq::qec::PauliOperator;
+
+// Syndrome of flipping the given data qubits with an X (or Z) error: the
+// Z (or X) stabilizers with odd overlap are violated, X-stabilizers first
+omniq::qec::Syndrome syndromeOf(const omniq::qec::SurfaceCode &code,
+                                const std::vector<int> &qubits, bool xError) {
+  const auto &xStabilizers = code.getXStabilizers();
+  const auto &zStabilizers = code.getZStabilizers();
+  omniq::qec::Syndrome syndrome(
+      static_cast<int>(xStabilizers.size() + zStabilizers.size()));
+  syndrome.setCodeDistance(code.getDistance());
+  const auto &detectors = xError ? zStabilizers : xStabilizers;
+  const int offset = xError ? static_cast<int>(xStabilizers.size()) : 0;
+  const PauliOperator check = xError ? PauliOperator::Z : PauliOperator::X;
+  for (size_t s = 0; s < detectors.size(); ++s) {
+    int overlap = 0;
+    for (int q : qubits) {
+      overlap += detectors[s].op.getPauli(q) == check;
+    }
+    if (overlap % 2) {
+      syndrome.setMeasurement(offset + static_cast<int>(s), -1);
+    }
+  }
+  return syndrome;
+}
+
+// Error and correction together as the set of qubits flipped an odd number
+// of times
+std::vector<int> combined(std::vector<int> error, std::vector<int> correction) {
+  std::sort(error.begin(), error.end());
+  std::sort(correction.begin(), correction.end());
+  std::vector<int> result;
+  std::set_symmetric_difference(error.begin(), error.end(), correction.begin(),
+                                correction.end(), std::back_inserter(result));
+  return result;
+}
+
+std::vector<std::unique_ptr<omniq::qec::Decoder>> decoders(int distance) {
+  std::vector<std::unique_ptr<omniq::qec::Decoder>> result;
+  result.push_back(std::make_unique<omniq::qec::MWPMDecoder>());
+  result.push_back(std::make_unique<omniq::qec::UnionFindDecoder>());
+  for (auto &decoder : result) {
+    decoder->setCodeDistance(distance);
+  }
+  return result;
+}
+
+} // namespace
+
+TEST(DecoderTest, EmptySyndromeNeedsNoCorrection) {
+  omniq::qec::SurfaceCode code(3);
+  for (auto &decoder : decoders(3)) {
+    EXPECT_TRUE(decoder->decode(syndromeOf(code, {}, true)).empty())
+        << decoder->getName();
+  }
+}
+
+TEST(DecoderTest, CentreErrorOnDistanceThreeIsCorrectedExactly) {
+  // The centre data qubit is the one both X (and both Z) plaquettes share
+  omniq::qec::SurfaceCode code(3);
+  for (bool xError : {true, false}) {
+    omniq::qec::Syndrome syndrome = syndromeOf(code, {4}, xError);
+    ASSERT_EQ(syndrome.countViolations(), 2);
+    for (auto &decoder : decoders(3)) {
+      EXPECT_EQ(decoder->decode(syndrome), std::vector<int>{4})
+          << decoder->getName() << (xError ? " X" : " Z");
+    }
+  }
+}
+
+TEST(DecoderTest, SingleErrorsAreCleared) {
+  for (int distance : {3, 5}) {
+    omniq::qec::SurfaceCode code(distance);
+    for (bool xError : {true, false}) {
+      for (int q = 0; q < code.getNumDataQubits(); ++q) {
+        omniq::qec::Syndrome syndrome = syndromeOf(code, {q}, xError);
+        for (auto &decoder : decoders(distance)) {
+          std::vector<int> correction = decoder->decode(syndrome);
+          // A single error needs at most a single-qubit correction
+          ASSERT_LE(correction.size(), 1u)
+              << decoder->getName() << ", d = " << distance << ", qubit " << q;
+          std::vector<int> residual = combined({q}, correction);
+          EXPECT_TRUE(syndromeOf(code, residual, xError).isAllZero())
+              << decoder->getName() << ", d = " << distance << ", qubit " << q;
+          if (syndrome.countViolations() == 2) {
+            EXPECT_EQ(correction, std::vector<int>{q});
+          }
+        }
+      }
+    }
+  }
+}
+
+TEST(DecoderTest, SeparatedErrorsAreCleared) {
+  // Two X errors far apart on distance 5, plus a Z error
+  omniq::qec::SurfaceCode code(5);
+  omniq::qec::Syndrome xSyndrome = syndromeOf(code, {6, 18}, true);
+  omniq::qec::Syndrome zSyndrome = syndromeOf(code, {12}, false);
+  omniq::qec::Syndrome syndrome(xSyndrome.size());
+  for (int s = 0; s < syndrome.size(); ++s) {
+    syndrome.setMeasurement(
+        s, xSyndrome.getMeasurement(s) * zSyndrome.getMeasurement(s));
+  }
+  for (auto &decoder : decoders(5)) {
+    std::vector<int> correction = decoder->decode(syndrome);
+    // Z flips come first, then X flips; here the only Z flip is qubit 12
+    ASSERT_FALSE(correction.empty());
+    EXPECT_EQ(correction.front(), 12) << decoder->getName();
+    std::vector<int> xCorrection(correction.begin() + 1, correction.end());
+    EXPECT_EQ(combined({6, 18}, xCorrection), std::vector<int>{})
+        << decoder->getName();
+  }
+}
+
+TEST(DecoderTest, RejectsSyndromeOfAnotherDistance) {
+  omniq::qec::SurfaceCode code(5);
+  for (auto &decoder : decoders(3)) {
+    EXPECT_THROW(decoder->decode(syndromeOf(code, {6}, true)),
+                 std::invalid_argument);
+  }
+}
+
+namespace {
+
+// A random single-qubit density matrix A A^dagger / tr(A A^dagger)
+omniq::DensityMatrix randomDensityMatrix(std::mt19937 &gen) {
+  std::normal_distribution<double> normal;
+  Eigen::Matrix2cd a;
+  for (int i = 0; i < 4; ++i) {
+    a(i / 2, i % 2) = {normal(gen), normal(gen)};
+  }
+  Eigen::MatrixXcd rho = a * a.adjoint();
+  return omniq::DensityMatrix(Eigen::MatrixXcd(rho / rho.trace()));
+}
+
+// The same noise as NoiseModel, applied channel by channel as Kraus sums
+void applyKrausNoise(omniq::DensityMatrix &rho,
+                     const omniq::noise::NoiseModel::HardwareParams &hw,
+                     double duration, double depolarizing) {
+  if (depolarizing > 0.0) {
+    omniq::noise::DepolarizingChannel(depolarizing).apply(rho, 0);
+  }
+  const double gamma = 1.0 - std::exp(-duration / hw.T1);
+  omniq::noise::AmplitudeDampingChannel(gamma).apply(rho, 0);
+  const double T2Star = 1.0 / (1.0 / hw.T2 - 1.0 / (2.0 * hw.T1));
+  omniq::noise::PhaseDampingChannel(1.0 - std::exp(-duration / T2Star))
+      .apply(rho, 0);
+}
+
+} // namespace
+
+TEST(NoiseModelTest, GateNoiseMatchesKrausSum) {
+  std::mt19937 gen(7);
+  omniq::noise::NoiseModel model = omniq::noise::NoiseModel::createNoisyModel();
+  const auto &hw = model.getHardwareParams();
+  const auto &fidelities = model.getGateFidelities();
+  for (int trial = 0; trial < 5; ++trial) {
+    omniq::DensityMatrix rho = randomDensityMatrix(gen);
+    omniq::DensityMatrix expected(rho);
+    model.applyGateNoise(rho, "H", {0});
+    applyKrausNoise(expected, hw, hw.singleQubitGateTime,
+                    4.0 / 3.0 * (1.0 - fidelities.singleQubit));
+    EXPECT_TRUE(rho.getDensityMatrix().isApprox(expected.getDensityMatrix(),
+                                                1e-12));
+
+    omniq::DensityMatrix rho2 = randomDensityMatrix(gen);
+    omniq::DensityMatrix expected2(rho2);
+    model.applyGateNoise(rho2, "CNOT", {0});
+    applyKrausNoise(expected2, hw, hw.twoQubitGateTime,
+                    4.0 / 3.0 * (1.0 - fidelities.twoQubit));
+    EXPECT_TRUE(rho2.getDensityMatrix().isApprox(expected2.getDensityMatrix(),
+                                                 1e-12));
+  }
+}
+
+TEST(NoiseModelTest, IdleNoiseMatchesKrausSum) {
+  std::mt19937 gen(11);
+  omniq::noise::NoiseModel model;
+  for (double idle : {1e-8, 3e-7, 2e-5}) {
+    omniq::DensityMatrix rho = randomDensityMatrix(gen);
+    omniq::DensityMatrix expected(rho);
+    model.applyIdleNoise(rho, 0, idle);
+    applyKrausNoise(expected, model.getHardwareParams(), idle, 0.0);
+    EXPECT_TRUE(
+        rho.getDensityMatrix().isApprox(expected.getDensityMatrix(), 1e-12))
+        << "idle " << idle;
+  }
+}
+
+TEST(NoiseModelTest, ParameterChangesRebuildGateNoise) {
+  omniq::noise::NoiseModel model;
+  omniq::noise::NoiseModel::GateFidelities fidelities;
+  fidelities.singleQubit = 0.9;
+  model.setGateFidelities(fidelities);
+  std::mt19937 gen(3);
+  omniq::DensityMatrix rho = randomDensityMatrix(gen);
+  omniq::DensityMatrix expected(rho);
+  model.applyGateNoise(rho, "X", {0});
+  const auto &hw = model.getHardwareParams();
+  applyKrausNoise(expected, hw, hw.singleQubitGateTime, 4.0 / 3.0 * 0.1);
+  EXPECT_TRUE(
+      rho.getDensityMatrix().isApprox(expected.getDensityMatrix(), 1e-12));
+}
+
+TEST(NoiseModelTest, SharedModelIsSafeAcrossThreads) {
+  const omniq::noise::NoiseModel model =
+      omniq::noise::NoiseModel::createTypicalModel();
+  std::mt19937 gen(5);
+  const omniq::DensityMatrix initial = randomDensityMatrix(gen);
+  omniq::DensityMatrix reference(initial);
+  for (int step = 0; step < 100; ++step) {
+    model.applyGateNoise(reference, step % 2 ? "CNOT" : "H", {0});
+    model.applyIdleNoise(reference, 0, 1e-8 * (step % 7 + 1));
+  }
+  std::vector<omniq::DensityMatrix> results(8, initial);
+  std::vector<std::thread> threads;
+  for (auto &rho : results) {
+    threads.emplace_back([&model, &rho] {
+      for (int step = 0; step < 100; ++step) {
+        model.applyGateNoise(rho, step % 2 ? "CNOT" : "H", {0});
+        model.applyIdleNoise(rho, 0, 1e-8 * (step % 7 + 1));
+      }
+    });
+  }
+  for (auto &thread : threads) {
+    thread.join();
+  }
+  for (const auto &rho : results) {
+    EXPECT_TRUE(rho.getDensityMatrix().isApprox(reference.getDensityMatrix(),
+                                                1e-14));
+  }
+}
+
+namespace {
+
+// Random circuit dominated by runs of single-qubit gates, so executeAll()
+// builds fusion windows; the two-qubit gates cut the windows
+void addRandomGates(omniq::Circuit &a, omniq::Circuit &b, int numGates,
+                    std::mt19937 &gen) {
+  using omniq::GateType;
+  const int n = a.getNumQubits();
+  const GateType single[] = {GateType::H,     GateType::X,  GateType::Y,
+                             GateType::Z,     GateType::RX, GateType::RY,
+                             GateType::PHASE, GateType::RZ};
+  const GateType pair[] = {GateType::CNOT, GateType::CP, GateType::SWAP};
+  std::uniform_int_distribution<int> qubit(0, n - 1);
+  std::uniform_int_distribution<int> pick(0, 7);
+  std::uniform_real_distribution<double> angle(0.0, 2.0 * M_PI);
+  for (int i = 0; i < numGates; ++i) {
+    const double theta = angle(gen);
+    if (pick(gen) == 0) {
+      const int control = qubit(gen);
+      int target = qubit(gen);
+      while (target == control) {
+        target = qubit(gen);
+      }
+      const GateType type = pair[pick(gen) % 3];
+      if (type == GateType::SWAP) {
+        a.addGate(type, std::vector<int>{control, target});
+        b.addGate(type, std::vector<int>{control, target});
+      } else {
+        a.addGate(type, control, target, theta);
+        b.addGate(type, control, target, theta);
+      }
+    } else {
+      const GateType type = single[pick(gen)];
+      const int target = qubit(gen);
+      a.addGate(type, target, theta);
+      b.addGate(type, target, theta);
+    }
+  }
+}
+
+void expectExecuteAllMatchesSteps(omniq::Circuit &fused,
+                                  omniq::Circuit &stepped) {
+  fused.executeAll();
+  while (stepped.executeStep()) {
+  }
+  EXPECT_EQ(fused.getCurrentStep(), stepped.getCurrentStep());
+  EXPECT_TRUE(
+      fused.getStateVector().isApprox(stepped.getStateVector(), 1e-12));
+}
+
+} // namespace
+
+TEST(CircuitTest, ExecuteAllMatchesExecuteStep) {
+  // 2^15 and 2^16 amplitudes span several 2^14 tiles, and their top qubits
+  // pair amplitudes across tiles; 2^10 fits in one
+  std::mt19937 gen(17);
+  for (int n : {10, 15, 16}) {
+    for (int trial = 0; trial < 3; ++trial) {
+      omniq::Circuit fused(n);
+      omniq::Circuit stepped(n);
+      addRandomGates(fused, stepped, 120, gen);
+      expectExecuteAllMatchesSteps(fused, stepped);
+    }
+  }
+}
+
+TEST(CircuitTest, ExecuteAllMixesTiledAndWideQubits) {
+  using omniq::GateType;
+  const int n = 16;
+  omniq::Circuit fused(n);
+  omniq::Circuit stepped(n);
+  for (omniq::Circuit *c : {&fused, &stepped}) {
+    for (int q = 0; q < n; ++q) {
+      c->addGate(GateType::H, q);
+    }
+    // One window: qubits 13-15 pair across tiles, the rest within a tile
+    c->addGate(GateType::RX, 15, 0.3);
+    c->addGate(GateType::RY, 0, 1.1);
+    c->addGate(GateType::PHASE, 13, 0.7);
+    c->addGate(GateType::RZ, 12, 2.0);
+    c->addGate(GateType::Y, 14);
+    c->addGate(GateType::CNOT, 15, 0);
+    c->addGate(GateType::RX, 0, 0.4);
+    c->addGate(GateType::RY, 15, 0.9);
+  }
+  expectExecuteAllMatchesSteps(fused, stepped);
+}
+
+TEST(CircuitTest, ExecuteAllResumesAfterExecuteStep) {
+  std::mt19937 gen(3);
+  omniq::Circuit fused(15);
+  omniq::Circuit stepped(15);
+  addRandomGates(fused, stepped, 60, gen);
+  for (int i = 0; i < 7; ++i) {
+    fused.executeStep();
+  }
+  expectExecuteAllMatchesSteps(fused, stepped);
+}